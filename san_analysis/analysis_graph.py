@@ -0,0 +1,371 @@
+"""Module to run analysis functions of the san_analysis package as a task graph.
+Each task is an analysis function with the io_data_names name (nodes) and
+in-memory data names it consumes and produces (edges).
+Fingerprints are calculated for data in the form it's saved to database.
+Tasks with unchanged inputs whose outputs are saved in database are not run and
+their outputs are loaded from database only when consumer task requests them.
+Tasks with changed inputs are run with the force flags defined by user (recomputed or loaded from database).
+Independent non-interactive tasks are run in threads if 'analysis_workers' parameter is defined"""
+
+
+import datetime
+import hashlib
+import io
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+import utilities.database_operations as dbop
+import utilities.dataframe_operations as dfop
+import utilities.module_execution as meop
+
+# fingerprints file format version. files with other version are ignored
+FINGERPRINTS_VERSION = 2
+
+
+def analysis_task(io_name, function, input_keys, output_keys, db_outputs=None, interactive=False, constants_output=None):
+    """Function returns analysis task description.
+    io_name is the analysis name in the in_out_data_names tab of report_info.xlsx ({io_name}_out, {io_name}_in columns).
+    function is called with input_keys data and project_constants_lst and returns output_keys data.
+    db_outputs are positions of the output_keys data in the {io_name}_out data names
+    if function returns data saved in database without changes (task outputs can be loaded lazily).
+    interactive task requests user input and runs in the main thread only.
+    constants_output is output key added to project_constants_lst (report_columns_usage_sr)"""
+
+    return {'io_name': io_name, 'function': function, 'inputs': list(input_keys), 'outputs': list(output_keys),
+            'db_outputs': db_outputs, 'interactive': interactive, 'constants_output': constants_output}
+
+
+def run_analysis_graph(task_lst, initial_data_dct, project_constants_lst, result_keys):
+    """Function runs analysis tasks of the task_lst declared in topological order.
+    initial_data_dct contains data required for analysis (extracted configuration data).
+    Returns list of result_keys data"""
+
+    project_steps_df, max_title, io_data_names_df, report_requisites_sr, *_ = project_constants_lst
+
+    verify_analysis_graph(task_lst, initial_data_dct)
+    graph_state = {'tasks': task_lst,
+                    'data': dict(initial_data_dct), 'lazy_data': {}, 'lazy_lock': threading.Lock(),
+                    'fingerprints': {}, 'project_constants_lst': project_constants_lst}
+    for task in task_lst:
+        task['data_names'], task['analyzed_data_names'] = \
+            dfop.list_from_dataframe(io_data_names_df, task['io_name'] + '_out', task['io_name'] + '_in')
+    # data names produced by the analysis tasks. force flags of these data are verified with fingerprints
+    graph_state['analyzed_names'] = {data_name for task in task_lst for data_name in task['data_names']}
+
+    # fingerprints of the initial data are calculated before any task changes them
+    consumed_keys = {key for task in task_lst for key in task['inputs']}
+    for key in consumed_keys.intersection(initial_data_dct):
+        graph_state['fingerprints'][key] = data_fingerprint(initial_data_dct[key])
+    fingerprints_filepath = fingerprints_file(report_requisites_sr)
+    graph_state['records'] = load_fingerprints(fingerprints_filepath)
+
+    workers_num = meop.workers_number(report_requisites_sr, 'analysis_workers')
+    if workers_num == 1:
+        for task in task_lst:
+            finish_task(graph_state, task, start_task(graph_state, task, threaded=False))
+    else:
+        parallel_graph_run(graph_state, workers_num)
+
+    save_fingerprints(fingerprints_filepath, graph_state['records'], max_title)
+    return [graph_data(graph_state, key) for key in result_keys]
+
+
+def verify_analysis_graph(task_lst, initial_data_dct):
+    """Function verifies that each input of the task is initial data or
+    is produced by the task declared before and each data produced once"""
+
+    # producer task of each data {data_key: io_name}
+    producers_dct = {}
+    for task in task_lst:
+        missing_keys = [key for key in task['inputs'] if not key in initial_data_dct and not key in producers_dct]
+        duplicated_keys = [key for key in task['outputs'] if key in initial_data_dct or key in producers_dct]
+        if missing_keys or duplicated_keys:
+            print(f"\nERROR. {task['io_name']} task inputs {', '.join(missing_keys)} are not produced before the task "
+                    f"or outputs {', '.join(duplicated_keys)} are already produced")
+            sys.exit()
+        for key in task['outputs']:
+            producers_dct[key] = task['io_name']
+
+
+def parallel_graph_run(graph_state, workers_num):
+    """Function runs tasks which inputs are ready in worker threads. Interactive tasks are run
+    in the main thread when no other task is running. Output of the threaded tasks is shown in
+    the order of task completion"""
+
+    pending_tasks = list(graph_state['tasks'])
+    done_keys = set(graph_state['data'])
+    running_dct = {}
+    thread_output = ThreadOutput(sys.stdout)
+    sys.stdout = thread_output
+    try:
+        with ThreadPoolExecutor(max_workers=workers_num) as executor:
+            while pending_tasks or running_dct:
+                ready_tasks = [task for task in pending_tasks if done_keys.issuperset(task['inputs'])]
+                for task in ready_tasks:
+                    if len(running_dct) >= workers_num:
+                        break
+                    if task['interactive']:
+                        # user input is requested when no other task is running
+                        if running_dct:
+                            break
+                        pending_tasks.remove(task)
+                        finish_task(graph_state, task, start_task(graph_state, task, threaded=False))
+                        done_keys.update(task['outputs'])
+                        break
+                    pending_tasks.remove(task)
+                    running_dct[executor.submit(threaded_task, thread_output, graph_state, task)] = task
+                if not running_dct:
+                    continue
+                done_futures, _ = wait(running_dct, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task = running_dct.pop(future)
+                    output, task_result, error = future.result()
+                    thread_output.stream.write(output)
+                    if error is not None:
+                        raise error
+                    finish_task(graph_state, task, task_result)
+                    done_keys.update(task['outputs'])
+    finally:
+        sys.stdout = thread_output.stream
+
+
+def threaded_task(thread_output, graph_state, task):
+    """Function runs task in worker thread. Task output is collected to the buffer.
+    Returns task output, task result and exception raised by the task"""
+
+    thread_output.local.buffer = io.StringIO()
+    task_result, error = None, None
+    try:
+        task_result = start_task(graph_state, task, threaded=True)
+    except BaseException as e:
+        # SystemExit is raised again in the main thread
+        error = e
+    output = thread_output.local.buffer.getvalue()
+    thread_output.local.buffer = None
+    return output, task_result, error
+
+
+def start_task(graph_state, task, threaded):
+    """Function runs task function or skips it if inputs are not changed and outputs
+    can be loaded from database. Returns input fingerprints, output data and output fingerprints.
+    Threaded tasks get shallow copies of the input DataFrames to keep shared inputs unchanged"""
+
+    project_constants_lst = graph_state['project_constants_lst']
+    project_steps_df, max_title, *_ = project_constants_lst
+    input_fingerprints = [graph_state['fingerprints'].get(key) for key in task['inputs']]
+    task_record = graph_state['records'].get(task['io_name'])
+    # task with changed inputs or unknown task (no record) is verified by analysis function only
+    inputs_unchanged = task_record is not None and task_record['inputs'] == input_fingerprints
+
+    task_steps_df = task_project_steps(graph_state, task, inputs_unchanged)
+    if inputs_unchanged and skip_allowed(project_constants_lst, task, task_steps_df):
+        meop.show_module_info(project_steps_df, task['data_names'])
+        info = 'Input data not changed. Data loaded on request'
+        print(info, end =" ")
+        meop.status_info('skip', max_title, len(info))
+        return {'skipped': True, 'inputs': input_fingerprints}
+
+    input_lst = [graph_data(graph_state, key) for key in task['inputs']]
+    if threaded:
+        input_lst = [data.copy(deep=False) if isinstance(data, (pd.DataFrame, pd.Series)) else data for data in input_lst]
+    task_constants_lst = [task_steps_df, *project_constants_lst[1:]]
+    output_lst = task['function'](*input_lst, task_constants_lst)
+    if len(task['outputs']) == 1:
+        output_lst = [output_lst]
+    output_fingerprints = {key: data_fingerprint(data) for key, data in zip(task['outputs'], output_lst)}
+    return {'skipped': False, 'inputs': input_fingerprints,
+            'outputs': dict(zip(task['outputs'], output_lst)), 'output_fingerprints': output_fingerprints}
+
+
+def finish_task(graph_state, task, task_result):
+    """Function adds task outputs (or lazy outputs of the skipped task)
+    and output fingerprints to the graph state and updates task record"""
+
+    if task_result['skipped']:
+        task_record = graph_state['records'][task['io_name']]
+        for key, data_position in zip(task['outputs'], task['db_outputs']):
+            graph_state['lazy_data'][key] = task['data_names'][data_position]
+        graph_state['fingerprints'].update(task_record['outputs'])
+        return
+    graph_state['data'].update(task_result['outputs'])
+    graph_state['fingerprints'].update(task_result['output_fingerprints'])
+    graph_state['records'][task['io_name']] = {'inputs': task_result['inputs'],
+                                                'outputs': task_result['output_fingerprints']}
+    if task['constants_output'] and len(graph_state['project_constants_lst']) == 5:
+        graph_state['project_constants_lst'].append(task_result['outputs'][task['constants_output']])
+
+
+def task_project_steps(graph_state, task, inputs_unchanged):
+    """Function returns copy of project_steps_df with force flags of the task.
+    If task inputs are not changed then force flags of the analyzed data produced by other tasks 
+    are dropped (data was recomputed with the same result). Otherwise force flags are not changed"""
+
+    task_steps_df = graph_state['project_constants_lst'][0].copy()
+    if inputs_unchanged:
+        analyzed_names = [data_name for data_name in task['analyzed_data_names']
+                            if data_name in graph_state['analyzed_names'] and not data_name in task['data_names']]
+        task_steps_df.loc[task_steps_df.index.intersection(analyzed_names), 'force_run'] = 0
+    return task_steps_df
+
+
+def skip_allowed(project_constants_lst, task, task_steps_df):
+    """Function verifies if task can be skipped. Task outputs are the data saved in database,
+    task outputs and inputs are not forced, outputs are not exported to excel and all outputs exist in database"""
+
+    if task['db_outputs'] is None:
+        return False
+    data_names = task['data_names'] + task['analyzed_data_names']
+    if task_steps_df['force_run'].reindex(data_names).fillna(0).any():
+        return False
+    if task_steps_df['export_to_excel'].reindex(task['data_names']).fillna(0).any():
+        return False
+    return all(dbop.database_contains(project_constants_lst, data_name) for data_name in task['data_names'])
+
+
+def graph_data(graph_state, key):
+    """Function returns data of the key. Output of the skipped task is loaded from database once"""
+
+    with graph_state['lazy_lock']:
+        if key in graph_state['lazy_data']:
+            _, max_title, *_ = graph_state['project_constants_lst']
+            data_name = graph_state['lazy_data'].pop(key)
+            data_lst = dbop.read_database(graph_state['project_constants_lst'], data_name)
+            graph_state['data'][key], = dbop.verify_read_data(max_title, [data_name], *data_lst)
+    return graph_state['data'][key]
+
+
+def data_fingerprint(data):
+    """Function returns sha1 hash of the DataFrame or Series in the form it's read back from the SQLite database
+    (column names and values of the sql table). Data calculated by the task and the same data loaded 
+    from the database by the task have the same fingerprint"""
+
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        return hashlib.sha1(repr(data).encode('utf-8')).hexdigest()
+    # index is saved to the database for the Series and MultiIndex DataFrame only
+    if isinstance(data, pd.Series):
+        data = data.rename_axis(data.index.name or 'index').reset_index()
+    elif isinstance(data.index, pd.MultiIndex):
+        data = data.reset_index()
+    columns = [str(column) for column in data.columns]
+    # empty data is read from the database as DataFrame without rows
+    if data.empty:
+        return hashlib.sha1(repr(columns or ['EMPTY']).encode('utf-8')).hexdigest()
+    sha1 = hashlib.sha1(repr(columns).encode('utf-8'))
+    for _, column_sr in data.items():
+        sha1.update(pd.util.hash_array(sql_values(column_sr)).tobytes())
+    return sha1.hexdigest()
+
+
+def sql_values(column_sr):
+    """Function returns column values as they are read from the SQLite database.
+    Numbers (integer, float, boolean and timedelta columns) are returned as float, 
+    other values as strings and empty values as nan"""
+
+    mask_na = column_sr.isna().to_numpy()
+    if mask_na.all():
+        return np.full(len(column_sr), np.nan, dtype='object')
+    # sql column type is defined by the column values type as in DataFrame.to_sql
+    column_type = pd.api.types.infer_dtype(column_sr, skipna=True)
+    if column_sr.dtype.kind == 'm' or column_type in ['integer', 'floating', 'boolean']:
+        if column_sr.dtype.kind == 'm':
+            # timedelta is saved as number of nanoseconds
+            values = column_sr.astype('timedelta64[ns]').to_numpy().view('int64').astype('float64')
+        else:
+            values = column_sr.astype('float64').to_numpy(copy=True)
+        # nan bits (sign) and negative zero are not kept by the database
+        values[mask_na] = np.nan
+        return values + 0.0
+    if column_type == 'string':
+        values = column_sr.to_numpy(dtype='object', copy=True)
+    else:
+        values = column_sr.map(sql_text, na_action='ignore').to_numpy(dtype='object', copy=True)
+    values[mask_na] = np.nan
+    return values
+
+
+def sql_text(value):
+    """Function returns value as it's saved to the text column of the SQLite database"""
+
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_, int, np.integer)):
+        return str(int(value))
+    if isinstance(value, (float, np.floating)):
+        # sqlite converts real numbers to text with 15 significant digits and decimal point
+        text = f'{value:.15g}'
+        if not any(symbol in text for symbol in '.en'):
+            text = text + '.0'
+        return text
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(' ')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def fingerprints_file(report_requisites_sr):
+    """Function returns path to the file with analysis task fingerprints in the database folder"""
+
+    database_folder = report_requisites_sr.get('database_folder')
+    if database_folder and os.path.isdir(database_folder):
+        return os.path.join(database_folder, report_requisites_sr['customer_name'] + '_analysis_fingerprints.pickle')
+
+
+def load_fingerprints(filepath):
+    """Function returns task records saved on previous program execution
+    {io_name: {'inputs': input fingerprints, 'outputs': {data_key: fingerprint}}}"""
+
+    if filepath is None or not os.path.isfile(filepath):
+        return {}
+    try:
+        with open(filepath, 'rb') as file:
+            fingerprints_dct = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return {}
+    if not isinstance(fingerprints_dct, dict) or fingerprints_dct.get('version') != FINGERPRINTS_VERSION:
+        return {}
+    return fingerprints_dct['records']
+
+
+def save_fingerprints(filepath, records_dct, max_title):
+    """Function to save task records to the fingerprints file"""
+
+    if filepath is None:
+        return
+    # records are written to temporary file first to avoid broken file if program is interrupted
+    tmp_filepath = filepath + '.tmp'
+    try:
+        with open(tmp_filepath, 'wb') as file:
+            pickle.dump({'version': FINGERPRINTS_VERSION, 'records': records_dct}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+    except OSError:
+        info = f"Saving {os.path.basename(filepath)} file"
+        print(info, end =" ")
+        meop.status_info('fail', max_title, len(info))
+
+
+class ThreadOutput:
+    """Standard output which collects output of the worker threads to the thread buffers.
+    Output of the main thread is written to the stream"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
@@ -10,8 +10,10 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 
+@prof.profile_step('analysis')
 def blade_system_analysis(blade_module_df, synergy_module_df, project_constants_lst):
     """Main function to add connected devices information to portshow DataFrame"""
     
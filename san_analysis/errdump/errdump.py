@@ -7,17 +7,20 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .errdump_aggregation import errdump_aggregated
 from .errdump_statistics import errdump_statistics
+from .raslog_rollup import load_raslog_rollups, raslog_rollup_file, save_raslog_rollups
 
 
+@prof.profile_step('analysis')
 def errdump_analysis(errdump_df, switchshow_df, switch_params_aggregated_df, 
                 portshow_aggregated_df, project_constants_lst):
     """Main function to get most frequently appeared log messages"""
     
     # imported project constants required for module execution
-    project_steps_df, max_title, io_data_names_df, _, report_headers_df, report_columns_usage_sr, *_ = project_constants_lst
+    project_steps_df, max_title, io_data_names_df, report_requisites_sr, report_headers_df, report_columns_usage_sr, *_ = project_constants_lst
 
     # data titles obtained after module execution (output data)
     # data titles which module is dependent on (input data)
@@ -44,8 +47,13 @@ def errdump_analysis(errdump_df, switchshow_df, switch_params_aggregated_df,
         # get aggregated DataFrames
         errdump_aggregated_df = errdump_aggregated(errdump_df, switchshow_df, switch_params_aggregated_df, 
                                                     portshow_aggregated_df, pattern_dct)
+        # monthly message counters saved on previous program execution
+        rollup_filepath = raslog_rollup_file(report_requisites_sr)
+        rollup_dct = load_raslog_rollups(rollup_filepath)
         # count how many times event appears during one month for the last six months 
-        raslog_counter_df, raslog_frequent_df = errdump_statistics(errdump_aggregated_df, raslog_message_details_df, raslog_message_id_details_df)
+        raslog_counter_df, raslog_frequent_df = errdump_statistics(errdump_aggregated_df, raslog_message_details_df, 
+                                                                    raslog_message_id_details_df, rollup_dct)
+        save_raslog_rollups(rollup_filepath, rollup_dct, max_title)
         # after finish display status
         meop.status_info('ok', max_title, len(info))      
         # partition aggregated DataFrame to required tables
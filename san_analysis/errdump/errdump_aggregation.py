@@ -1,8 +1,6 @@
 """Module to label errdump, extract information from error messages and
 verify match with portshow DataFrame"""
 
-import warnings
-
 import numpy as np
 import pandas as pd
 
@@ -118,17 +116,19 @@ def message_extract(errdump_aggregated_df, pattern_dct):
     extract_columns_lst = dsop.remove_diplicates_from_list(extract_columns_lst)
     dfop.column_to_object(errdump_aggregated_df, *extract_columns_lst)
     
+    # each unique message is parsed once (raslog messages are highly repetitive)
+    message_codes, messages = pd.factorize(errdump_aggregated_df['Message'])
+    message_values_lst = [message_values(message, extract_pattern_columns_lst, pattern_dct) for message in messages]
+    message_mask = message_codes >= 0
     # extract corresponding values if regex pattern applicable
-    for pattern, extracted_columns in extract_pattern_columns_lst:
-        # pattern contains groups but str.cotains used to identify mask
-        # supress warning message
-        warnings.filterwarnings("ignore", 'This pattern is interpreted as a regular expression, and has match groups.')
-        mask = errdump_aggregated_df['Message'].str.contains(pattern, regex=True)
-        errdump_aggregated_df.loc[mask, extracted_columns] = errdump_aggregated_df.loc[mask, 'Message'].str.extract(pattern).values
-    
-    # sec_violation_unauthorized_host contains tcp port number and need to be removed
-    mask_unauthorized_host = errdump_aggregated_df['Message'].str.contains(pattern_dct['sec_violation_unauthorized_host'], na=False)
-    errdump_aggregated_df.loc[mask_unauthorized_host, ['Message_portType', 'port']] = pd.Series([np.nan, np.nan])
+    for column in extract_columns_lst:
+        extracted_messages = np.array([column in values_dct for values_dct in message_values_lst], dtype=bool)
+        if not extracted_messages.any():
+            continue
+        extracted_values = np.array([values_dct.get(column) for values_dct in message_values_lst], dtype=object)
+        mask = message_mask.copy()
+        mask[message_mask] = extracted_messages[message_codes[message_mask]]
+        errdump_aggregated_df.loc[mask, column] = extracted_values[message_codes[mask]]
 
     # add empty columns if they were not extracted
     extracted_columns = [column for _, columns in extract_pattern_columns_lst for column in columns]
@@ -151,6 +151,23 @@ def message_extract(errdump_aggregated_df, pattern_dct):
     errdump_aggregated_df.loc[mask_condition_na & ~mask_ignored_message, 'Condition'] = \
         errdump_aggregated_df.loc[mask_condition_na & ~mask_ignored_message, 'Condition'].fillna(errdump_aggregated_df['Message'])
     return errdump_aggregated_df
+
+
+def message_values(message, extract_pattern_columns_lst, pattern_dct):
+    """Function returns dictionary with values extracted from the message by each applicable regex pattern.
+    Patterns are applied in the extract_pattern_columns_lst order
+    (values of the next applicable pattern replace values of the previous one)"""
+
+    values_dct = {}
+    for pattern, extracted_columns in extract_pattern_columns_lst:
+        match = pattern.search(message)
+        if match:
+            values_dct.update((column, np.nan if value is None else value)
+                                for column, value in zip(extracted_columns, match.groups()))
+    # sec_violation_unauthorized_host contains tcp port number and need to be removed
+    if pattern_dct['sec_violation_unauthorized_host'].search(message):
+        values_dct.update({'Message_portType': np.nan, 'port': np.nan})
+    return values_dct
     
 
 def errdump_portshow(errdump_aggregated_df, portshow_aggregated_df):
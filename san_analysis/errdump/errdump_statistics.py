@@ -6,10 +6,14 @@ import pandas as pd
 import utilities.dataframe_operations as dfop
 from san_automation_constants import RASLOG_PERIOD, RASLOG_REPEATER_THRESHOLD
 
+from . import raslog_rollup as rollup
 
-def errdump_statistics(errdump_aggregated_df, raslog_message_details_df, raslog_message_id_details_df):
+
+def errdump_statistics(errdump_aggregated_df, raslog_message_details_df, raslog_message_id_details_df, rollup_dct=None):
     """Function to count how many times log message appears during one month for the last six months.
-    Log messages that appear less than 3 times a month are droppped"""
+    Log messages that appear less than 3 times a month are droppped.
+    If rollup_dct is passed then messages counted in the monthly rollups on previous program execution
+    are not counted again and rollup_dct is updated with the current counters"""
     
     # construct columns names for Source and Destination devices
     sid_did_base = ['switchName' , 'Index_slot_port', 'portState', 'portType', 'speed', 
@@ -22,14 +26,27 @@ def errdump_statistics(errdump_aggregated_df, raslog_message_details_df, raslog_
     message_quantity_columns = ['Message_occured_quantity_unique', 'Message_occured_quantity_multiple']
 
     # filter out log messages older than RASLOG_PERIOD and 'ignore' tag messages
-    errdump_filtered_df = errdump_filter(errdump_aggregated_df)
-    # joind devices for the same message_id and behind the same port
-    errdump_filtered_df = join_message_devices(errdump_filtered_df, connected_device_columns, sid_did_device_columns)
-    # add extracted message repeater values for the message id
-    errdump_filtered_df = add_message_repeater(errdump_filtered_df, errdump_aggregated_df, message_quantity_columns)
-    # count message appearance for the same device for each month durng RASLOG_PERIOD
-    raslog_counter_df = count_month_message_occurrence(errdump_filtered_df, connected_device_columns, 
-                                                    sid_did_device_columns, message_quantity_columns)
+    errdump_period_df = errdump_filter(errdump_aggregated_df)
+    # messages counted in the rollups are not processed
+    if rollup_dct is not None:
+        errdump_filtered_df, raslog_rollup_df = rollup.rollup_split(errdump_period_df, rollup_dct)
+    else:
+        errdump_filtered_df, raslog_rollup_df = errdump_period_df, None
+
+    if errdump_filtered_df.empty and raslog_rollup_df is not None:
+        raslog_counter_df = None
+    else:
+        # joind devices for the same message_id and behind the same port
+        errdump_filtered_df = join_message_devices(errdump_filtered_df, connected_device_columns, sid_did_device_columns)
+        # add extracted message repeater values for the message id
+        errdump_filtered_df = add_message_repeater(errdump_filtered_df, errdump_aggregated_df, message_quantity_columns)
+        # count message appearance for the same device for each month durng RASLOG_PERIOD
+        raslog_counter_df = count_month_message_occurrence(errdump_filtered_df, connected_device_columns, 
+                                                        sid_did_device_columns, message_quantity_columns)
+    if rollup_dct is not None:
+        # add month counters of the rolled up messages and save current counters to the rollups
+        raslog_counter_df = rollup.rollup_merge(raslog_counter_df, raslog_rollup_df, message_quantity_columns)
+        rollup.update_raslog_rollups(rollup_dct, errdump_period_df, raslog_counter_df)
     # sort raslog message occurrance by month and occurrance quantity
     raslog_counter_df = sort_raslog_counter(raslog_counter_df)
     # add message details and recommended actions based on message condition
@@ -0,0 +1,156 @@
+"""Module to persist monthly raslog message counters (rollups) of each switch between program executions.
+Rollups are saved to the database folder. If configuration of the switch is collected later than
+the configuration the rollups were counted for then only messages logged after the last rolled up message
+are counted again. Counters of the months within RASLOG_PERIOD (except the first partial month)
+are taken from the rollups thus overlapping log history of the repeated collections is not processed twice"""
+
+
+import os
+import pickle
+
+import pandas as pd
+
+import utilities.module_execution as meop
+from san_automation_constants import RASLOG_PERIOD
+
+# rollups file format version. files with other version are ignored
+RASLOG_ROLLUP_VERSION = 1
+# switch columns of the rollup counters replaced with values of the current configuration
+ROLLUP_SWITCH_COLUMNS = ['configname', 'chassis_name', 'chassis_wwn', 'switchName',
+                            'Fabric_name', 'Fabric_label', 'config_collection_date']
+
+
+def raslog_rollup_file(report_requisites_sr):
+    """Function returns path to the file with raslog rollups in the database folder"""
+
+    database_folder = report_requisites_sr.get('database_folder')
+    if database_folder and os.path.isdir(database_folder):
+        return os.path.join(database_folder, report_requisites_sr['customer_name'] + '_raslog_rollups.pickle')
+
+
+def load_raslog_rollups(filepath):
+    """Function returns raslog rollups saved on previous program execution
+    {'switches': {switchWwn: {'last_message_date', 'config_collection_date'}}, 'counter_df': monthly counters}"""
+
+    rollup_dct = {'switches': {}, 'counter_df': None}
+    if filepath is None or not os.path.isfile(filepath):
+        return rollup_dct
+    try:
+        with open(filepath, 'rb') as file:
+            saved_rollup_dct = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return rollup_dct
+    if not isinstance(saved_rollup_dct, dict) or saved_rollup_dct.get('version') != RASLOG_ROLLUP_VERSION:
+        return rollup_dct
+    rollup_dct.update(switches=saved_rollup_dct['switches'], counter_df=saved_rollup_dct['counter_df'])
+    return rollup_dct
+
+
+def save_raslog_rollups(filepath, rollup_dct, max_title):
+    """Function to save raslog rollups to the rollups file"""
+
+    if filepath is None or rollup_dct['counter_df'] is None:
+        return
+    # rollups are written to temporary file first to avoid broken file if program is interrupted
+    tmp_filepath = filepath + '.tmp'
+    try:
+        with open(tmp_filepath, 'wb') as file:
+            pickle.dump({'version': RASLOG_ROLLUP_VERSION, **rollup_dct}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+    except OSError:
+        info = f"Saving {os.path.basename(filepath)} file"
+        print(info, end =" ")
+        meop.status_info('fail', max_title, len(info))
+
+
+def rollup_switches(errdump_filtered_df, rollup_dct):
+    """Function returns DataFrame with switchWwn of the switches which configuration is collected
+    later than rollups configuration, current switch values, last rolled up message date and
+    first month of the RASLOG_PERIOD (month counters are taken from the rollups after that month)"""
+
+    switch_columns = ['switchWwn', *ROLLUP_SWITCH_COLUMNS]
+    switch_df = errdump_filtered_df.loc[errdump_filtered_df['switchWwn'].notna(), switch_columns].copy()
+    switch_df.drop_duplicates(subset=['switchWwn'], inplace=True)
+    for column, rollup_column in [('last_message_date', 'last_message_date'), 
+                                    ('rollup_collection_date', 'config_collection_date')]:
+        switch_df[column] = pd.to_datetime(switch_df['switchWwn'].map(
+            {switch_wwn: switch_rollup[rollup_column] for switch_wwn, switch_rollup in rollup_dct['switches'].items()}))
+    mask_later_collection = switch_df['config_collection_date'] > switch_df['rollup_collection_date']
+    switch_df = switch_df.loc[mask_later_collection].copy()
+    switch_df['period_start_month'] = \
+        (switch_df['config_collection_date'] - pd.DateOffset(months=RASLOG_PERIOD)).dt.to_period('M')
+    return switch_df
+
+
+def rollup_split(errdump_filtered_df, rollup_dct):
+    """Function returns messages which are not counted in the rollups and
+    rollup counters of the months within RASLOG_PERIOD (switch values are replaced with current values).
+    Messages of the first (partial) month of the RASLOG_PERIOD are always counted again"""
+
+    if not rollup_dct['switches'] or rollup_dct['counter_df'] is None:
+        return errdump_filtered_df, None
+    switch_df = rollup_switches(errdump_filtered_df, rollup_dct)
+    if switch_df.empty:
+        return errdump_filtered_df, None
+
+    # messages logged before the last rolled up message of the switch are counted in the rollups
+    switch_rollup_df = switch_df.set_index('switchWwn')
+    last_message_date_sr = errdump_filtered_df['switchWwn'].map(switch_rollup_df['last_message_date'])
+    period_start_month_sr = errdump_filtered_df['switchWwn'].map(switch_rollup_df['period_start_month'])
+    mask_rolled_up = errdump_filtered_df['Message_date'] <= last_message_date_sr
+    mask_period_start_month = errdump_filtered_df['Message_date'].dt.to_period('M') == period_start_month_sr
+    errdump_new_df = errdump_filtered_df.loc[~mask_rolled_up | mask_period_start_month].copy()
+
+    # rollup counters of the months after the first month of the RASLOG_PERIOD
+    raslog_rollup_df = rollup_dct['counter_df'].merge(switch_df[['switchWwn', 'period_start_month']], how='inner', on='switchWwn')
+    mask_period = raslog_rollup_df['Message_date'].dt.to_period('M') > raslog_rollup_df['period_start_month']
+    raslog_rollup_df = raslog_rollup_df.loc[mask_period].drop(columns=[*ROLLUP_SWITCH_COLUMNS, 'period_start_month'])
+    # rollup counters are shown with the current switch values
+    switch_values_df = switch_df[['switchWwn', *ROLLUP_SWITCH_COLUMNS]].fillna('na_cell')
+    raslog_rollup_df = raslog_rollup_df.merge(switch_values_df, how='left', on='switchWwn')
+    raslog_rollup_df = raslog_rollup_df.reindex(columns=rollup_dct['counter_df'].columns)
+    return errdump_new_df, raslog_rollup_df
+
+
+def rollup_merge(raslog_counter_df, raslog_rollup_df, message_quantity_columns):
+    """Function to add rollup counters to the counters of the messages which are not rolled up.
+    Counters of the same month and message are summed"""
+
+    if raslog_rollup_df is None or raslog_rollup_df.empty:
+        return raslog_counter_df
+    if raslog_counter_df is None or raslog_counter_df.empty:
+        raslog_counter_df = raslog_rollup_df
+    else:
+        raslog_counter_df = pd.concat([raslog_counter_df, raslog_rollup_df], ignore_index=True)
+    grp_columns = [column for column in raslog_counter_df.columns if not column in message_quantity_columns]
+    raslog_counter_df = raslog_counter_df.groupby(by=grp_columns)[message_quantity_columns].sum()
+    raslog_counter_df.reset_index(inplace=True)
+    return raslog_counter_df
+
+
+def update_raslog_rollups(rollup_dct, errdump_filtered_df, raslog_counter_df):
+    """Function to replace rollups of the switches with the current month counters.
+    Rollups of the switches which configuration is collected earlier than rollups configuration are kept"""
+
+    switch_df = errdump_filtered_df.loc[errdump_filtered_df['switchWwn'].notna()].groupby(by='switchWwn').agg(
+        last_message_date=('Message_date', 'max'), config_collection_date=('config_collection_date', 'max'))
+    updated_switches = []
+    for switch_wwn, switch_sr in switch_df.iterrows():
+        switch_rollup = rollup_dct['switches'].get(switch_wwn)
+        if switch_rollup and switch_sr['config_collection_date'] < switch_rollup['config_collection_date']:
+            continue
+        if switch_rollup and switch_sr['config_collection_date'] > switch_rollup['config_collection_date']:
+            last_message_date = max(switch_sr['last_message_date'], switch_rollup['last_message_date'])
+        else:
+            last_message_date = switch_sr['last_message_date']
+        rollup_dct['switches'][switch_wwn] = {'last_message_date': last_message_date,
+                                                'config_collection_date': switch_sr['config_collection_date']}
+        updated_switches.append(switch_wwn)
+
+    mask_updated = raslog_counter_df['switchWwn'].isin(updated_switches)
+    if rollup_dct['counter_df'] is None:
+        rollup_dct['counter_df'] = raslog_counter_df.loc[mask_updated].copy()
+    else:
+        mask_rollup_updated = rollup_dct['counter_df']['switchWwn'].isin(updated_switches)
+        rollup_dct['counter_df'] = pd.concat([rollup_dct['counter_df'].loc[~mask_rollup_updated],
+                                                raslog_counter_df.loc[mask_updated]], ignore_index=True)
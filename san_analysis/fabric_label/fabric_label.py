@@ -9,11 +9,13 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 from .fabric_label_auto import auto_fabrics_labeling
 from .fabric_label_manual import manual_fabrics_labeling
 
 
+@prof.profile_step('analysis')
 def fabric_label_analysis(switchshow_ports_df, switch_params_df, fabricshow_df, ag_principal_df, project_constants_lst, current_date=str(date.today())):
     """Function to set Fabric labels"""
 
@@ -4,8 +4,10 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 
+@prof.profile_step('analysis')
 def fcr_xd_device_analysis(switch_params_aggregated_df, portshow_aggregated_df, 
                             fcrproxydev_df, fcrxlateconfig_df, project_constants_lst):
     """Main function to create table of devices connected to translate domains"""
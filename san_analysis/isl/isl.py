@@ -6,11 +6,13 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.servicefile_operations as sfop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 
 from .isl_aggregation import isl_aggregated
 
 
+@prof.profile_step('analysis')
 def isl_analysis(fabricshow_ag_labels_df, switch_params_aggregated_df,  
             isl_df, trunk_df, lsdb_df, fcredge_df, portshow_df, sfpshow_df, 
             portcfgshow_df, switchshow_ports_df, project_constants_lst):
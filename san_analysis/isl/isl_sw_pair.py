@@ -8,10 +8,12 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .isl_statistics import isl_statistics
 
 
+@prof.profile_step('analysis')
 def isl_sw_pair_update(isl_aggregated_df, fcredge_aggregated_df, switch_pair_df, project_constants_lst):
     """Main function to add switch pair ID to ISL and IFR tables"""
 
@@ -11,6 +11,7 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .portshow_maps_ports import maps_db_ports
 from .portshow_npiv import npiv_link_aggregated, npiv_statistics
@@ -18,6 +19,7 @@ from .switch_connection_statistics import \
     switch_connection_statistics_aggregated
 
 
+@prof.profile_step('analysis')
 def maps_npiv_ports_analysis(portshow_sfp_aggregated_df, switch_params_aggregated_df, 
                             isl_statistics_df, blade_module_loc_df, switch_pair_df, project_constants_lst):
     """Main function to add porterr, transceiver and portcfg information to portshow DataFrame"""
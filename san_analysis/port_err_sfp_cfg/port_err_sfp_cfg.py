@@ -7,12 +7,14 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .port_err_cfg import port_cfg_join, port_error_filter
 from .port_sfp import port_sfp_join
 from .port_sfp_statistics import count_sfp_statistics
 
 
+@prof.profile_step('analysis')
 def port_err_sfp_cfg_analysis(portshow_aggregated_df, sfpshow_df, portcfgshow_df,
                                 project_constants_lst):
     """Main function to add porterr, transceiver and portcfg information to portshow DataFrame"""
@@ -6,11 +6,13 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .licenseport_aggregation import licenseport_statisctics_aggregated
 from .port_statistics_aggregation import port_statisctics_aggregated
 
 
+@prof.profile_step('analysis')
 def port_statistics_analysis(licenseport_df, portshow_aggregated_df, switch_params_aggregated_df, project_constants_lst):
     """Main function to count Fabrics statistics"""
 
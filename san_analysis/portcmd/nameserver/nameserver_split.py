@@ -1,10 +1,33 @@
-"""Module to split PortSymb and NodeSymb columns, extract device and host information"""
+"""Module to split PortSymb and NodeSymb columns, extract device and host information.
+Each unique PortSymb, NodeSymb pair is split once and results are broadcast to all ports with the same pair"""
 
 
 import re
 
+import numpy as np
 import pandas as pd
 
+import utilities.regular_expression_operations as reop
+import utilities.step_profiling as prof
+
+# columns list to which PortSymb and NodeSymb information splitted up to
+nsshow_symb_columns = [
+    'portSymbUsed', 'portSymbPattern', 'nodeSymbUsed', 'nodeSymbPattern', 'Device_Manufacturer', 'Device_Model', 
+    'Device_SN', 'Device_Name', 'Device_Name_reserved', 'Device_Port', 'Device_Fw', 'Device_Location', 'IP_Address', 
+    'HBA_Manufacturer', 'HBA_Model', 'HBA_Description', 'Host_Name', 'Host_OS', 'HBA_Firmware', 'HBA_Driver'
+    ]
+
+# portSymbPattern and nodeSymbPattern number of each pattern (numbers are saved to the database)
+symb_pattern_numbers = {
+    'qlogic': 2, 'qlogic_emulex_port': 3, 'emulex': 4, 'qlogic_cna': 5, 'hpux': 6, 'storeonce_node': 7,
+    'storeonce_port': 8, '3par_node': 9, '3par_port': 10, 'ultrium': 11, 'library': 12, 'eva': 13,
+    'xp_msa': 14, 'infinibox': 15, 'emc_vplex': 16, 'clarion': 17, 'qlogic_fcoe': 20, 'netapp_node': 21,
+    'ibm_flash': 22, 'data_domain': 23, 'ag_switch': 25, 'netapp_port': 26, 'qlogic_brocade': 27,
+    'dell_storage': 28, 'huawei_manufacturer': 32, 'symmetrix_storage': 33, 'cisco_sw': 34, 'skip_symb': 35
+    }
+# pattern names of the portSymbPattern and nodeSymbPattern numbers
+symb_pattern_names = {number: pattern_name for pattern_name, number in symb_pattern_numbers.items()}
+
 
 def nsshow_symb_split(nsshow_join_df, pattern_dct):
     """
@@ -12,17 +35,11 @@ def nsshow_symb_split(nsshow_join_df, pattern_dct):
     Returns DataFrame with splitted columns and DataFrame with rows that function was not able to split up. 
     """
 
-    # columns list to which PortSymb and NodeSymb information splitted up to
-    nsshow_symb_columns = [
-        'portSymbUsed', 'portSymbPattern', 'nodeSymbUsed', 'nodeSymbPattern', 'Device_Manufacturer', 'Device_Model', 
-        'Device_SN', 'Device_Name', 'Device_Name_reserved', 'Device_Port', 'Device_Fw', 'Device_Location', 'IP_Address', 
-        'HBA_Manufacturer', 'HBA_Model', 'HBA_Description', 'Host_Name', 'Host_OS', 'HBA_Firmware', 'HBA_Driver'
-        ]
-
     # add  and HBA information empty columns to NameServer DataFrame
     nsshow_join_df = nsshow_join_df.reindex(columns=[*nsshow_join_df.columns.tolist(), *nsshow_symb_columns])
     # split up PortSymb and NodeSymb columns
-    nsshow_join_df[nsshow_symb_columns] = nsshow_join_df.apply(lambda series: _symb_split(series, pattern_dct, nsshow_symb_columns), axis = 1)
+    if not nsshow_join_df.empty:
+        nsshow_join_df[nsshow_symb_columns] = symb_split(nsshow_join_df, pattern_dct)
     
     # show unsplit PortSymb and NodeSymb
     # mask shows rows where neither PortSymb nor NodeSymb was split up
@@ -34,281 +51,309 @@ def nsshow_symb_split(nsshow_join_df, pattern_dct):
     return nsshow_join_df, nsshow_unsplit_df
 
 
-def _symb_split(series, pattern_dct, nsshow_symb_columns):
-    """Function to extract  and HBA information from PortSymb, NodeSymb columns of the NameServer DataFrame"""
+def symb_split(nsshow_join_df, pattern_dct):
+    """Function to split unique PortSymb, NodeSymb pairs of the NameServer DataFrame once.
+    Returns DataFrame with nsshow_symb_columns for each row of the nsshow_join_df
+    and counts ports split with each pattern"""
 
-    # regular expression patterns TO_REMOVE
-    # comp_keys, match_keys, comp_dct = re_pattern_lst
-    
-    port_symb = series['PortSymb']
-    node_symb = series['NodeSymb']
+    symb_columns = ['PortSymb', 'NodeSymb']
+    # number of the unique PortSymb, NodeSymb pair for each row
+    symb_codes = nsshow_join_df.groupby(by=symb_columns, dropna=False, sort=False).ngroup().to_numpy()
+    symb_unique_df = nsshow_join_df.drop_duplicates(subset=symb_columns)
+    # split each unique pair
+    symb_split_values = np.array(
+        [_symb_split(port_symb, node_symb, pattern_dct) 
+         for port_symb, node_symb in symb_unique_df[symb_columns].itertuples(index=False, name=None)], dtype=object)
+    symb_split_df = pd.DataFrame(symb_split_values[symb_codes], index=nsshow_join_df.index, columns=nsshow_symb_columns).infer_objects()
+    # pattern hits are added to the run log
+    for (symb_column, pattern_name), (symb_number, port_number) in count_symb_pattern_hits(symb_split_df, symb_codes).items():
+        prof.add_counter_record('symb_split', f'{symb_column} {pattern_name}', symb_number, port_number)
+    return symb_split_df
+
+
+def count_symb_pattern_hits(symb_split_df, symb_codes):
+    """Function returns number of unique PortSymb, NodeSymb pairs and ports split with each pattern
+    {(symb_column, pattern_name): [unique_symb_number, port_number]}"""
+
+    symb_pattern_hits = {}
+    for symb_column, pattern_column in (('PortSymb', 'portSymbPattern'), ('NodeSymb', 'nodeSymbPattern')):
+        pattern_df = pd.DataFrame({'pattern': symb_split_df[pattern_column].to_numpy(), 'symb_code': symb_codes}).dropna()
+        for pattern_number, pattern_group_df in pattern_df.groupby(by='pattern'):
+            pattern_name = symb_pattern_names.get(pattern_number, pattern_number)
+            symb_pattern_hits[(symb_column, pattern_name)] = [pattern_group_df['symb_code'].nunique(), len(pattern_group_df)]
+    return symb_pattern_hits
+
+
+def _symb_split(port_symb, node_symb, pattern_dct):
+    """Function to extract  and HBA information from PortSymb, NodeSymb values of the NameServer DataFrame.
+    Values are matched only with patterns verified before the first matched condition"""
+
+    symb_dct = dict.fromkeys(nsshow_symb_columns, np.nan)
 
     match_port_dct = dict()
     match_node_dct = dict()
     # create dictionary with PortSymb cell match results
     if not pd.isnull(port_symb): 
-        # match_port_dct = {match_key: comp_dct[comp_key].match(port_symb) for comp_key, match_key in zip(comp_keys, match_keys)}
-        match_port_dct = {pattern_name: pattern_dct[pattern_name].match(port_symb) for pattern_name in pattern_dct.keys()}
+        match_port_dct = reop.match_line(pattern_dct, port_symb)
     # create dictionary with NodeSymb cell match results
     if not pd.isnull(node_symb):
-        # match_node_dct = {match_key: comp_dct[comp_key].match(node_symb) for comp_key, match_key in zip(comp_keys, match_keys)}
-        match_node_dct = {pattern_name: pattern_dct[pattern_name].match(node_symb) for pattern_name in pattern_dct.keys()}
+        match_node_dct = reop.match_line(pattern_dct, node_symb)
 
     # 3par_node_match node_symb
     if not pd.isnull(node_symb) and match_node_dct['3par_node']:
         match = match_node_dct['3par_node']
-        series['Device_Manufacturer'] = match.group(3)
-        series['Device_Model'] = match.group(2)
-        series['Device_SN'] = match.group(4)
-        series['Device_Name_reserved'] = match.group(1)
-        series['Device_Fw'] = match.group(5)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 9
+        symb_dct['Device_Manufacturer'] = match.group(3)
+        symb_dct['Device_Model'] = match.group(2)
+        symb_dct['Device_SN'] = match.group(4)
+        symb_dct['Device_Name_reserved'] = match.group(1)
+        symb_dct['Device_Fw'] = match.group(5)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['3par_node']
         # 3par_port_match port_symb
         if not pd.isnull(port_symb) and match_port_dct['3par_port']:
             match = match_port_dct['3par_port']
-            series['Device_Port'] = match.group(1)
-            series['HBA_Model'] = match.group(2)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 10
+            symb_dct['Device_Port'] = match.group(1)
+            symb_dct['HBA_Model'] = match.group(2)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['3par_port']
     # netapp_node_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['netapp_node']:
         match = match_node_dct['netapp_node']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
         if match.group(3):
-            series['Device_Name'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 21
+            symb_dct['Device_Name'] = match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['netapp_node']
         # netapp_port_match port_symb
         if not pd.isnull(port_symb) and match_port_dct['netapp_port']:
             match = match_port_dct['netapp_port']
-            series['Device_Port'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 26
+            symb_dct['Device_Port'] = match.group(1)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['netapp_port']
     # qlogic_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['qlogic']:
         match = match_node_dct['qlogic']
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Firmware'] = match.group(2)
-        series['HBA_Driver'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 2
+        symb_dct['HBA_Model'] = match.group(1)
+        symb_dct['HBA_Firmware'] = match.group(2)
+        symb_dct['HBA_Driver'] = match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['qlogic']
         # xp_msa_match port_symb
         if not pd.isnull(port_symb) and match_port_dct['xp_msa']:
             match = match_port_dct['xp_msa']
-            series['Device_Manufacturer'] = match.group(2)
-            series['Device_Model'] = match.group(1)
-            series['Device_Fw'] = match.group(3)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 14
+            symb_dct['Device_Manufacturer'] = match.group(2)
+            symb_dct['Device_Model'] = match.group(1)
+            symb_dct['Device_Fw'] = match.group(3)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['xp_msa']
         # qlogic_emulex_port_match port symb
         elif not pd.isnull(port_symb) and match_port_dct['qlogic_emulex_port']:
             match = match_port_dct['qlogic_emulex_port']
-            series['HBA_Manufacturer'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 3
+            symb_dct['HBA_Manufacturer'] = match.group(1)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['qlogic_emulex_port']
         # infinibox_match port_symb
         elif not pd.isnull(port_symb) and match_port_dct['infinibox']:
             match = match_port_dct['infinibox']
-            series['Device_Manufacturer'] = match.group(2)
-            series['Device_Model'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 15
+            symb_dct['Device_Manufacturer'] = match.group(2)
+            symb_dct['Device_Model'] = match.group(1)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['infinibox']
     # emulex_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['emulex']:
         match = match_node_dct['emulex']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['HBA_Model'] = match.group(2)
-        series['HBA_Firmware'] = match.group(3)
+        symb_dct['HBA_Manufacturer'] = match.group(1)
+        symb_dct['HBA_Model'] = match.group(2)
+        symb_dct['HBA_Firmware'] = match.group(3)
         if match.group(4):
-            series['HBA_Driver'] = match.group(4).rstrip('.')
+            symb_dct['HBA_Driver'] = match.group(4).rstrip('.')
         if match.group(5) and not re.search(r'localhost|none', match.group(5)):
-            series['Host_Name'] = match.group(5).rstrip('.')
+            symb_dct['Host_Name'] = match.group(5).rstrip('.')
         if match.group(6):
-            series['Host_OS'] = match.group(6).rstrip('.')
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 4
+            symb_dct['Host_OS'] = match.group(6).rstrip('.')
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['emulex']
     # qlogic_fcoe_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['qlogic_fcoe']:
         match = match_node_dct['qlogic_fcoe']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['HBA_Model'] = match.group(2)
-        series['HBA_Driver'] = match.group(3)
-        series['HBA_Firmware'] = match.group(4)
-        series['Host_Name'] = match.group(5).rstrip('.')
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 20
+        symb_dct['HBA_Manufacturer'] = match.group(1)
+        symb_dct['HBA_Model'] = match.group(2)
+        symb_dct['HBA_Driver'] = match.group(3)
+        symb_dct['HBA_Firmware'] = match.group(4)
+        symb_dct['Host_Name'] = match.group(5).rstrip('.')
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['qlogic_fcoe']
     # ag_switch_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['ag_switch']:
         match = match_node_dct['ag_switch']
-        series['Device_Name'] = match.group(1)
-        series['IP_Address'] = match.group(2)
-        series['Device_Fw'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 25
+        symb_dct['Device_Name'] = match.group(1)
+        symb_dct['IP_Address'] = match.group(2)
+        symb_dct['Device_Fw'] = match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['ag_switch']
     # hpux_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['hpux']:
         match = match_node_dct['hpux']
         if match.group(1) and not re.search(r'localhost|none', match.group(1)):
-            series['Host_Name'] = match.group(1)
-        series['Host_OS'] = match.group(2)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 6
+            symb_dct['Host_Name'] = match.group(1)
+        symb_dct['Host_OS'] = match.group(2)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['hpux']
     # ultrium_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['ultrium']:
         match = match_node_dct['ultrium']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(4)
-        series['Device_Fw'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 11
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_SN'] = match.group(4)
+        symb_dct['Device_Fw'] = match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['ultrium']
     # emc_vplex_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['emc_vplex']:
         match = match_node_dct['emc_vplex']
-        series['Device_Manufacturer'] = match.group(1)
-        series['Device_Model'] = match.group(1) + " " + match.group(2)
-        series['Device_SN'] = match.group(3)
-        series['Device_Name'] = match.group(1) + " " + match.group(2) +  " " +  match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 16
+        symb_dct['Device_Manufacturer'] = match.group(1)
+        symb_dct['Device_Model'] = match.group(1) + " " + match.group(2)
+        symb_dct['Device_SN'] = match.group(3)
+        symb_dct['Device_Name'] = match.group(1) + " " + match.group(2) +  " " +  match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['emc_vplex']
         # emc_vplex_match port_symb
         if not pd.isnull(port_symb) and match_port_dct['emc_vplex']:
             match = match_port_dct['emc_vplex']
-            series['Device_Port'] = match.group(4)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 16
+            symb_dct['Device_Port'] = match.group(4)
+            symb_dct['portSymbUsed'] = 'yes'
+            symb_dct['portSymbPattern'] = symb_pattern_numbers['emc_vplex']
     # huawei_manufacturer node_symb
     elif not pd.isnull(node_symb) and match_node_dct['huawei_manufacturer']:
         match = match_node_dct['huawei_manufacturer']
-        series['Device_Manufacturer'] = match.group(1)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 32
+        symb_dct['Device_Manufacturer'] = match.group(1)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['huawei_manufacturer']
     # skip_symb node_symb
     elif not pd.isnull(node_symb) and match_node_dct['skip_symb']:
         match = match_node_dct['skip_symb']
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 35
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['skip_symb']
     # qlogic_brocade_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['qlogic_brocade']:
         match = match_port_dct['qlogic_brocade']
-        series['HBA_Manufacturer'] = match.group(2)
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Driver'] = match.group(3)
-        series['Host_Name'] = match.group(4)
-        series['Host_OS'] = match.group(5)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 27
+        symb_dct['HBA_Manufacturer'] = match.group(2)
+        symb_dct['HBA_Model'] = match.group(1)
+        symb_dct['HBA_Driver'] = match.group(3)
+        symb_dct['Host_Name'] = match.group(4)
+        symb_dct['Host_OS'] = match.group(5)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['qlogic_brocade']
     # storeonce_port_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['storeonce_port']:
         match = match_port_dct['storeonce_port']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_SN'] = match.group(3)
         if match.group(3):
-            series['Device_Name'] = match.group(1) + " " + match.group(3)
-        series['Device_Port'] = match.group(4)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 8
+            symb_dct['Device_Name'] = match.group(1) + " " + match.group(3)
+        symb_dct['Device_Port'] = match.group(4)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['storeonce_port']
     # storeonce_node_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['storeonce_node']:
         match = match_node_dct['storeonce_node']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_SN'] = match.group(3)
         if match.group(3):
-            series['Device_Name'] = match.group(1) + " " + match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 7
+            symb_dct['Device_Name'] = match.group(1) + " " + match.group(3)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['storeonce_node']
     # data_domain_match node_symb
     elif not pd.isnull(node_symb) and match_node_dct['data_domain']:
         match = match_node_dct['data_domain']
-        series['Device_Model'] = match.group(1)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 23
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['nodeSymbUsed'] = 'yes'
+        symb_dct['nodeSymbPattern'] = symb_pattern_numbers['data_domain']
     # xp_msa_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['xp_msa']:
         match = match_port_dct['xp_msa']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_Fw'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 14
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_Fw'] = match.group(3)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['xp_msa']
     # eva_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['eva']:
         match = match_port_dct['eva']
-        series['Device_Model'] = match.group(1)
-        series['Device_Name'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 13
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_Name'] = match.group(2)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['eva']
     # library_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['library']:
         match = match_port_dct['library']
-        series['Device_Model'] = match.group(1)
-        # series['Device_Name'] = match.group(1)
-        series['Device_SN'] = match.group(2)
-        series['Device_Port'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 12
+        symb_dct['Device_Model'] = match.group(1)
+        # symb_dct['Device_Name'] = match.group(1)
+        symb_dct['Device_SN'] = match.group(2)
+        symb_dct['Device_Port'] = match.group(3)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['library']
     # qlogic_cna_match port_symb duplicate with cna_adapter_match node_symb 19
     elif not pd.isnull(port_symb) and match_port_dct['qlogic_cna']:
         match = match_port_dct['qlogic_cna']
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Driver'] = match.group(2)
-        series['Device_Port'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 5
+        symb_dct['HBA_Model'] = match.group(1)
+        symb_dct['HBA_Driver'] = match.group(2)
+        symb_dct['Device_Port'] = match.group(3)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['qlogic_cna']
     # clariion_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['clarion']:
         match = match_port_dct['clarion']
-        series['Device_Manufacturer'] = 'EMC'
-        series['Device_Model'] = 'EMC ' + match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 17
+        symb_dct['Device_Manufacturer'] = 'EMC'
+        symb_dct['Device_Model'] = 'EMC ' + match.group(1)
+        symb_dct['Device_Port'] = match.group(2)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['clarion']
     # ibm_flash_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['ibm_flash']:
         match = match_port_dct['ibm_flash']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 22
+        symb_dct['Device_Manufacturer'] = match.group(2)
+        symb_dct['Device_Model'] = match.group(1)
+        symb_dct['Device_SN'] = match.group(3)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['ibm_flash']
     # qlogic_emulex_port_match port_symb when node_symb is empty
     elif not pd.isnull(port_symb) and match_port_dct['qlogic_emulex_port']:
         match = match_port_dct['qlogic_emulex_port']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 3
+        symb_dct['HBA_Manufacturer'] = match.group(1)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['qlogic_emulex_port']
     # dell_storage_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['dell_storage']:
         match = match_port_dct['dell_storage']
-        series['Device_Model'] = 'Compellent ' + match.group(2)
-        series['Device_Name'] = match.group(3)
-        series['Device_Port'] = match.group(1)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 28
+        symb_dct['Device_Model'] = 'Compellent ' + match.group(2)
+        symb_dct['Device_Name'] = match.group(3)
+        symb_dct['Device_Port'] = match.group(1)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['dell_storage']
     # symmetrix_storage_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['symmetrix_storage']:
         match = match_port_dct['symmetrix_storage']
-        series['Device_Model'] = match.group(1)
-        # series['Device_Name'] = match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 33
+        symb_dct['Device_Model'] = match.group(1)
+        # symb_dct['Device_Name'] = match.group(1)
+        symb_dct['Device_Port'] = match.group(2)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['symmetrix_storage']
     # cisco_sw_match port_symb
     elif not pd.isnull(port_symb) and match_port_dct['cisco_sw']:
         match = match_port_dct['cisco_sw']
-        series['Device_Name'] = match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 34
+        symb_dct['Device_Name'] = match.group(1)
+        symb_dct['Device_Port'] = match.group(2)
+        symb_dct['portSymbUsed'] = 'yes'
+        symb_dct['portSymbPattern'] = symb_pattern_numbers['cisco_sw']
     # if no match was found copy values with no split
     else:
-        if not pd.isnull(node_symb) and pd.isnull(series['nodeSymbUsed']):
-            series['Device_Name'] = series['NodeSymb']
-        if not pd.isnull(port_symb) and pd.isnull(series['portSymbUsed']):
-            series['Device_Port'] = series['PortSymb']
+        if not pd.isnull(node_symb) and pd.isnull(symb_dct['nodeSymbUsed']):
+            symb_dct['Device_Name'] = node_symb
+        if not pd.isnull(port_symb) and pd.isnull(symb_dct['portSymbUsed']):
+            symb_dct['Device_Port'] = port_symb
 
-    return pd.Series([series[column] for column in nsshow_symb_columns])
+    return [symb_dct[column] for column in nsshow_symb_columns]
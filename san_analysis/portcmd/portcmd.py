@@ -6,8 +6,10 @@ import pandas as pd
 import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
+import utilities.oui_operations as ouop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .devicename_change import devicename_correction, hostname_domain_remove
 from .portcmd_aggregation import portshow_aggregated
@@ -16,6 +18,7 @@ from .statistics import (device_connection_statistics,
                          storage_connection_statistics)
 
 
+@prof.profile_step('analysis')
 def portcmd_analysis(portshow_df, switchshow_ports_df, switch_params_df, 
                         switch_params_aggregated_df, isl_aggregated_df, 
                         nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df,
@@ -63,6 +66,8 @@ def portcmd_analysis(portshow_df, switchshow_ports_df, switch_params_df,
         pattern_dct, *_ = sfop.regex_pattern_import('ns_split', max_title)
     
         oui_df = sfop.dataframe_import('oui', max_title, columns=['Connected_oui', 'type', 'subtype'])
+        # IEEE OUI registry to find WWNp vendor
+        oui_index = ouop.oui_index_import(max_title)
         # current operation information string
         info = f'Generating connected devices table'
         print(info, end =" ") 
@@ -73,7 +78,7 @@ def portcmd_analysis(portshow_df, switchshow_ports_df, switch_params_df,
                                 switch_params_aggregated_df, isl_aggregated_df, 
                                 nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df, 
                                 ag_principal_df, porttrunkarea_df, switch_models_df, alias_df, 
-                                oui_df, fdmi_df, blade_module_df,  blade_servers_df, blade_vc_df, 
+                                oui_df, oui_index, fdmi_df, blade_module_df,  blade_servers_df, blade_vc_df, 
                                 synergy_module_df, synergy_servers_df, 
                                 system_3par_df, port_3par_df, system_oceanstor_df, port_oceanstor_df,
                                 pattern_dct)
@@ -10,7 +10,7 @@ import utilities.dataframe_operations as dfop
 from .portcmd_aliasgroup import alias_preparation, group_name_fillna
 from .portcmd_bladesystem import (blade_server_fillna, blade_vc_fillna,
                                   vc_name_fillna)
-from .portcmd_devicetype import oui_join, type_check
+from .portcmd_devicetype import manufacturer_fillna, oui_join, type_check
 from .portcmd_gateway import verify_gateway_link, verify_trunkarea_link
 from .nameserver import nsshow_analysis
 from .portcmd_storage import (construct_infinidat_node_port_from_wwn,
@@ -23,7 +23,7 @@ from .portcmd_switch import (fill_isl_link, fill_switch_info,
 def portshow_aggregated(portshow_df, switchshow_ports_df, switch_params_df, switch_params_aggregated_df, 
                         isl_aggregated_df, 
                         nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df, 
-                        ag_principal_df, porttrunkarea_df, switch_models_df, alias_df, oui_df, fdmi_df, 
+                        ag_principal_df, porttrunkarea_df, switch_models_df, alias_df, oui_df, oui_index, fdmi_df, 
                         blade_module_df, blade_servers_df, blade_vc_df, synergy_module_df, synergy_servers_df, 
                         system_3par_df, port_3par_df, system_oceanstor_df, port_oceanstor_df,
                         pattern_dct):
@@ -76,7 +76,7 @@ def portshow_aggregated(portshow_df, switchshow_ports_df, switch_params_df, swit
             columns=[*portshow_aggregated_df.columns.tolist(), 'deviceType', 'deviceSubtype'])
     
     # add preliminarily device type (SRV, STORAGE, LIB, SWITCH, VC) and subtype based on oui (WWNp)
-    portshow_aggregated_df = oui_join(portshow_aggregated_df, oui_df, switchshow_ports_df)
+    portshow_aggregated_df = oui_join(portshow_aggregated_df, oui_df, oui_index, switchshow_ports_df)
     # preliminarily assisgn to all initiators type SRV
     mask_initiator = portshow_aggregated_df.Device_type.isin(['Physical Initiator', 'NPIV Initiator'])
     dfop.column_to_object(portshow_aggregated_df, 'deviceType', 'deviceSubtype')
@@ -84,8 +84,9 @@ def portshow_aggregated(portshow_df, switchshow_ports_df, switch_params_df, swit
     # define oui for each connected device to identify device type
     switches_oui = switch_params_aggregated_df['switchWwn'].str.slice(start = 6)
     # final device type define
-    portshow_aggregated_df[['deviceType', 'deviceSubtype']] = portshow_aggregated_df.apply(
-        lambda series: type_check(series, switches_oui, blade_servers_df, synergy_servers_df), axis = 1)
+    portshow_aggregated_df = type_check(portshow_aggregated_df, switches_oui, blade_servers_df, synergy_servers_df)
+    # fill empty manufacturer with WWNp vendor from IEEE OUI registry
+    portshow_aggregated_df = manufacturer_fillna(portshow_aggregated_df)
     # identify MSA port numbers (A1-A4, B1-B4) based on PortWwn
     portshow_aggregated_df.Device_Port = \
         portshow_aggregated_df.apply(lambda series: find_msa_port(series) \
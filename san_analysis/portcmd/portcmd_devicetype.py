@@ -10,10 +10,12 @@ import numpy as np
 import pandas as pd
 
 import utilities.dataframe_operations as dfop
+import utilities.oui_operations as ouop
 
 
-def oui_join(portshow_aggregated_df, oui_df, switchshow_ports_df):
-    """Function to add preliminarily device type (SRV, STORAGE, LIB, SWITCH, VC) and subtype based on oui (WWNp)"""  
+def oui_join(portshow_aggregated_df, oui_df, oui_index, switchshow_ports_df):
+    """Function to add preliminarily device type (SRV, STORAGE, LIB, SWITCH, VC) and subtype based on oui (WWNp)
+    and IEEE organization (vendor) of the WWNp"""  
     
     portshow_aggregated_df['Connected_portWwn_switchshow_filled'] = portshow_aggregated_df['Connected_portWwn']
     switchshow_ports_df['Connected_portWwn_switchshow_filled'] = switchshow_ports_df['connected_portWwn'].str.lower()
@@ -21,134 +23,157 @@ def oui_join(portshow_aggregated_df, oui_df, switchshow_ports_df):
                                                     filled_lst=['Connected_portWwn_switchshow_filled'])
     # extract oui from WWNp
     portshow_aggregated_df['Connected_oui'] = portshow_aggregated_df['Connected_portWwn_switchshow_filled'].str.slice(start=6, stop=14)    
-    # add device types from oui DataFrame
-    oui_df.dropna(subset=['Connected_oui'], inplace=True)
-    portshow_aggregated_df = portshow_aggregated_df.merge(oui_df, how = 'left', on = ['Connected_oui'])
+    # add device types from oui DataFrame (oui is unique)
+    oui_type_df = oui_df.dropna(subset=['Connected_oui']).drop_duplicates(subset=['Connected_oui']).set_index('Connected_oui')
+    for column in ['type', 'subtype']:
+        portshow_aggregated_df[column] = portshow_aggregated_df['Connected_oui'].map(oui_type_df[column])
+    # add IEEE organization with the longest WWNp prefix
+    portshow_aggregated_df['Connected_vendor'] = \
+        ouop.oui_vendor(portshow_aggregated_df['Connected_portWwn_switchshow_filled'], oui_index)
     return portshow_aggregated_df
 
 
-def type_check(series, switches_oui, blade_servers_df, synergy_servers_df):
-    """Function to define device class and type"""
+def manufacturer_fillna(portshow_aggregated_df):
+    """Function to fill empty manufacturer with IEEE organization (vendor) of the WWNp.
+    WWNp of the server belongs to HBA so HBA_Manufacturer is filled for servers 
+    and Device_Manufacturer is filled for other devices"""
+
+    mask_srv = portshow_aggregated_df['deviceType'] == 'SRV'
+    mask_device = portshow_aggregated_df['deviceType'].notna() & ~mask_srv
+    dfop.column_to_object(portshow_aggregated_df, 'HBA_Manufacturer', 'Device_Manufacturer')
+    for mask_type, manufacturer_column in [(mask_srv, 'HBA_Manufacturer'), (mask_device, 'Device_Manufacturer')]:
+        mask_fill = mask_type & portshow_aggregated_df[manufacturer_column].isna()
+        portshow_aggregated_df.loc[mask_fill, manufacturer_column] = portshow_aggregated_df.loc[mask_fill, 'Connected_vendor']
+    return portshow_aggregated_df
+
+
+def type_check(portshow_aggregated_df, switches_oui, blade_servers_df, synergy_servers_df):
+    """Function to define device class and type (deviceType, deviceSubtype columns).
+    Conditions are verified for all ports at once in order of priority"""
     
     if synergy_servers_df.empty:
         synergy_servers_df['Connected_portWwn'] = np.nan
 
-    # drop rows with empty WWNp values
-    blade_hba_df = blade_servers_df.dropna(subset = ['portWwn']).copy()
-    synergy_hba_df = synergy_servers_df.dropna(subset = ['Connected_portWwn']).copy()
-
-    if series[['type', 'subtype']].notnull().all():
-        # servers type
-        # if WWNp in blade hba DataFrame
-        # if (blade_hba_df['portWwn'] == series['Connected_portWwn']).any():
-        #     return pd.Series(('BLADE_SRV', series['subtype'].split('|')[0]))
-        # elif (synergy_hba_df['Connected_portWwn'] == series['Connected_portWwn']).any():
-        #     return pd.Series(('SYNERGY_SRV', series['subtype'].split('|')[0]))
-        if (series['Connected_portWwn_switchshow_filled'] == blade_hba_df['portWwn']).any():
-            return pd.Series(('SRV_BLADE', series['subtype'].split('|')[0]))
-        elif (series['Connected_portWwn_switchshow_filled'] == synergy_hba_df['Connected_portWwn']).any():
-            return pd.Series(('SRV_SYNERGY', series['subtype'].split('|')[0]))
-
-        # devices with strictly defined type and subtype
-        elif not '|' in series['type'] and not '|' in  series['subtype']:
-            return pd.Series((series.type, series.subtype))
-        # check SWITCH TYPE
-        elif 'SRV|SWITCH' in series['type']:
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series.subtype))
-            elif series['portType'] in ['E-Port', 'EX-Port']:
-                return pd.Series(('SWITCH', series.subtype))
-            elif (series['Connected_portWwn_switchshow_filled'][6:] == switches_oui).any():
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['switchMode'] == 'Access Gateway Mode' and series['portType'] == 'N-Port':
-                return pd.Series(('SWITCH', 'AG'))
-            elif pd.notna(series['HBA_Manufacturer']) and 'AG Brocade' in series['HBA_Manufacturer']:
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['Device_type'] == "Physical Unknown(initiator/target)":
-                return pd.Series(('SWITCH', series.subtype))
-            # when device behind NPIV port
-            elif series['Connected_portId'][4:5] != '00':
-                return pd.Series(('SRV', series.subtype))
-            else:
-                return pd.Series(('SRV', series.subtype))
-
-        elif 'STORAGE|SWITCH' in series['type']:
-            if series['Device_type'] == 'Physical Unknown(initiator/target)':
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['Device_type'] == 'Physical Initiator+Target':
-                return pd.Series(('STORAGE', series.subtype))           
-
-        # check StoreOnce and D2D devices
-        elif pd.notna(series.Device_Model) and 'storeonce' in series['Device_Model'].lower():
-            return pd.Series(('LIB', 'StoreOnce'))
-        elif pd.notna(series.Device_Model) and 'd2d' in series['Device_Model'].lower():
-            return pd.Series(('LIB', 'D2D'))
-
-        # if not d2d than it's storage
-        elif series['type'] == 'STORAGE|LIB':
-            if pd.notna(series.Device_Model) and 'ultrium' in series['Device_Model'].lower():
-                return pd.Series(('LIB', series['subtype'].split('|')[1]))
-            else:
-                return pd.Series(('STORAGE', series['subtype'].split('|')[0]))
-        
-        # check if device server or library
-        elif series['type'] == 'SRV|LIB': 
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            elif series['Device_type'] in ['Physical Target', 'NPIV Target']:
-                return pd.Series(('LIB', series['subtype'].split('|')[1]))
-            # if Device_type is empty (No Physical target or Initator) and no Device_Model 
-            # and Device serial number then it's SRV
-            elif pd.isna(series[['Device_Model', 'Device_SN']]).all() and 'Unknown' in series['Device_type']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-        # check if device server or storage
-        elif series['type'] == 'SRV|STORAGE':
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            elif pd.notna(series.HBA_Manufacturer) and 'qlogic' in series['HBA_Manufacturer'].lower():
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            else:
-                return pd.Series(('STORAGE', series['subtype'].split('|')[1]))
-            
-        elif series['type'] == 'SRV|STORAGE|LIB':
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            # if ultrium type
-            elif not pd.isna(series['NodeSymb']) and 'ultrium' in series['NodeSymb'].lower():
-                return pd.Series(('LIB', series['subtype'].split('|')[2]))
-            # if host and hba info present
-            elif series[['HBA_Manufacturer', 'HBA_Model', 'Host_OS', 'HBA_Firmware', 'HBA_Driver']].notnull().all():
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            # if not initiator and not target ultrium than it's storage
-            else:
-                device_type = series['type'].split('|')[1]
-                device_subtype = series['subtype'].split('|')[1]
-                return pd.Series((device_type, device_subtype))
+    # WWNp of the blade and synergy servers hba (empty values dropped)
+    blade_hba_wwnp = set(blade_servers_df['portWwn'].dropna())
+    synergy_hba_wwnp = set(synergy_servers_df['Connected_portWwn'].dropna())
+
+    df = portshow_aggregated_df
+    wwnp_sr = df['Connected_portWwn_switchshow_filled']
+    type_sr = df['type']
+    subtype_sr = df['subtype']
+    # subtypes for devices with multiple subtypes ('subtype0|subtype1|subtype2')
+    subtype_split_df = subtype_sr.where(subtype_sr.notna(), '').astype(str).str.split('|', expand=True).reindex(columns=range(3))
+    subtype_0, subtype_1, subtype_2 = (subtype_split_df[i].where(subtype_sr.notna()) for i in range(3))
+    type_1 = type_sr.where(type_sr.notna(), '').astype(str).str.split('|').str[1]
+
+    mask_initiator = df['Device_type'].isin(['Physical Initiator', 'NPIV Initiator'])
+    mask_target = df['Device_type'].isin(['Physical Target', 'NPIV Target'])
+    mask_unknown_initiator_target = df['Device_type'] == 'Physical Unknown(initiator/target)'
+    mask_ag_nport = (df['switchMode'] == 'Access Gateway Mode') & (df['portType'] == 'N-Port')
+    mask_model_ultrium = column_contains(df, 'Device_Model', 'ultrium', lower=True)
+
+    # devices with oui type and subtype
+    mask_oui_type = type_sr.notna() & subtype_sr.notna()
+    # servers type
+    mask_blade = mask_oui_type & wwnp_sr.isin(blade_hba_wwnp)
+    mask_synergy = mask_oui_type & wwnp_sr.isin(synergy_hba_wwnp)
+    # devices with strictly defined type and subtype
+    mask_strict_type = mask_oui_type & ~column_contains(df, 'type', '|') & ~column_contains(df, 'subtype', '|')
+    # check SWITCH TYPE
+    mask_srv_switch = mask_oui_type & column_contains(df, 'type', 'SRV|SWITCH')
+    mask_switch_oui = wwnp_sr.notna() & wwnp_sr.astype(str).str.slice(start=6).isin(switches_oui.dropna())
+    mask_ag_brocade = column_contains(df, 'HBA_Manufacturer', 'AG Brocade')
+    # devices with STORAGE|SWITCH type and not defined Device_type are verified as devices with undefined type
+    mask_storage_switch = mask_oui_type & column_contains(df, 'type', 'STORAGE|SWITCH')
+    mask_oui_type_verified = mask_oui_type & ~mask_storage_switch
+    # check StoreOnce and D2D devices
+    mask_storeonce = mask_oui_type_verified & column_contains(df, 'Device_Model', 'storeonce', lower=True)
+    mask_d2d = mask_oui_type_verified & column_contains(df, 'Device_Model', 'd2d', lower=True)
+    # if not d2d than it's storage
+    mask_storage_lib = mask_oui_type_verified & (type_sr == 'STORAGE|LIB')
+    # check if device server or library
+    mask_srv_lib = mask_oui_type_verified & (type_sr == 'SRV|LIB')
+    # if Device_type is empty (No Physical target or Initator) and no Device_Model 
+    # and Device serial number then it's SRV
+    mask_unknown_no_model = df[['Device_Model', 'Device_SN']].isna().all(axis=1) & column_contains(df, 'Device_type', 'Unknown')
+    # check if device server or storage
+    mask_srv_storage = mask_oui_type_verified & (type_sr == 'SRV|STORAGE')
+    mask_qlogic = column_contains(df, 'HBA_Manufacturer', 'qlogic', lower=True)
+    mask_srv_storage_lib = mask_oui_type_verified & (type_sr == 'SRV|STORAGE|LIB')
+    mask_nodesymb_ultrium = column_contains(df, 'NodeSymb', 'ultrium', lower=True)
+    mask_hba_info = df[['HBA_Manufacturer', 'HBA_Model', 'Host_OS', 'HBA_Firmware', 'HBA_Driver']].notna().all(axis=1)
 
     # if device type is not strictly detected
-    if pd.isna(series[['deviceType', 'deviceSubtype']]).any():
+    mask_device_type_na = df[['deviceType', 'deviceSubtype']].isna().any(axis=1)
+    # Connected_WWNp is empty and no device type and subtype
+    mask_no_oui_type = mask_device_type_na & ~mask_oui_type
+    # define ISL link
+    mask_isl = df[['portState', 'portType']].notna().all(axis=1) & \
+        (column_contains(df, 'portType', 'E-Port') | column_contains(df, 'portType', 'EX-Port'))
+    # slave F-Port trunk ports have Online status but devices are on master port
+    mask_trunk_slave = wwnp_sr.isna() & (df['portState'] == 'Online') & column_contains(df, 'portScn_details', 'Trunk port')
+    # when device_type is not defined, oui is not founded, 
+    # and link is not slave AG or ISL but port is Online then device class is UNKNOWN
+    mask_unknown = (df['portState'] == 'Online') & (df['portType'] != 'D-Port')
+
+    # (condition, deviceType, deviceSubtype) in order of priority
+    device_type_conditions = [
+        (mask_blade, 'SRV_BLADE', subtype_0),
+        (mask_synergy, 'SRV_SYNERGY', subtype_0),
+        (mask_strict_type, type_sr, subtype_sr),
+        (mask_srv_switch & mask_initiator, 'SRV', subtype_sr),
+        (mask_srv_switch & df['portType'].isin(['E-Port', 'EX-Port']), 'SWITCH', subtype_sr),
+        (mask_srv_switch & mask_switch_oui, 'SWITCH', subtype_sr),
+        (mask_srv_switch & mask_ag_nport, 'SWITCH', 'AG'),
+        (mask_srv_switch & mask_ag_brocade, 'SWITCH', subtype_sr),
+        (mask_srv_switch & mask_unknown_initiator_target, 'SWITCH', subtype_sr),
+        (mask_srv_switch, 'SRV', subtype_sr),
+        (mask_storage_switch & mask_unknown_initiator_target, 'SWITCH', subtype_sr),
+        (mask_storage_switch & (df['Device_type'] == 'Physical Initiator+Target'), 'STORAGE', subtype_sr),
+        (mask_storeonce, 'LIB', 'StoreOnce'),
+        (mask_d2d, 'LIB', 'D2D'),
+        (mask_storage_lib & mask_model_ultrium, 'LIB', subtype_1),
+        (mask_storage_lib, 'STORAGE', subtype_0),
+        (mask_srv_lib & mask_initiator, 'SRV', subtype_0),
+        (mask_srv_lib & mask_target, 'LIB', subtype_1),
+        (mask_srv_lib & mask_unknown_no_model, 'SRV', subtype_0),
+        (mask_srv_storage & (mask_initiator | mask_qlogic), 'SRV', subtype_0),
+        (mask_srv_storage, 'STORAGE', subtype_1),
+        (mask_srv_storage_lib & mask_initiator, 'SRV', subtype_0),
+        (mask_srv_storage_lib & mask_nodesymb_ultrium, 'LIB', subtype_2),
+        (mask_srv_storage_lib & mask_hba_info, 'SRV', subtype_0),
+        (mask_srv_storage_lib, type_1, subtype_1),
         # Connected_WWNp is not empty and device type and subtype defined
-        if series[['type', 'subtype']].notnull().all():                                
-            return pd.Series((series['type'], series['subtype']))
-        # Connected_WWNp is empty and no device type and subtype
-        else:
-            # define link from AG to Native switch
-            if pd.notna(series[['switchMode', 'portType']]).all() and \
-                series[['switchMode', 'portType']].equals(pd.Series({'switchMode': 'Access Gateway Mode', 'portType': 'N-Port'})):
-                return pd.Series(('SWITCH', 'SWITCH'))
-            # define ISL link
-            elif pd.notna(series[['portState', 'portType']]).all() and \
-                ('E-Port' in series['portType'] or 'EX-Port' in series['portType']):
-                return pd.Series(('SWITCH', 'SWITCH'))
-            # slave F-Port trunk ports have Online status but devices are on master port
-            elif pd.isna(series.Connected_portWwn_switchshow_filled) and series['portState'] == 'Online' \
-                and pd.notna(series['portScn_details']) and 'Trunk port' in series['portScn_details']:
-                return pd.Series((np.nan, np.nan))
-            # when device_type is not defined, oui is not founded, 
-            # and link is not slave AG or ISL but port is Online then device class is UNKNOWN
-            elif series['portState'] == 'Online' and series['portType'] != 'D-Port':
-                return pd.Series(('UNKNOWN', 'UNKNOWN'))
-            else:
-                return pd.Series((np.nan, np.nan))
-    else:
-        return pd.Series((series['deviceType'], series['deviceSubtype']))
+        (mask_device_type_na & mask_oui_type, type_sr, subtype_sr),
+        # define link from AG to Native switch
+        (mask_no_oui_type & mask_ag_nport, 'SWITCH', 'SWITCH'),
+        (mask_no_oui_type & mask_isl, 'SWITCH', 'SWITCH'),
+        (mask_no_oui_type & mask_trunk_slave, np.nan, np.nan),
+        (mask_no_oui_type & mask_unknown, 'UNKNOWN', 'UNKNOWN'),
+        (mask_no_oui_type, np.nan, np.nan)
+        ]
+    
+    conditions = [condition.to_numpy(dtype=bool) for condition, *_ in device_type_conditions]
+    for column, i in (('deviceType', 1), ('deviceSubtype', 2)):
+        choices = [choice_values(device_type_condition[i], len(df)) for device_type_condition in device_type_conditions]
+        device_type_values = np.select(conditions, choices, default=df[column].to_numpy(dtype=object))
+        df[column] = pd.Series(device_type_values, index=df.index, dtype=object)
+    return df
+
+
+def column_contains(df, column, pattern, lower=False):
+    """Function returns mask of the df rows which column value contains pattern (empty values are not matched)"""
+
+    column_sr = df[column].astype(str)
+    if lower:
+        column_sr = column_sr.str.lower()
+    return df[column].notna() & column_sr.str.contains(pattern, regex=False)
+
+
+def choice_values(value, length):
+    """Function returns object array of the Series values or single value repeated length times"""
+
+    if isinstance(value, pd.Series):
+        return value.to_numpy(dtype=object)
+    return np.full(length, value, dtype=object)
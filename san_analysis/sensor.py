@@ -5,8 +5,10 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 
+@prof.profile_step('analysis')
 def sensor_analysis(sensor_df, switch_params_aggregated_df, project_constants_lst):
     """Main function to analyze zoning configuration"""
         
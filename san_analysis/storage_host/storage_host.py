@@ -7,9 +7,11 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 from .storage_host_aggregation import storage_host_aggregation
 
 
+@prof.profile_step('analysis')
 def storage_host_analysis(host_3par_df, system_3par_df, port_3par_df,
                         system_oceanstor_df, port_oceanstor_df, host_oceanstor_df, 
                         host_id_name_oceanstor_df, host_id_fcinitiator_oceanstor_df, 
@@ -111,35 +111,45 @@ def verify_storage_host_zoning(storage_host_aggregated_df, zoning_aggregated_df)
     zone_3par_dorado_df = \
         zoning_valid_df.groupby(by=group_columns).filter(lambda zone: zone['deviceSubtype'].str.lower().isin(['3par', 'huawei']).any())
 
+    # inverted index of zones with 3PAR storages for each port
+    zone_index_dct, zone_order_dct = create_zone_index(zone_3par_dorado_df)
+
+    storage_host_columns = ['Fabric_host_status', 'Storage_Fabric_name', 'Storage_Fabric_label', 'Storage_Port_Wwnp', 'Host_Wwnp']
     storage_host_aggregated_df['zone'] = \
-        storage_host_aggregated_df.apply(lambda series: find_zones(series, zone_3par_dorado_df), axis=1)
+        [find_zones(*storage_host_values, zone_index_dct, zone_order_dct) 
+            for storage_host_values in storage_host_aggregated_df[storage_host_columns].itertuples(index=False, name=None)]
 
     return storage_host_aggregated_df
 
 
-def find_zones(series, zoning_valid_df):
+def create_zone_index(zoning_valid_df):
+    """Auxiliary function for verify_storage_host_zoning fn
+    to create inverted index of zones {(Fabric_name, Fabric_label, PortName): set of zones} 
+    and zones order {(Fabric_name, Fabric_label, zone): zone position} in zoning_valid_df"""
+
+    zone_index_dct = {}
+    zone_order_dct = {}
+    zone_columns = ['Fabric_name', 'Fabric_label', 'zone', 'PortName']
+    for fabric_name, fabric_label, zone, port_name in zoning_valid_df[zone_columns].itertuples(index=False, name=None):
+        zone_order_dct.setdefault((fabric_name, fabric_label, zone), len(zone_order_dct))
+        if pd.notna(port_name):
+            zone_index_dct.setdefault((fabric_name, fabric_label, port_name), set()).add(zone)
+    return zone_index_dct, zone_order_dct
+
+
+def find_zones(fabric_host_status, storage_fabric_name, storage_fabric_label, storage_port_wwnp, host_wwnp, 
+                zone_index_dct, zone_order_dct):
     """Auxiliary function for verify_storage_host_zoning fn 
     to find zones in effective configuration with storage port and server"""
     
     # verify rows where storage port and server are in same fabric only
-    if series['Fabric_host_status'] in  ['local', 'remote_imported']: 
-        group_columns = ['Fabric_name', 'Fabric_label', 'zone']
-        storage_host_sr = series[['Storage_Port_Wwnp', 'Host_Wwnp']]
-
-        # excessive step zoning_valid_df is already filtered TO_REMOVE 
-        mask_same_fabic = (zoning_valid_df['Fabric_name'] == series['Storage_Fabric_name']) & \
-                            (zoning_valid_df['Fabric_label'] == series['Storage_Fabric_label'])
-        zoning_valid_fabric_df = zoning_valid_df.loc[mask_same_fabic].copy()
-        
-        # find zones with storage port wwnp and host wwnp
-        storage_host_zone_df = \
-            zoning_valid_fabric_df.groupby(by=group_columns).filter(lambda zone: storage_host_sr.isin(zone['PortName']).all())
-        # get zones defined in the same fabric as storage port connection fabric
-        mask_same_fabic = (storage_host_zone_df['Fabric_name'] == series['Storage_Fabric_name']) & \
-                            (storage_host_zone_df['Fabric_label'] == series['Storage_Fabric_label'])
-        zoning_valid_df = storage_host_zone_df.loc[mask_same_fabic].copy()
-        # if zones are found return string of zones separated by commas
-        if not zoning_valid_df.empty:
-            zone_sr = zoning_valid_df['zone'].drop_duplicates()
-            zones_str = ', '.join(zone_sr.to_list())
-            return zones_str
+    if fabric_host_status in  ['local', 'remote_imported']:
+        # zones defined in the same fabric as storage port connection fabric with storage port wwnp and host wwnp
+        storage_zones = zone_index_dct.get((storage_fabric_name, storage_fabric_label, storage_port_wwnp))
+        host_zones = zone_index_dct.get((storage_fabric_name, storage_fabric_label, host_wwnp))
+        if storage_zones and host_zones:
+            zones = storage_zones & host_zones
+            # if zones are found return string of zones separated by commas
+            if zones:
+                zones = sorted(zones, key=lambda zone: zone_order_dct[(storage_fabric_name, storage_fabric_label, zone)])
+                return ', '.join(zones)
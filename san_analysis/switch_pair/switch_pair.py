@@ -9,12 +9,14 @@ import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .switch_pair_auto import auto_switch_pairing
 from .switch_pair_correction import *
 from .switch_pair_verification import *
 
 
+@prof.profile_step('analysis')
 def switch_pair_analysis(switch_params_aggregated_df, portshow_aggregated_df, fcr_xd_proxydev_df, project_constants_lst):
     """Function to set switch pair IDs"""
 
@@ -1,3 +1,5 @@
 from .connected_devices_approach import *
+from .device_incidence import *
 from .enclosure_approach import *
-from .switchname_approach import *
\ No newline at end of file
+from .switchname_approach import *
+from .switchname_similarity import *
\ No newline at end of file
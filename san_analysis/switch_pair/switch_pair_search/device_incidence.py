@@ -0,0 +1,132 @@
+"""Module to count connected device matches for all switch pairs at once.
+Switch by Device_Host_Name incidence matrix is created for the devices DataFrame.
+Number of devices of the switch connected to each candidate switch of the Fabric_name
+is taken from a single matrix product calculated once for each Fabric_name.
+If scipy is not installed then devices of each switch are counted with dictionaries and sets"""
+
+import numpy as np
+import pandas as pd
+
+# scipy is used to keep incidence matrices sparse. dictionaries and sets are used if scipy is not installed
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+
+def create_device_incidence(portshow_devices_df):
+    """Function creates device incidence index for portshow_devices_df.
+    Index contains connected device rows of each switch (switchWwn) with the number of device ports,
+    candidate switches for each Fabric_name, Fabric_label, switchType, switchMode
+    and device match matrices of the fabrics calculated on request"""
+
+    device_codes, _ = pd.factorize(portshow_devices_df['Device_Host_Name'], use_na_sentinel=False)
+    switch_codes, switch_wwns = pd.factorize(portshow_devices_df['switchWwn'], use_na_sentinel=False)
+    device_number = device_codes.max(initial=-1) + 1
+
+    # number of ports of each device connected to each switch
+    switch_device_matrix = incidence_matrix(switch_codes, device_codes, (len(switch_wwns), device_number), presence=False)
+    # number of connected device ports of each switch (empty device names are not counted)
+    mask_device_notna = portshow_devices_df['Device_Host_Name'].notna().to_numpy()
+    connected_device_numbers = np.bincount(switch_codes[mask_device_notna], minlength=len(switch_wwns))
+
+    # candidate switches in order of appearance for each fabric, fabric label, switchType and switchMode
+    candidate_columns = ['Fabric_name', 'Fabric_label', 'switchType', 'switchMode']
+    candidates_df = portshow_devices_df[candidate_columns + ['switchWwn']].copy()
+    candidates_df['device_code'] = device_codes
+    # rows with empty values are never equal to the switch values
+    candidates_df.dropna(subset=candidate_columns + ['switchWwn'], inplace=True)
+    if candidates_df.empty:
+        candidate_codes, candidate_keys = np.array([], dtype=np.int64), []
+    else:
+        candidate_codes, candidate_keys = pd.factorize(pd.MultiIndex.from_frame(candidates_df[candidate_columns + ['switchWwn']]))
+
+    fabric_candidates_dct = {}
+    for candidate_code, (*candidate_group, switch_wwn) in enumerate(candidate_keys):
+        fabric_candidates = fabric_candidates_dct.setdefault(candidate_group[0], {'groups': {}, 'codes': []})
+        fabric_candidates['groups'].setdefault(tuple(candidate_group), []).append((len(fabric_candidates['codes']), switch_wwn))
+        fabric_candidates['codes'].append(candidate_code)
+
+    return {'switch_rows': {switch_wwn: i for i, switch_wwn in enumerate(switch_wwns)},
+            'connected_device_numbers': connected_device_numbers,
+            'switch_device_matrix': switch_device_matrix,
+            'candidate_codes': candidate_codes, 'candidate_device_codes': candidates_df['device_code'].to_numpy(),
+            'candidate_number': len(candidate_keys), 'device_number': device_number,
+            'fabric_candidates': fabric_candidates_dct, 'fabric_match_matrices': {}}
+
+
+def incidence_matrix(row_codes, column_codes, shape, presence=True):
+    """Function returns sparse matrix with number of (row_code, column_code) pairs (or 1 if pair present).
+    If scipy is not installed then list with dictionary {column_code: number of pairs} 
+    (or set of column codes if presence is True) for each row is returned"""
+
+    if sparse is not None:
+        values = np.ones(len(row_codes), dtype=np.int64)
+        matrix = sparse.csr_matrix((values, (row_codes, column_codes)), shape=shape)
+        if presence:
+            matrix.data[:] = 1
+        return matrix
+    rows = [set() if presence else {} for _ in range(shape[0])]
+    for row_code, column_code in zip(row_codes.tolist(), column_codes.tolist()):
+        if presence:
+            rows[row_code].add(column_code)
+        else:
+            rows[row_code][column_code] = rows[row_code].get(column_code, 0) + 1
+    return rows
+
+
+def fabric_match_matrix(device_incidence, fabric_name):
+    """Function returns matrix with number of devices of each switch connected
+    to each candidate switch of the fabric_name (switches x fabric candidates).
+    Matrix is calculated with a single matrix product once for each fabric.
+    If scipy is not installed then list with device set of each fabric candidate is returned"""
+
+    fabric_match_matrices = device_incidence['fabric_match_matrices']
+    if not fabric_name in fabric_match_matrices:
+        fabric_codes = device_incidence['fabric_candidates'][fabric_name]['codes']
+        # fabric candidate numbers for all candidates (-1 for candidates of other fabrics)
+        fabric_positions = np.full(device_incidence['candidate_number'], -1)
+        fabric_positions[fabric_codes] = np.arange(len(fabric_codes))
+        fabric_rows = fabric_positions[device_incidence['candidate_codes']]
+        mask_fabric = fabric_rows >= 0
+        # devices connected to each candidate switch of the fabric
+        candidate_device_matrix = incidence_matrix(
+            fabric_rows[mask_fabric], device_incidence['candidate_device_codes'][mask_fabric],
+            (len(fabric_codes), device_incidence['device_number']))
+        if sparse is None:
+            fabric_match_matrices[fabric_name] = candidate_device_matrix
+        else:
+            match_matrix = device_incidence['switch_device_matrix'] @ candidate_device_matrix.T
+            fabric_match_matrices[fabric_name] = np.asarray(match_matrix.toarray())
+    return fabric_match_matrices[fabric_name]
+
+
+def candidate_device_match_numbers(device_incidence, fabric_name, switch_row, candidate_positions):
+    """Function returns number of devices of the switch (switch_row) connected 
+    to each candidate switch (candidate_positions) of the fabric_name"""
+
+    fabric_matrix = fabric_match_matrix(device_incidence, fabric_name)
+    if sparse is not None:
+        return fabric_matrix[switch_row, candidate_positions]
+    # number of ports of the switch devices connected to the candidate switch
+    switch_devices = device_incidence['switch_device_matrix'][switch_row]
+    return np.array([sum(switch_devices[device_code] for device_code in switch_devices.keys() & fabric_matrix[position]) 
+                        for position in candidate_positions], dtype=np.int64)
+
+
+def find_candidate_device_match(device_incidence, switch_sr, verified_label):
+    """Function returns wwns of the candidate pair switches with the same switchType and switchMode
+    within the same Fabric_name in verified Fabric_label and number of devices
+    of the switch_sr connected to each candidate"""
+
+    fabric_candidates = device_incidence['fabric_candidates'].get(switch_sr['Fabric_name'])
+    if fabric_candidates is None or switch_sr[['switchType', 'switchMode']].isna().any():
+        return [], np.array([], dtype=np.int64)
+    candidate_group = (switch_sr['Fabric_name'], verified_label, switch_sr['switchType'], switch_sr['switchMode'])
+    candidates_lst = fabric_candidates['groups'].get(candidate_group, [])
+    if not candidates_lst:
+        return [], np.array([], dtype=np.int64)
+    candidate_positions, sw_candidates_wwn_lst = map(list, zip(*candidates_lst))
+    switch_row = device_incidence['switch_rows'][switch_sr['switchWwn']]
+    device_match_numbers = candidate_device_match_numbers(device_incidence, switch_sr['Fabric_name'], switch_row, candidate_positions)
+    return sw_candidates_wwn_lst, device_match_numbers
@@ -1,12 +1,37 @@
-from difflib import SequenceMatcher
-
 import numpy as np
 import pandas as pd
-import re
 
+from .switchname_similarity import cache_fabric_switchname_ratios, top_switchname_matches
+
+
+def create_zero_device_switchname_candidates(switch_pair_df):
+    """Function to find pair switch candidates with zero device connected (and front, translate domains) 
+    for each Fabric_name, Fabric_label, switchType and switchMode. 
+    Match ratios of the switch names with candidate names are calculated for each Fabric_name"""
+
+    # pair switch candidates in verified fabric label with zero device connected with the same switchType and switchMode
+    mask_zero_device_connected = switch_pair_df['Connected_device_number'] == 0
+    mask_fd_xd = switch_pair_df['switchName'].str.contains(r'fcr_[fx]d_\d+', case=False, na=False)
+    mask_candidates = mask_zero_device_connected | mask_fd_xd
 
-def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_wwn_name_match_sr, sw_pair_columns, min_sw_name_match_ratio):
-    """Function to find highest match switchName for switches with no device connected"""
+    candidate_columns = ['Fabric_name', 'Fabric_label', 'switchType', 'switchMode']
+    sw_candidates_dct = {}
+    for *candidate_group, switch_name, switch_wwn in \
+        switch_pair_df.loc[mask_candidates, candidate_columns + ['switchName', 'switchWwn']].itertuples(index=False, name=None):
+        # candidates with empty values are never equal to the switch values
+        if any(pd.isna(value) for value in candidate_group):
+            continue
+        sw_candidates_name_lst, sw_candidates_wwn_lst = sw_candidates_dct.setdefault(tuple(candidate_group), ([], []))
+        sw_candidates_name_lst.append(switch_name)
+        sw_candidates_wwn_lst.append(switch_wwn)
+
+    cache_fabric_switchname_ratios(switch_pair_df, mask_candidates)
+    return {'labels': switch_pair_df['Fabric_label'].unique().tolist(), 'candidates': sw_candidates_dct}
+
+
+def find_zero_device_connected_switchname_match(switch_sr, sw_candidates_dct, sw_wwn_name_match_sr, sw_pair_columns, min_sw_name_match_ratio):
+    """Function to find highest match switchName for switches with no device connected.
+    Pair switch candidates are taken from sw_candidates_dct created for the switch pair DataFrame"""
     
     sw_pairing_type = 'switch_name'
 
@@ -14,8 +39,7 @@ def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_ww
         return pd.Series([switch_sr[column] for column in sw_pair_columns[3:7]])
     
     # list of fabric labels to verify (all fabric labels except fabric label of the switch being checked)
-    verified_label_lst = [fabric_label for fabric_label in 
-                          switch_pair_df['Fabric_label'].unique().tolist() 
+    verified_label_lst = [fabric_label for fabric_label in sw_candidates_dct['labels'] 
                           if fabric_label != switch_sr['Fabric_label']]
     # lists with names and wwnns of the pair switches
     sw_pair_wwn_final_lst = []
@@ -24,13 +48,8 @@ def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_ww
 
     for verified_label in verified_label_lst:
         # pair switch candidates in verified fabric label with zero device connected with the same switchType and switchMode
-        mask_zero_device_connected = switch_pair_df['Connected_device_number'] == 0
-        mask_fd_xd = switch_pair_df['switchName'].str.contains('fcr_[fx]d_\d+', case=False, na=False)
-        mask_same_fabric_name = switch_pair_df['Fabric_name'] == switch_sr['Fabric_name']
-        mask_verified_label = switch_pair_df['Fabric_label'] == verified_label
-        mask_same_sw_type_mode = (switch_pair_df[['switchType', 'switchMode']] == switch_sr[['switchType', 'switchMode']]).all(axis=1)
-        sw_candidates_name_lst = switch_pair_df.loc[(mask_zero_device_connected | mask_fd_xd) & mask_same_fabric_name & mask_verified_label & mask_same_sw_type_mode, 'switchName'].tolist()
-        sw_candidates_wwn_lst = switch_pair_df.loc[(mask_zero_device_connected | mask_fd_xd) & mask_same_fabric_name & mask_verified_label & mask_same_sw_type_mode, 'switchWwn'].tolist()
+        candidate_group = (switch_sr['Fabric_name'], verified_label, switch_sr['switchType'], switch_sr['switchMode'])
+        sw_candidates_name_lst, sw_candidates_wwn_lst = sw_candidates_dct['candidates'].get(candidate_group, ([], []))
         if sw_candidates_wwn_lst:
             # find switches with highest switchName match
             sw_pair_name_lst, sw_pair_wwn_lst = find_max_switchname_match(switch_sr['switchName'], sw_candidates_name_lst, sw_candidates_wwn_lst, sw_wwn_name_match_sr, min_sw_name_match_ratio)
@@ -53,17 +72,13 @@ def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_ww
 def find_max_switchname_match(switch_name, sw_pair_name_lst, sw_pair_wwn_lst, sw_wwn_name_match_sr, min_sw_name_match_ratio):
     """Auxiliary function to find switches in the sw_pair_name_lst which names have highest match with switch_name"""
     
-    # find highest name match ratio 
-    name_match_ratio_lst = [round(SequenceMatcher(None, switch_name, sw_pair_name).ratio(), 2) for sw_pair_name in sw_pair_name_lst]
-    max_name_match_ratio = max(name_match_ratio_lst)
+    # find indexes with the hisghest name match ratio 
+    max_idx_lst, name_match_ratios = top_switchname_matches(switch_name, sw_pair_name_lst)
     # hisghest name match ration should exceed min_sw_name_match_ratio
-    if max_name_match_ratio >= min_sw_name_match_ratio:
-        # find indexes with the hisghest name match ratio
-        max_idx_lst = [i for i, name_match_ration in enumerate(name_match_ratio_lst) if name_match_ration == max_name_match_ratio]
+    if name_match_ratios.max() >= min_sw_name_match_ratio:
         # choose switches with the highest name match ratio indexes
         sw_pair_wwn_lst = [sw_pair_wwn_lst[i] for i in max_idx_lst]
         sw_pair_name_lst = [sw_wwn_name_match_sr[wwn] for wwn in sw_pair_wwn_lst]
         return sw_pair_name_lst, sw_pair_wwn_lst
     else:
         return (None,)*2
-
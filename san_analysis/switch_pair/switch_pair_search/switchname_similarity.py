@@ -0,0 +1,59 @@
+"""Module to calculate switchName match ratios for the pair switch search.
+Ratios of the switch names within each Fabric_name are calculated in one batch
+and memoized for all pair search runs of the program (Brocade, front and translate domains, VC and Cisco)"""
+
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+# switchName match ratios calculated during program execution {(switch_name, candidate_name): ratio}
+switchname_ratio_cache = {}
+
+
+def cache_fabric_switchname_ratios(switch_pair_df, mask_candidates=None):
+    """Function calculates match ratios of all switch names with candidate switch names
+    (filtered with mask_candidates) within each Fabric_name of the switch_pair_df"""
+
+    if mask_candidates is None:
+        mask_candidates = pd.Series(True, index=switch_pair_df.index)
+    mask_name_notna = switch_pair_df['switchName'].notna()
+    for _, fabric_df in switch_pair_df.loc[mask_name_notna].groupby(by='Fabric_name'):
+        switch_names = fabric_df['switchName'].unique()
+        candidate_names = fabric_df.loc[mask_candidates.loc[fabric_df.index], 'switchName'].unique()
+        for candidate_name in candidate_names:
+            # SequenceMatcher caches information about the second sequence thus 
+            # single matcher is used for the candidate_name and all switch names
+            matcher = SequenceMatcher(None, b=candidate_name)
+            for switch_name in switch_names:
+                if not (switch_name, candidate_name) in switchname_ratio_cache:
+                    matcher.set_seq1(switch_name)
+                    switchname_ratio_cache[(switch_name, candidate_name)] = round(matcher.ratio(), 2)
+
+
+def switchname_ratios(switch_name, candidate_names):
+    """Function returns array of the rounded match ratios of the switch_name with each of candidate_names.
+    Ratios are calculated once for each pair of names"""
+
+    ratios = np.empty(len(candidate_names))
+    for i, candidate_name in enumerate(candidate_names):
+        ratio = switchname_ratio_cache.get((switch_name, candidate_name))
+        if ratio is None:
+            ratio = round(SequenceMatcher(None, switch_name, candidate_name).ratio(), 2)
+            switchname_ratio_cache[(switch_name, candidate_name)] = ratio
+        ratios[i] = ratio
+    return ratios
+
+
+def top_switchname_matches(switch_name, candidate_names, top_k=1):
+    """Function returns indexes of the candidate_names with top_k highest match ratios
+    with the switch_name (all candidates with the same ratio are included) and ratios of all candidates"""
+
+    ratios = switchname_ratios(switch_name, candidate_names)
+    if not len(ratios):
+        return [], ratios
+    top_ratios = np.unique(ratios)[-top_k:]
+    top_idx_lst = np.flatnonzero(np.isin(ratios, top_ratios))
+    # indexes in order of decreasing ratio and order of appearance for the same ratio
+    top_idx_lst = sorted(top_idx_lst, key=lambda i: -ratios[i])
+    return top_idx_lst, ratios
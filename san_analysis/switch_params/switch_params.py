@@ -10,10 +10,12 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .switch_aggregation import switch_param_aggregation
 
 
+@prof.profile_step('analysis')
 def switch_params_analysis(fabricshow_ag_labels_df, chassis_params_df, chassisshow_df,
                                 switch_params_df, maps_params_df, blade_module_loc_df, ag_principal_df, project_constants_lst):
     """Main function to create aggregated switch parameters table and report tables"""
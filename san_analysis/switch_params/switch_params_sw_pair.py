@@ -9,10 +9,12 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .switch_statistics import fabric_switch_statistics
 
 
+@prof.profile_step('analysis')
 def switch_params_sw_pair_update(switch_params_aggregated_df, switch_pair_df, project_constants_lst):
     """Main function add switch pair id information to switch parameters DataFrame"""
     
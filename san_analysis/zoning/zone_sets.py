@@ -0,0 +1,100 @@
+"""Module to find zones with the same or bigger set of members (duplicated and absorber zones).
+Zones of each fabric are numbered in order of appearance. Each zone member is presented
+as a bitset of the zone numbers the member is in. Zones containing all members of the verified zone
+are found with the bitwise AND of the members bitsets"""
+
+from bisect import bisect_right
+
+import pandas as pd
+
+
+def join_zone_members(zoning_df, group_columns, member_column='PortName'):
+    """Function returns DataFrame with sorted unique members of each zone
+    presented as comma separated string. Zones with identical strings are duplicated zones"""
+
+    zone_members_df = zoning_df[group_columns + [member_column]].dropna(subset=[member_column]).drop_duplicates()
+    zone_members_df = zone_members_df.sort_values(by=member_column)
+    return zone_members_df.groupby(by=group_columns)[member_column].agg(', '.join).reset_index()
+
+
+def find_zone_supersets(verified_df, candidate_df, group_columns, member_column='PortName', size_column='Portname_quantity'):
+    """Function to find zones in candidate_df which contain all members of the zone in verified_df
+    and have bigger size_column value. Zones are compared within the same fabric.
+    Returns DataFrame with group_columns of the verified zones and 'zone_superset' column
+    with comma separated superset zone names (in order of appearance in candidate_df)"""
+
+    fabric_index_dct = create_fabric_zone_index(candidate_df, group_columns, member_column, size_column)
+    verified_zones_dct = collect_zones(verified_df, group_columns, member_column, size_column)
+
+    zone_superset_lst = []
+    for (*fabric_key, zone), (members, size) in verified_zones_dct.items():
+        fabric_index = fabric_index_dct.get(tuple(fabric_key))
+        zone_superset = find_superset(fabric_index, members, size) if fabric_index else None
+        zone_superset_lst.append([*fabric_key, zone, zone_superset])
+    zone_superset_df = pd.DataFrame(zone_superset_lst, columns=group_columns + ['zone_superset'])
+    # zones are in the same order as groups after groupby
+    return zone_superset_df.sort_values(by=group_columns, ignore_index=True)
+
+
+def collect_zones(zoning_df, group_columns, member_column, size_column):
+    """Function returns members set and size of each zone in zoning_df
+    {(fabric_name, fabric_label, zone): (members set, size)}.
+    Zones with empty group values are dropped (same as groupby)"""
+
+    zones_dct = {}
+    for *zone_key, member, size in zoning_df[group_columns + [member_column, size_column]].itertuples(index=False, name=None):
+        if any(pd.isna(value) for value in zone_key):
+            continue
+        zone_key = tuple(zone_key)
+        if not zone_key in zones_dct:
+            zones_dct[zone_key] = (set(), size)
+        # empty members are presented with None
+        zones_dct[zone_key][0].add(None if pd.isna(member) else member)
+    return zones_dct
+
+
+def create_fabric_zone_index(zoning_df, group_columns, member_column, size_column):
+    """Function creates zones index for each fabric in zoning_df.
+    Index contains zone names in order of appearance, bitsets of the zones for each member
+    and bitsets of the zones bigger than each zone size"""
+
+    fabric_index_dct = {}
+    for (*fabric_key, zone), (members, size) in collect_zones(zoning_df, group_columns, member_column, size_column).items():
+        fabric_index = fabric_index_dct.setdefault(tuple(fabric_key), {'zones': [], 'members': {}, 'sizes': {}})
+        zone_bit = 1 << len(fabric_index['zones'])
+        fabric_index['zones'].append(zone)
+        for member in members:
+            fabric_index['members'][member] = fabric_index['members'].get(member, 0) | zone_bit
+        fabric_index['sizes'][size] = fabric_index['sizes'].get(size, 0) | zone_bit
+
+    for fabric_index in fabric_index_dct.values():
+        # bitsets of the zones with size bigger or equal than each size
+        sizes_lst = sorted(fabric_index['sizes'])
+        size_bitsets_lst = [0] * (len(sizes_lst) + 1)
+        for i in range(len(sizes_lst) - 1, -1, -1):
+            size_bitsets_lst[i] = size_bitsets_lst[i+1] | fabric_index['sizes'][sizes_lst[i]]
+        fabric_index['sizes'] = sizes_lst
+        fabric_index['size_bitsets'] = size_bitsets_lst
+    return fabric_index_dct
+
+
+def find_superset(fabric_index, members, size):
+    """Function returns comma separated names of the zones from the fabric_index
+    which contain all members and have size bigger than size"""
+
+    # zones bigger than verified zone
+    zones_bitset = fabric_index['size_bitsets'][bisect_right(fabric_index['sizes'], size)]
+    # zones with all members of verified zone
+    for member in members:
+        if not zones_bitset:
+            break
+        zones_bitset &= fabric_index['members'].get(member, 0)
+    if not zones_bitset:
+        return None
+
+    zones_lst = []
+    while zones_bitset:
+        zone_bit = zones_bitset & -zones_bitset
+        zones_lst.append(fabric_index['zones'][zone_bit.bit_length() - 1])
+        zones_bitset ^= zone_bit
+    return ', '.join(zones_lst)
@@ -5,6 +5,7 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
 from .report_zoning import zoning_report_main
 from .zoning_aggregation import verify_cfg_type, zoning_aggregated
@@ -13,6 +14,7 @@ from .zoning_cfg_dashboard import cfg_dashborad
 from .zoning_statistics import zonemember_statistics
 
 
+@prof.profile_step('analysis')
 def zoning_analysis(switch_params_aggregated_df, portshow_aggregated_df, 
                             cfg_df, zone_df, alias_df, cfg_effective_df, 
                             fcrfabric_df, lsan_df, peerzone_df, 
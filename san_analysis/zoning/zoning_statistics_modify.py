@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 import utilities.dataframe_operations as dfop
 
+from .zone_sets import find_zone_supersets, join_zone_members
+
 
 def modify_zoning(zoning_aggregated_df):
     """Function to modify zoning_aggregated_df DataFrame to count statistics"""
@@ -104,9 +106,7 @@ def verify_duplicated_zones(zoning_aggregated_df):
     
     # group PortWwns of each zone to sorted set thus removing duplicates and present it as comma separated list
     grp_columns = columns + ['zone']
-    zoning_grp_df = zoning_cp_df.groupby(by=grp_columns)['PortName'].agg(lambda x: ', '.join(sorted(set(x))))
-    zoning_grp_df = pd.DataFrame(zoning_grp_df)
-    zoning_grp_df.reset_index(inplace=True)
+    zoning_grp_df = join_zone_members(zoning_cp_df, grp_columns)
 
     grp_columns = columns + ['PortName']
     # filter duplicated zones only (zones with equal set of PortWwns for each Fabric)
@@ -136,14 +136,11 @@ def verify_absorbed_zones(zoning_aggregated_df):
     # zone configuration in which absorber zones are searched for (effective only)
     zoning_valid_df = zoning_verified_df.loc[mask_effective].copy()
     # find obsorbed and absorber zones
-    zoning_absorbed_df  = \
-        zoning_verified_df.groupby(by=group_columns).apply(lambda verified_zone_grp: find_zone_absorber(verified_zone_grp, zoning_valid_df))
+    zoning_absorbed_df = find_zone_supersets(zoning_verified_df, zoning_valid_df, group_columns)
     
-    zoning_absorbed_df = pd.DataFrame(zoning_absorbed_df)
     if not zoning_absorbed_df.empty:
-        zoning_absorbed_df.reset_index(inplace=True)
         # rename column with absorber zone names
-        zoning_absorbed_df.rename(columns={0: 'zone_absorber'}, inplace=True)
+        zoning_absorbed_df.rename(columns={'zone_superset': 'zone_absorber'}, inplace=True)
         # drop rows if there is no zone absorber found
         zoning_absorbed_df.dropna(subset=['zone_absorber'], inplace=True)
         zoning_absorbed_df['zone_duplicates_free'] = zoning_absorbed_df['zone']
@@ -151,35 +148,6 @@ def verify_absorbed_zones(zoning_aggregated_df):
     return zoning_absorbed_df
 
 
-
-def find_zone_absorber(verified_zone_grp, zoning_valid_df):
-    """Auxiliary function for verify_absorbed_zones fn 
-    to find zones in effective configuration which contain same active portWwns as verified zones.
-    Zones with identical set of portWwns (duplicated zones) as verified zone are not taken into account"""
-
-    group_columns = ['Fabric_name', 'Fabric_label', 'zone']
-
-    # identify fabric name, label of the verified zone to filter off zones from other fabrics
-    verified_zone_fb,  = verified_zone_grp['Fabric_name'].unique()
-    verified_zone_fl,  = verified_zone_grp['Fabric_label'].unique()
-    # identify active port quantity to filter off zones of the same size or smaller
-    verified_zone_port_quntity,  = verified_zone_grp['Portname_quantity'].unique()
-    # slice zoning configuration to reduce process time
-    mask_same_fabic = (zoning_valid_df['Fabric_name'] == verified_zone_fb) & \
-                        (zoning_valid_df['Fabric_label'] == verified_zone_fl)
-    mask_bigger_zone = zoning_valid_df['Portname_quantity'] > verified_zone_port_quntity
-    zoning_valid_fabric_df = zoning_valid_df.loc[mask_same_fabic & mask_bigger_zone].copy()
-    
-    # find zones which include (absorbe) current verified zone
-    absorbed_zone_df = \
-        zoning_valid_fabric_df.groupby(by=group_columns).filter(lambda valid_zone_grp: verified_zone_grp['PortName'].isin(valid_zone_grp['PortName']).all())
-    # represent zones as comma separated string
-    if not absorbed_zone_df.empty:
-        zone_sr = absorbed_zone_df['zone'].drop_duplicates()
-        zones_str = ', '.join(zone_sr.to_list())
-        return zones_str 
-
-
 def verify_tdz(zoning_modified_df):
     """Function to find target driven zones zones"""
     
@@ -11,6 +11,7 @@ import san_switch_config
 import san_topology
 import utilities.dataframe_operations as dfop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 from service_init import service_initialization
 
 
@@ -29,6 +30,8 @@ def main():
     # create san topology in Visio
     san_topology.visualize_san_topology(analyzed_configuration_lst, project_constants_lst, software_path_sr, 
                                         san_graph_grid_df, san_topology_constantants_sr)
+    # save program steps timing to the run log if profiling is on
+    prof.save_run_log(project_constants_lst[1])
     print("\nExecution successfully finished\n")
 
 
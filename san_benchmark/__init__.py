@@ -0,0 +1,2 @@
+# san_benchmark package generates synthetic SAN configuration files and measures parser and analysis performance
+from .benchmark import run_benchmark
@@ -0,0 +1,175 @@
+"""Module to run parser and analysis benchmark on the synthetic SAN of different sizes.
+Each SAN size is processed in a separate process (module caches and process memory high-water mark are not shared between sizes).
+Step records of each run are saved to the run log by step_profiling module and collected
+to the benchmark summary with wall time, cpu time, process memory high-water mark and row counts of each stage and step.
+Summary of the previous benchmark can be passed as baseline to compare runs"""
+
+
+import builtins
+import json
+import multiprocessing
+import os
+from datetime import datetime
+
+import pandas as pd
+
+import san_analysis
+import san_parser
+import utilities.step_profiling as prof
+from service_init.requisites_import import import_service_dataframes
+from service_init.service_init import create_service_folders
+
+from .sshow_generator import SAN_PARAMS, generate_san
+
+# report_requisites of the benchmark projects (storage and blade system folders are not used)
+REQUISITES_NAMES = ['customer_name', 'date', 'project_title', 'project_folder', 'supportsave_folder',
+                    'blade_showall_folder', 'synergy_meddler_folder', '3par_inserv_folder', 'huawei_oceanstor_folder',
+                    'switch_nsshow_folder', 'sfp_write', 'sshow_export_folder', 'other_export_folder',
+                    'today_report_folder', 'database_folder', 'device_rack_path']
+SUMMARY_KEY_COLUMNS = ['switch_count', 'step_type', 'step']
+SUMMARY_VALUE_COLUMNS = ['calls', 'wall_s', 'cpu_s', 'process_max_rss_mb', 'input_rows', 'output_rows']
+
+
+def run_benchmark(benchmark_folder, switch_counts, ports_per_switch=48, logins_per_port=2, zones_per_fabric=500,
+                    vf_contexts=1, switches_per_fabric=50, errdump_messages=100, seed=1,
+                    parser_workers=None, analysis_workers=None, baseline_file=None):
+    """Function to run benchmark for each number of switches in switch_counts.
+    Returns benchmark summary DataFrame (summary is saved to the benchmark_folder)"""
+
+    os.makedirs(benchmark_folder, exist_ok=True)
+    run_log_files = {}
+    # spawned process starts with clean module caches
+    context = multiprocessing.get_context('spawn')
+    for switch_count in switch_counts:
+        san_params = {'switch_count': switch_count, 'ports_per_switch': ports_per_switch, 'logins_per_port': logins_per_port,
+                        'zones_per_fabric': zones_per_fabric, 'vf_contexts': vf_contexts,
+                        'switches_per_fabric': switches_per_fabric, 'errdump_messages': errdump_messages, 'seed': seed}
+        run_folder = os.path.join(benchmark_folder, f'san_{switch_count}')
+        queue = context.Queue()
+        process = context.Process(target=benchmark_process, name=f'benchmark_{switch_count}',
+                                    args=(run_folder, san_params, parser_workers, analysis_workers, queue))
+        print(f"\n\nBENCHMARK. {switch_count} SWITCHES\n")
+        process.start()
+        run_log_file = queue.get()
+        process.join()
+        if process.exitcode or run_log_file is None:
+            print(f'\nBenchmark of {switch_count} switches failed\n')
+            continue
+        run_log_files[switch_count] = run_log_file
+
+    summary_df = benchmark_summary(run_log_files)
+    if baseline_file:
+        summary_df = compare_with_baseline(summary_df, baseline_file)
+    summary_file = os.path.join(benchmark_folder, f"benchmark_summary_{datetime.now().strftime('%d%m%Y_%H%M%S')}.csv")
+    summary_df.to_csv(summary_file, index=False)
+    print(f'\nBenchmark summary saved to {summary_file}\n')
+    return summary_df
+
+
+def benchmark_process(run_folder, san_params, parser_workers, analysis_workers, queue):
+    """Function to generate SAN configuration files (if they are absent or created with other parameters),
+    extract and analyze configuration data in the new project folder.
+    Run log filepath is put to the queue (None if run failed)"""
+
+    run_log_file = None
+    try:
+        all_config_data = san_configuration_files(os.path.join(run_folder, 'sshow'), san_params)
+        run_log_file = run_project(run_folder, all_config_data, san_params['switch_count'],
+                                    parser_workers, analysis_workers)
+    finally:
+        queue.put(run_log_file)
+
+
+def san_configuration_files(san_folder, san_params):
+    """Function returns configuration data list of the SAN.
+    Files are generated only if SAN parameters are changed since the last generation"""
+
+    params_file = os.path.join(san_folder, 'san_params.json')
+    if os.path.isfile(params_file):
+        with open(params_file, encoding='utf-8') as file:
+            saved_params = json.load(file)
+        if saved_params.get('san_params') == san_params:
+            return saved_params['all_config_data']
+
+    print('Generating supportshow files', end=' ')
+    all_config_data = generate_san(san_folder, **{param: san_params[param] for param in SAN_PARAMS})
+    print(f'{len(all_config_data)} chassis')
+    with open(params_file, 'w', encoding='utf-8') as file:
+        json.dump({'san_params': san_params, 'all_config_data': all_config_data}, file, indent=1)
+    return all_config_data
+
+
+def run_project(run_folder, all_config_data, switch_count, parser_workers, analysis_workers):
+    """Function to extract and analyze SAN configuration in the run_folder project (database is recreated on each run).
+    Interactive requests are answered 'no' (manual corrections are not applied).
+    Returns run log csv filepath"""
+
+    customer_name = f'benchmark_{switch_count}'
+    project_folder = os.path.join(run_folder, f"project_{datetime.now().strftime('%d%m%Y_%H%M%S')}")
+    os.makedirs(project_folder, exist_ok=True)
+    max_title = max(len(os.path.basename(sshow_file)) for _, sshow_file, _ in all_config_data)
+
+    report_requisites_dct = dict.fromkeys(REQUISITES_NAMES)
+    report_requisites_dct.update({'customer_name': customer_name, 'project_title': 'SAN_Benchmark',
+                                    'project_folder': project_folder,
+                                    'supportsave_folder': os.path.dirname(all_config_data[0][1]),
+                                    'profiling': 'yes', 'parser_workers': parser_workers,
+                                    'analysis_workers': analysis_workers})
+    # series is created with all names at once (series enlargement replaces None values with nan)
+    report_requisites_sr = pd.Series(report_requisites_dct, dtype='object')
+    create_service_folders(report_requisites_sr, max_title)
+    prof.init_profiling(report_requisites_sr)
+
+    project_steps_df, io_data_names_df, report_headers_df, software_path_sr, *_ = import_service_dataframes(max_title)
+    project_constants_lst = [project_steps_df, max_title, io_data_names_df, report_requisites_sr, report_headers_df]
+
+    input_fn = builtins.input
+    builtins.input = answer_no
+    try:
+        extracted_configuration_lst = san_parser.system_configuration_extract(all_config_data, project_constants_lst, software_path_sr)
+        san_analysis.system_configuration_analysis(extracted_configuration_lst, project_constants_lst)
+    finally:
+        builtins.input = input_fn
+    prof.save_run_log(max_title)
+    return prof.run_log_filepath('csv')
+
+
+def answer_no(prompt=''):
+    """Function replaces user input. All interactive requests are answered 'no'"""
+
+    print(prompt + 'n')
+    return 'n'
+
+
+def benchmark_summary(run_log_files):
+    """Function returns summary of the stage, step and switch records for each number of switches.
+    Switch records are summarized per step (total time of the switch configurations extraction)"""
+
+    summary_lst = []
+    for switch_count, run_log_file in run_log_files.items():
+        run_log_df = pd.read_csv(run_log_file)
+        run_log_df['switch_count'] = switch_count
+        summary_df = run_log_df.groupby(by=SUMMARY_KEY_COLUMNS, sort=False).agg(
+            calls=('step', 'size'), wall_s=('wall_s', 'sum'), cpu_s=('cpu_s', 'sum'),
+            process_max_rss_mb=('process_max_rss_mb', 'max'), input_rows=('input_rows', 'sum'), output_rows=('output_rows', 'sum'))
+        summary_lst.append(summary_df.reset_index())
+    if not summary_lst:
+        return pd.DataFrame(columns=SUMMARY_KEY_COLUMNS + SUMMARY_VALUE_COLUMNS)
+    summary_df = pd.concat(summary_lst, ignore_index=True)
+    summary_df[['wall_s', 'cpu_s']] = summary_df[['wall_s', 'cpu_s']].round(4)
+    return summary_df
+
+
+def compare_with_baseline(summary_df, baseline_file):
+    """Function adds baseline wall time, cpu time and process memory high-water mark of the same number of switches and step
+    to the summary_df and ratio of the current value to the baseline value"""
+
+    baseline_df = pd.read_csv(baseline_file)
+    compared_columns = ['wall_s', 'cpu_s', 'process_max_rss_mb']
+    baseline_df = baseline_df[SUMMARY_KEY_COLUMNS + compared_columns].rename(
+        columns={column: 'baseline_' + column for column in compared_columns})
+    summary_df = summary_df.merge(baseline_df, how='left', on=SUMMARY_KEY_COLUMNS)
+    for column in compared_columns:
+        baseline_sr = summary_df['baseline_' + column].where(summary_df['baseline_' + column] > 0)
+        summary_df[column + '_ratio'] = (summary_df[column] / baseline_sr).round(3)
+    return summary_df
@@ -0,0 +1,752 @@
+"""Module to generate synthetic supportshow files of the SAN for the parser and analysis benchmark.
+Each chassis configuration file contains sections in the format expected by san_parser regular expressions
+(configshow, switchshow, fabricshow, islshow, trunkshow, lsdbshow, fdmishow, nsshow, cfgshow, sfpshow, portcfgshow,
+portshow/portloginshow/portstatsshow, sensorshow, errdump). Switch command sections are written
+for each logical switch context. SAN is generated from the seed thus it's the same on each run.
+
+SAN consists of A and B fabrics (even and odd chassis). Switches of each fabric are connected in a tree
+with the principal switch in the root. Device ports with the same port number of the paired chassis
+are connected to the same host or storage. Each device port logs in with the physical port and NPIV ports"""
+
+
+import math
+import os
+import random
+
+
+# parameters of the generated SAN. all switch configuration files are regenerated if any parameter is changed
+SAN_PARAMS = ['switch_count', 'ports_per_switch', 'logins_per_port', 'zones_per_fabric',
+                'vf_contexts', 'switches_per_fabric', 'errdump_messages', 'seed']
+# number of child switches connected to each switch in fabric tree
+FABRIC_TREE_FANOUT = 4
+# every STORAGE_PORT_STEP device port is storage port, every OFFLINE_PORT_STEP port has no sfp
+STORAGE_PORT_STEP = 8
+OFFLINE_PORT_STEP = 10
+# switchType of fixed port switches by maximum number of chassis ports
+SWITCH_TYPES = [(24, '170.0'), (48, '162.0'), (128, '173.0')]
+DIRECTOR_SWITCH_TYPE = '166.0'
+FOS_VERSION = 'v9.1.1b'
+COMMAND_END = 'real 0m0.091s'
+
+SENSOR_LINES = ['sensor  1: (Temperature) is Ok, value is 36 C',
+                'sensor  2: (Temperature) is Ok, value is 41 C',
+                'sensor  3: (Fan        ) is Ok,speed is 8200 RPM',
+                'sensor  4: (Fan        ) is Ok,speed is 8150 RPM',
+                'sensor  5: (Power Supply) is Ok',
+                'sensor  6: (Power Supply) is Ok']
+ERRDUMP_MESSAGES = [
+    ('ZONE-1022', 'INFO', 'The effective configuration has changed to {cfg}.'),
+    ('C3-1014', 'WARNING', 'Link Reset on Port S0,P{port}({port}) vc_no=0 crd(s)lost=3 auto trigger.'),
+    ('MAPS-1003', 'WARNING', 'F-Port {port}, Condition=ALL_HOST_PORTS(CRC/MIN>0), Current Value:[CRC, 2 Errors], '
+                                'RuleName=defALL_HOST_PORTSCRC_0, Dashboard Category=Port Health.'),
+    ('FW-1424', 'WARNING', 'Switch status changed from HEALTHY to MARGINAL.'),
+    ('AN-1010', 'WARNING', 'Severe latency bottleneck detected at F-Port {port}.'),
+    ('AN-1004', 'WARNING', 'Frame timeout detected, tx port {port} rx port -1, sid 0{domain:02x}0500, did 0{domain:02x}0800, '
+                            'timestamp 2026-03-02 11:20:57.'),
+    ('SNMP-1005', 'INFO', 'SNMP configuration attribute, Trap Severity Level, has changed from 0 to 1.'),
+    ('PORT-1003', 'WARNING', 'Port {port} Faulted because of many Link Failures.'),
+    ('SEC-1203', 'INFO', 'Login information: Login successful via TELNET/SSH/RSH. IP Addr: 10.10.1.5.')]
+
+
+def generate_san(san_folder, switch_count, ports_per_switch, logins_per_port, zones_per_fabric,
+                    vf_contexts=1, switches_per_fabric=50, errdump_messages=100, seed=1):
+    """Function to create supportshow file of each chassis of the synthetic SAN in san_folder.
+    switch_count is a number of logical switches (vf_contexts logical switches in each chassis).
+    Returns configuration data list in the san_switch_config format [[chassis_name, sshow_file, ams_maps_files], ...]"""
+
+    san_params = locals().copy()
+    del san_params['san_folder']
+    san_dct = create_san_topology(**san_params)
+    os.makedirs(san_folder, exist_ok=True)
+
+    all_config_data = []
+    for chassis_dct in san_dct['chassis']:
+        sshow_file = os.path.join(san_folder, f"{chassis_dct['name']}-S0cp-SSHOW_SYS.txt")
+        with open(sshow_file, 'w', encoding='utf-8') as file:
+            file.writelines(line + '\n' for line in chassis_sshow_lines(chassis_dct, san_dct))
+        all_config_data.append([chassis_dct['name'], sshow_file, None])
+    return all_config_data
+
+
+def create_san_topology(switch_count, ports_per_switch, logins_per_port, zones_per_fabric,
+                        vf_contexts, switches_per_fabric, errdump_messages, seed):
+    """Function returns SAN description (chassis with logical switches, fabrics and zoning).
+    Logical switch with the same context index and position in the A and B fabrics
+    (neighbouring chassis) are switch pair with the same devices connected"""
+
+    rnd = random.Random(seed)
+    vf_contexts = max(1, vf_contexts)
+    isl_ports_reserved = FABRIC_TREE_FANOUT + 1
+    if ports_per_switch <= isl_ports_reserved:
+        raise ValueError(f'Number of ports per switch should be more than {isl_ports_reserved}')
+    ports_per_chassis = ports_per_switch * vf_contexts
+    switch_type = next((switch_type for max_ports, switch_type in SWITCH_TYPES if ports_per_chassis <= max_ports),
+                        DIRECTOR_SWITCH_TYPE)
+
+    chassis_lst = []
+    fabric_dct = {}
+    for chassis_number in range(math.ceil(switch_count / vf_contexts)):
+        label = 'A' if chassis_number % 2 == 0 else 'B'
+        pair_number = chassis_number // 2
+        fabric_group = pair_number // switches_per_fabric + 1
+        chassis_name = f'ch_{label.lower()}{fabric_group}_{pair_number+1:03}' if vf_contexts > 1 \
+                            else f'sw_{label.lower()}{fabric_group}_{pair_number+1:03}'
+        chassis_dct = {'name': chassis_name, 'number': chassis_number, 'label': label, 'vf': vf_contexts > 1,
+                        'wwn': wwn('10:00:c4:f5:7c', chassis_number * 16 + 15), 'switch_type': switch_type,
+                        'ports_number': ports_per_chassis, 'switches': [], 'errdump_number': errdump_messages}
+        contexts_number = min(vf_contexts, switch_count - chassis_number * vf_contexts)
+        for switch_index in range(contexts_number):
+            fid = (128 if switch_index == 0 else switch_index) if chassis_dct['vf'] else 128
+            fabric_key = (label, fabric_group, fid)
+            fabric = fabric_dct.setdefault(fabric_key, {'label': label, 'fid': fid, 'switches': [],
+                                                        'name': f'fabric_{label.lower()}{fabric_group}_{fid}'})
+            position = len(fabric['switches'])
+            switch_name = f'sw_{label.lower()}{fabric_group}_{switch_index}_{pair_number+1:03}' if chassis_dct['vf'] \
+                                else chassis_name
+            switch_dct = {'name': switch_name, 'index': switch_index, 'fid': fid, 'chassis': chassis_dct, 'fabric': fabric,
+                            'position': position, 'domain': position + 1, 'pair_number': pair_number,
+                            'wwn': wwn('10:00:c4:f5:7c', chassis_number * 16 + switch_index),
+                            'port_indexes': list(range(switch_index * ports_per_switch, (switch_index + 1) * ports_per_switch)),
+                            'ports': {}, 'isl': []}
+            fabric['switches'].append(switch_dct)
+            chassis_dct['switches'].append(switch_dct)
+        chassis_lst.append(chassis_dct)
+
+    for fabric in fabric_dct.values():
+        connect_fabric_switches(fabric)
+        for switch_dct in fabric['switches']:
+            connect_devices(switch_dct, logins_per_port, rnd)
+        fabric['zoning'] = create_fabric_zoning(fabric, zones_per_fabric)
+    return {'chassis': chassis_lst, 'fabrics': list(fabric_dct.values())}
+
+
+def wwn(prefix, number):
+    """Function returns wwn with the prefix octets and number in the remaining octets"""
+
+    octets_number = 8 - len(prefix.split(':'))
+    number_octets = [f'{(number >> 8 * i) & 0xff:02x}' for i in range(octets_number - 1, -1, -1)]
+    return ':'.join([prefix, *number_octets])
+
+
+def connect_fabric_switches(fabric):
+    """Function to connect fabric switches in a tree with principal switch in the root.
+    Last port of each switch is connected to the parent switch,
+    previous ports are connected to the child switches"""
+
+    for switch_dct in fabric['switches'][1:]:
+        parent_dct = fabric['switches'][(switch_dct['position'] - 1) // FABRIC_TREE_FANOUT]
+        child_number = (switch_dct['position'] - 1) % FABRIC_TREE_FANOUT
+        port_index = switch_dct['port_indexes'][-1]
+        parent_port_index = parent_dct['port_indexes'][-2 - child_number]
+        for local_dct, local_port, remote_dct, remote_port in [(switch_dct, port_index, parent_dct, parent_port_index),
+                                                                (parent_dct, parent_port_index, switch_dct, port_index)]:
+            local_dct['ports'][local_port] = {'type': 'E-Port', 'remote_switch': remote_dct, 'remote_port': remote_port}
+            local_dct['isl'].append((local_port, remote_dct, remote_port))
+    for switch_dct in fabric['switches']:
+        switch_dct['isl'].sort(key=lambda isl: isl[0])
+
+
+def connect_devices(switch_dct, logins_per_port, rnd):
+    """Function to connect host and storage ports to the switch ports which are not reserved for ISLs.
+    Devices are identified with pair_number, switch index and port number
+    thus A and B fabric switches of the switch pair have ports of the same devices connected"""
+
+    label_bit = 0 if switch_dct['fabric']['label'] == 'A' else 1
+    device_ports = switch_dct['port_indexes'][:-(FABRIC_TREE_FANOUT + 1)]
+    for port_number, port_index in enumerate(device_ports):
+        if port_number % OFFLINE_PORT_STEP == OFFLINE_PORT_STEP - 1:
+            switch_dct['ports'][port_index] = {'type': None}
+            continue
+        device_number = (switch_dct['pair_number'] * 16 + switch_dct['index']) * 256 + port_number
+        port_id = f"{switch_dct['domain']:02x}{port_index % 256:02x}00"
+        if port_number % STORAGE_PORT_STEP == 0:
+            system_number = device_number // 256
+            serial = f'4UW{system_number:07}'
+            device_dct = {'class': 'STORAGE', 'name': f'3par_{system_number:04}',
+                            'wwpn': wwn(f'2{label_bit + 1}:{port_number % 4 + 1:02x}:00:02:ac', device_number),
+                            'wwnn': wwn('2f:f7:00:02:ac', system_number),
+                            'node_symb': f'HPE_3PAR 8440 - {serial} - fw:3310',
+                            'port_symb': f'{serial} - {label_bit}:{port_number % 4 + 1}:{port_number % 2 + 1} - LPE32004',
+                            'logins': [(port_id, None)]}
+        else:
+            host_name = f'srv{device_number:07}'
+            device_dct = {'class': 'SRV', 'name': host_name,
+                            'wwpn': wwn('10:00:00:10:9b', device_number * 2 + label_bit),
+                            'wwnn': wwn('20:00:00:10:9b', device_number * 2 + label_bit),
+                            'node_symb': f'Emulex LPe32002-M2 FV12.8.340.10 DV12.8.340.10 HN:{host_name} OS:Linux',
+                            'port_symb': f'Emulex PPN-{wwn("10:00:00:10:9b", device_number * 2 + label_bit)}',
+                            'serial': f'FC{rnd.randrange(10**9):09}'}
+            # physical port and NPIV logins of the virtual machines
+            device_dct['logins'] = [(port_id, None)] + \
+                [(f'{port_id[:4]}{npiv_number:02x}', wwn('c0:50:76:0a', (device_number * 2 + label_bit) * 256 + npiv_number))
+                    for npiv_number in range(1, logins_per_port)]
+        switch_dct['ports'][port_index] = {'type': 'F-Port', 'device': device_dct}
+    # ports reserved for ISLs without connected switch
+    for port_index in switch_dct['port_indexes']:
+        switch_dct['ports'].setdefault(port_index, {'type': None})
+
+
+def create_fabric_zoning(fabric, zones_per_fabric):
+    """Function to create zoning configuration of the fabric.
+    Each zone contains host port alias and storage port alias connected to the same switch"""
+
+    hosts_lst = []
+    storages_lst = []
+    for switch_dct in fabric['switches']:
+        switch_storages = []
+        for port_dct in switch_dct['ports'].values():
+            device_dct = port_dct.get('device')
+            if device_dct:
+                alias = f"{device_dct['name']}_{device_dct['wwpn'][-5:].replace(':', '')}"
+                (switch_storages if device_dct['class'] == 'STORAGE' else hosts_lst).append((alias, device_dct['wwpn'], switch_storages))
+        storages_lst.extend(switch_storages)
+
+    zones_lst = []
+    if hosts_lst and storages_lst:
+        for zone_number in range(zones_per_fabric):
+            host_alias, _, switch_storages = hosts_lst[zone_number % len(hosts_lst)]
+            storages = switch_storages or storages_lst
+            storage_alias, *_ = storages[(zone_number // len(hosts_lst)) % len(storages)]
+            zones_lst.append((f'z_{host_alias}_{storage_alias}_{zone_number}', [host_alias, storage_alias]))
+    aliases_lst = [(alias, port_wwn) for alias, port_wwn, _ in hosts_lst + storages_lst]
+    return {'cfg': f"cfg_{fabric['name']}", 'zones': zones_lst, 'aliases': aliases_lst}
+
+
+def chassis_sshow_lines(chassis_dct, san_dct):
+    """Function returns lines of the chassis supportshow file"""
+
+    lines = []
+    lines.extend(configshow_lines(chassis_dct))
+    lines.extend(chassis_state_lines(chassis_dct))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/bin/switchshow :', switchshow_lines))
+    lines.extend(chassisshow_lines(chassis_dct))
+    lines.extend(['SWITCHCMD /fabos/cliexec/sensorshow :', *SENSOR_LINES, COMMAND_END])
+    lines.extend(errdump_lines(chassis_dct))
+    # fabric section. contexts of the logical switches are listed before dom command
+    lines.append('| Section: SSHOW_FABRIC |')
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/fabricshow :', fabricshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/ms agshow --all :', lambda switch_dct: []))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/dom :',
+                                        lambda switch_dct: [f"Domain: {switch_dct['domain']}"]))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/islshow :', islshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/trunkshow :', trunkshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/link_sbin/porttrunkarea --show enabled :',
+                                        lambda switch_dct: ['No ports have Trunk Area enabled']))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/lsdbshow -1 :', lsdbshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/fdmishow :', fdmishow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/nsshow -r :', nsshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/nscamshow -t :',
+                                        lambda switch_dct: ['nscam show for remote switches:', 'No entry found!']))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/ns portshow :', nsportshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/cfgshow :', cfgshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/zoneshow --peerzone all :',
+                                        lambda switch_dct: ['No peer zones found']))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/sfpshow -all :', sfpshow_lines))
+    lines.extend(switch_command_lines(chassis_dct, 'SWITCHCMD /fabos/cliexec/portcfgshow :', portcfgshow_lines))
+    # port section (chassis ports of all logical switches)
+    lines.append('| Section: SSHOW_PORT |')
+    for switch_dct in chassis_dct['switches']:
+        for port_index in switch_dct['port_indexes']:
+            lines.extend(portcmd_lines(switch_dct, port_index))
+    lines.append('| ... rebuilt finished |')
+    return lines
+
+
+def switch_command_lines(chassis_dct, command, switch_lines_fn):
+    """Function returns command lines for all logical switches of the chassis.
+    Each context starts with CURRENT CONTEXT line (context 0 if virtual fabrics are off) and ends with command end line"""
+
+    lines = [command]
+    for switch_dct in chassis_dct['switches']:
+        lines.append(f"CURRENT CONTEXT -- {switch_dct['index']} , {switch_dct['fid']}")
+        lines.extend(switch_lines_fn(switch_dct))
+        lines.append(COMMAND_END)
+    return lines
+
+
+def configshow_lines(chassis_dct):
+    """Function returns chassis and logical switches configshow lines"""
+
+    lines = ['/fabos/cliexec/configshow -all :',
+                '[Configuration upload Information]',
+                'Configuration Format = 2.0',
+                'date = Mon Mar  2 10:15:00 2026',
+                f'FOS version = {FOS_VERSION}',
+                f"ssn = {chassis_dct['name'].upper()}"]
+    if chassis_dct['vf']:
+        lines.append(f"Number of LS = {len(chassis_dct['switches'])}")
+    lines.extend(['[Chassis Configuration Begin]',
+                    'bottleneck.BECreditLossFaultingBlade:0',
+                    f"chassis.licenseID:{chassis_dct['wwn']}",
+                    'fcRoute.backboneFabricId:128',
+                    'fos.sddqChassisLimit:1000',
+                    'maps.migrated:1',
+                    'snmp.snmpv3TrapTarget.0.trapTargetAddr:10.10.1.20',
+                    'syslog.address.1:10.10.1.21',
+                    'system.cpuLoad:121',
+                    'system.i2cTurboCnfg:1',
+                    'ts.tz:Europe/Moscow',
+                    '[Chassis Configuration End]'])
+    for switch_dct in chassis_dct['switches']:
+        lines.extend([f"[Switch Configuration Begin : {switch_dct['index']}]",
+                        f"SwitchName = {switch_dct['name']}",
+                        f"Fabric ID = {switch_dct['fid']}",
+                        '[Boot Parameters]',
+                        f"boot.name:{switch_dct['name']}",
+                        f"boot.ipa:10.{chassis_dct['number'] // 256}.{chassis_dct['number'] % 256}.{switch_dct['index'] + 10}",
+                        f"boot.licid:{switch_dct['wwn']}",
+                        '[Configuration]',
+                        f"fabric.domain:{switch_dct['domain']}",
+                        'fabric.ididmode:1',
+                        f"fabric.name:{switch_dct['fabric']['name']}",
+                        'fabric.ops.BBCredit:16',
+                        'fabric.ops.E_D_TOV:2000',
+                        'fabric.ops.R_A_TOV:10000',
+                        'fabric.ops.dataFieldSize:2112',
+                        'fabric.ops.max_hops:7',
+                        'fabric.ops.mode.pidFormat:1',
+                        'route.delayReroute:0',
+                        'route.stickyRoutes:0',
+                        'switch.edgeHoldTime:220',
+                        'maps.enabled:1',
+                        'maps.activePolicy:dflt_conservative_policy',
+                        f"enable:{switch_dct['fabric']['zoning']['cfg']}",
+                        'defzone:noaccess',
+                        f"[Switch Configuration End : {switch_dct['index']}]"])
+    lines.append(COMMAND_END)
+    return lines
+
+
+def chassis_state_lines(chassis_dct):
+    """Function returns chassis uptime, memory, flash, ip address and license command lines"""
+
+    return ['/fabos/cliexec/uptime :',
+            ' 09:46:50 up 75 days, 22:29,  1 user,  load average: 0.38, 0.33, 0.30',
+            COMMAND_END,
+            '/bin/cat /proc/meminfo :',
+            'MemTotal:      2052232 kB',
+            'MemFree:        912044 kB',
+            'Buffers:         84028 kB',
+            COMMAND_END,
+            '/bin/df :',
+            'Filesystem           1K-blocks      Used Available Use% Mounted on',
+            '/dev/root               999320    504244    426336  55% /',
+            COMMAND_END,
+            '/fabos/link_bin/ipaddrshow :',
+            f"Ethernet IP Address: 10.{chassis_dct['number'] // 256}.{chassis_dct['number'] % 256}.10",
+            'DHCP: Off',
+            COMMAND_END,
+            '/fabos/cliexec/licenseshow :',
+            'SYNtHETICLiCeNSe:',
+            '    Fabric license',
+            '    Extended Fabric license',
+            '    Trunking license',
+            '    Fabric Vision license',
+            COMMAND_END,
+            'CHASSISCMD /fabos/link_sbin/licenseport --show :',
+            f"  {chassis_dct['ports_number']} ports are available in this switch",
+            f"  {chassis_dct['ports_number']} port assignments are provisioned for use in this switch",
+            COMMAND_END]
+
+
+def chassisshow_lines(chassis_dct):
+    """Function returns chassisshow command lines"""
+
+    lines = ['CHASSISCMD /fabos/cliexec/chassisshow :']
+    for unit_name, unit_number in [('POWER SUPPLY', 1), ('POWER SUPPLY', 2), ('FAN', 1), ('FAN', 2)]:
+        lines.extend([f'{unit_name}  Unit: {unit_number}',
+                        'Power Source:           AC' if unit_name == 'POWER SUPPLY' else 'Fan Direction:          Non-portside Intake',
+                        'Factory Part Num:       23-1000043-01',
+                        f"Factory Serial Num:     DAC{chassis_dct['number']:05}{unit_number}",
+                        'Time Alive:             1231 days',
+                        'Time Awake:             75 days',
+                        ''])
+    lines.extend([f"Chassis Factory Serial Num:  EZA{chassis_dct['number']:07}", COMMAND_END])
+    return lines
+
+
+def errdump_lines(chassis_dct):
+    """Function returns errdump command lines with messages of the chassis logical switches"""
+
+    lines = ['CHASSISCMD /fabos/cliexec/errdump -a :']
+    switches = chassis_dct['switches']
+    for message_number in range(chassis_dct['errdump_number']):
+        switch_dct = switches[message_number % len(switches)]
+        message_id, severity, message = ERRDUMP_MESSAGES[message_number % len(ERRDUMP_MESSAGES)]
+        port_index = switch_dct['port_indexes'][message_number % len(switch_dct['port_indexes'])]
+        message = message.format(port=port_index, domain=switch_dct['domain'], cfg=switch_dct['fabric']['zoning']['cfg'])
+        # messages are spread over the last year
+        day = message_number * 365 // max(chassis_dct['errdump_number'], 1)
+        month, day = divmod(day, 31)
+        message_date = f'{2025 + (month + 3) // 12}/{(month + 3) % 12 + 1:02}/{min(day + 1, 28):02}-' \
+                        f'{message_number % 24:02}:{message_number % 60:02}:{(message_number * 7) % 60:02}'
+        lines.append(f"{message_date}, [{message_id}], {message_number + 1}, FID {switch_dct['fid']}, {severity}, "
+                        f"{switch_dct['name']}, {message}")
+    lines.append(COMMAND_END)
+    return lines
+
+
+def switchshow_lines(switch_dct):
+    """Function returns switchshow lines of the logical switch"""
+
+    chassis_dct = switch_dct['chassis']
+    lines = [f"switchName: {switch_dct['name']}",
+                f"switchType: {chassis_dct['switch_type']}",
+                'switchState: Online',
+                'switchMode: Native',
+                f"switchRole: {'Principal' if switch_dct['position'] == 0 else 'Subordinate'}",
+                f"switchDomain: {switch_dct['domain']}",
+                f"switchId: fffc{switch_dct['domain']:02x}",
+                f"switchWwn: {switch_dct['wwn']}",
+                f"zoning: ON ({switch_dct['fabric']['zoning']['cfg']})",
+                'switchBeacon: OFF',
+                'FC Router: OFF',
+                f"Fabric Name: {switch_dct['fabric']['name']}",
+                'HIF Mode: OFF',
+                'Allow XISL Use: OFF']
+    if chassis_dct['vf']:
+        lines.append(f"LS Attributes: [FID: {switch_dct['fid']}, Base Switch: No, "
+                        f"Default Switch: {'Yes' if switch_dct['fid'] == 128 else 'No'}, Ficon Switch: No, Address Mode 0]")
+    lines.extend(['Address Mode: 0', '',
+                    'Index Port Address  Media Speed   State       Proto',
+                    '=================================================='])
+    for port_index in switch_dct['port_indexes']:
+        port_dct = switch_dct['ports'][port_index]
+        address = f"{switch_dct['domain']:02x}{port_index % 256:02x}00"
+        port_line = f'{port_index:4}  {port_index:3}   {address}   id    N32'
+        if port_dct['type'] is None:
+            lines.append(f'{port_line}   No_Light    FC')
+        elif port_dct['type'] == 'E-Port':
+            remote_dct = port_dct['remote_switch']
+            lines.append(f"{port_line}   Online      FC  E-Port  {remote_dct['wwn']} \"{remote_dct['name']}\" "
+                            f"({'upstream' if remote_dct['position'] < switch_dct['position'] else 'downstream'})")
+        else:
+            device_dct = port_dct['device']
+            npiv_number = len(device_dct['logins']) - 1
+            connection = f'  {npiv_number + 1} N Port + {npiv_number} NPIV public' if npiv_number else ''
+            lines.append(f"{port_line}   Online      FC  F-Port  {device_dct['wwpn'] if not npiv_number else ''}{connection}")
+    return lines
+
+
+def fabricshow_lines(switch_dct):
+    """Function returns fabricshow lines of the fabric which logical switch belongs to"""
+
+    fabric = switch_dct['fabric']
+    lines = ['Switch ID   Worldwide Name           Enet IP Addr    FC IP Addr      Name',
+                '-------------------------------------------------------------------------']
+    for fabric_switch_dct in fabric['switches']:
+        principal_tag = '>' if fabric_switch_dct['position'] == 0 else ' '
+        chassis_number = fabric_switch_dct['chassis']['number']
+        lines.append(f"{fabric_switch_dct['domain']:3}: fffc{fabric_switch_dct['domain']:02x} {fabric_switch_dct['wwn']} "
+                        f"10.{chassis_number // 256}.{chassis_number % 256}.{fabric_switch_dct['index'] + 10}    0.0.0.0        "
+                        f"{principal_tag}\"{fabric_switch_dct['name']}\"")
+    lines.extend(['', f"The Fabric has {len(fabric['switches'])} switches", '', f"Fabric Name: {fabric['name']}"])
+    return lines
+
+
+def islshow_lines(switch_dct):
+    """Function returns islshow lines of the logical switch"""
+
+    return [f"{isl_number:3}:{port_index:3}->{remote_port:3} {remote_dct['wwn']} {remote_dct['domain']:3} {remote_dct['name']} "
+            f"sp: 32.000G bw: 32.000G TRUNK QOS CR_RECOV FEC"
+            for isl_number, (port_index, remote_dct, remote_port) in enumerate(switch_dct['isl'], start=1)]
+
+
+def trunkshow_lines(switch_dct):
+    """Function returns trunkshow lines of the logical switch. Each ISL is a separate trunk group"""
+
+    return [f"{trunk_number:2}: {port_index:3}->{remote_port:3} {remote_dct['wwn']} {remote_dct['domain']:3} deskew 15 MASTER"
+            for trunk_number, (port_index, remote_dct, remote_port) in enumerate(switch_dct['isl'], start=1)]
+
+
+def lsdbshow_lines(switch_dct):
+    """Function returns link state database lines of the logical switch (local switch record)"""
+
+    lines = [f"Domain = {switch_dct['domain']} (self), Link State Database Entry pointer = 0x102e0d30",
+                'uPathCost = 0, uPrgmPathCost = 0, uOldHopCount = 0, uPrgmHopCount = 0',
+                f"lsId = {switch_dct['domain']}, advertiser = {switch_dct['domain']}",
+                f"linkCnt = {len(switch_dct['isl'])}, flags = 0x0"]
+    lines.extend(f"LinkId = {remote_dct['domain']}, out port = {port_index}, rem port = {remote_port}, cost = 500, bw = 32G, type = 1"
+                    for port_index, remote_dct, remote_port in switch_dct['isl'])
+    return lines
+
+
+def switch_devices(switch_dct):
+    """Function returns port index and connected device of the logical switch F-ports"""
+
+    return [(port_index, port_dct['device']) for port_index, port_dct in switch_dct['ports'].items()
+            if port_dct['type'] == 'F-Port']
+
+
+def fdmishow_lines(switch_dct):
+    """Function returns fdmishow lines of the host ports connected to the logical switch"""
+
+    lines = ['Local HBA database contains:']
+    for port_index, device_dct in switch_devices(switch_dct):
+        if device_dct['class'] != 'SRV':
+            continue
+        lines.extend([f"  {device_dct['wwpn']}",
+                        '      Ports: 1',
+                        f"          {device_dct['wwpn']}",
+                        '      Port attributes:',
+                        '        FC4 Types: FCP',
+                        '        Supported Speed: 8 16 32 Gb/s',
+                        '        Port Speed: 32 Gb/s',
+                        '        Max Frame Size: 2048 bytes',
+                        f"        Device Name: /sys/class/scsi_host/host{port_index % 16}",
+                        f"        Host Name: {device_dct['name']}",
+                        f"        Node Name: {device_dct['wwnn']}",
+                        f"        Port Name: {device_dct['wwpn']}",
+                        '        Port Type: 0x2',
+                        '      HBA attributes:',
+                        '        Manufacturer: Emulex Corporation',
+                        f"        Serial Number: {device_dct['serial']}",
+                        '        Model: LPe32002-M2',
+                        '        Model Description: Emulex LPe32002-M2 2-Port 32Gb Fibre Channel Adapter',
+                        '        Hardware Version: 0000000b',
+                        '        Driver Version: 12.8.340.10',
+                        '        Option ROM Version: 12.8.340.10',
+                        '        Firmware Version: 12.8.340.10',
+                        '        OS Name and Version: Linux 4.18.0'])
+    lines.extend(['Local Port database contains:', *[f"  {device_dct['wwpn']}" for _, device_dct in switch_devices(switch_dct)
+                                                      if device_dct['class'] == 'SRV']])
+    return lines
+
+
+def nsshow_lines(switch_dct):
+    """Function returns local name server lines of the devices connected to the logical switch"""
+
+    lines = ['{', ' Type Pid    COS     PortName                NodeName                 SCR']
+    entries_number = 0
+    for port_index, device_dct in switch_devices(switch_dct):
+        port_wwn = wwn('20:00:c4:f5:7c', switch_dct['chassis']['number'] * 4096 + port_index)
+        for login_number, (port_id, login_wwn) in enumerate(device_dct['logins']):
+            entries_number += 1
+            port_name = login_wwn or device_dct['wwpn']
+            initiator = device_dct['class'] == 'SRV'
+            lines.extend([f" N    {port_id};      3;{port_name};{device_dct['wwnn']}; 0x0000000{3 if initiator else 1}",
+                            '    FC4s: FCP',
+                            f"    PortSymb: [{len(device_dct['port_symb']) + 2}] \"{device_dct['port_symb']}\"",
+                            f"    NodeSymb: [{len(device_dct['node_symb']) + 2}] \"{device_dct['node_symb']}\"",
+                            f'    Fabric Port Name: {port_wwn}',
+                            f"    Permanent Port Name: {port_name}",
+                            f"    Device type: {'Physical' if not login_number else 'NPIV'} {'Initiator' if initiator else 'Target'}",
+                            f'    Port Index: {port_index}',
+                            '    Share Area: No',
+                            '    Device Shared in Other AD: No',
+                            '    Redirect: No',
+                            '    Partial: No',
+                            '    LSAN: No',
+                            '    Device link speed: 32G',
+                            '    Connected through AG: No',
+                            '    Real device behind AG: No'])
+    lines.append(f'The Local Name Server has {entries_number} entries }}')
+    return lines
+
+
+def nsportshow_lines(switch_dct):
+    """Function returns name server port information lines of the logical switch F-ports"""
+
+    return [f'PORT: {port_index} fportSetup: 0x00150400 ifid: 0x43{port_index:06x} zonetype: HARD WWN dhp: 0 inst: 1'
+            for port_index, _ in switch_devices(switch_dct)]
+
+
+def cfgshow_lines(switch_dct):
+    """Function returns defined and effective zoning configuration lines of the fabric"""
+
+    zoning = switch_dct['fabric']['zoning']
+    alias_wwns = dict(zoning['aliases'])
+    lines = ['Defined configuration:']
+    if zoning['zones']:
+        lines.append(f" cfg:  {zoning['cfg']}  {'; '.join(zone for zone, _ in zoning['zones'])}")
+    lines.extend(f' zone:  {zone}  {"; ".join(members)}' for zone, members in zoning['zones'])
+    lines.extend(f' alias:  {alias}  {port_wwn}' for alias, port_wwn in zoning['aliases'])
+    lines.extend(['', 'Effective configuration:'])
+    if zoning['zones']:
+        lines.append(f" cfg:  {zoning['cfg']}")
+    for zone, members in zoning['zones']:
+        lines.append(f' zone:  {zone}  {alias_wwns[members[0]]}')
+        lines.extend(f'                {alias_wwns[member]}' for member in members[1:])
+    lines.append('')
+    return lines
+
+
+def sfpshow_lines(switch_dct):
+    """Function returns sfpshow lines of the logical switch ports"""
+
+    lines = []
+    for port_index in switch_dct['port_indexes']:
+        lines.append(f'Port {port_index:3}:')
+        if switch_dct['ports'][port_index]['type'] is None:
+            lines.extend([f'No SFP installed in port {port_index}', ''])
+            continue
+        rx_power = 400 + (port_index * 37) % 300
+        lines.extend(['Identifier:  3    SFP',
+                        'Connector:   7    LC',
+                        'Transceiver: 7004404000000000 8,16,32_Gbps M5 sw Short_dist',
+                        'Encoding:    6    64B66B',
+                        'Baud Rate:   280  (units 100 megabaud)',
+                        'Length 50u (OM3):  10   (units 10 meters)',
+                        'Vendor Name: BROCADE',
+                        'Vendor PN:   57-1000485-01',
+                        f"Vendor SN:   HAF{switch_dct['chassis']['number']:05}{port_index:03}",
+                        'Wavelength:  850  (units nm)',
+                        'Temperature: 41       Centigrade',
+                        'Current:     7.512    mAmps',
+                        'Voltage:     3305.1   mVolts',
+                        f'RX Power:    {10 * math.log10(rx_power / 1000):.1f}    dBm ({rx_power:.1f}uW)',
+                        'TX Power:    -2.4    dBm (575.4 uW)',
+                        ''])
+    return lines
+
+
+def portcfgshow_lines(switch_dct):
+    """Function returns portcfgshow lines of the logical switch ports (16 ports in each table)"""
+
+    lines = []
+    port_indexes = switch_dct['port_indexes']
+    for start in range(0, len(port_indexes), 16):
+        ports = port_indexes[start:start + 16]
+        lines.extend(['Ports of Slot 0' + ''.join(f'{port_index:4}' for port_index in ports),
+                        '-----------------+' + '---+' * len(ports),
+                        'Speed            ' + '  AN' * len(ports),
+                        'Trunk Port       ' + '  ON' * len(ports),
+                        'Long Distance    ' + '  ..' * len(ports),
+                        'VC Link Init     ' + '  ..' * len(ports),
+                        'Locked L_Port    ' + '  ..' * len(ports),
+                        'Locked G_Port    ' + '  ..' * len(ports),
+                        'Disabled E_Port  ' + '  ..' * len(ports),
+                        'Locked E_Port    ' + '  ..' * len(ports),
+                        'ISL R_RDY Mode   ' + '  ..' * len(ports),
+                        'RSCN Suppressed  ' + '  ..' * len(ports),
+                        'Persistent Disable' + '  ..' * len(ports),
+                        'NPIV capability  ' + '  ON' * len(ports),
+                        'NPIV PP Limit    ' + ' 126' * len(ports),
+                        ''])
+    return lines
+
+
+def portcmd_lines(switch_dct, port_index):
+    """Function returns portshow, portloginshow and portstatsshow lines of the chassis port"""
+
+    port_dct = switch_dct['ports'][port_index]
+    port_id = f"{switch_dct['domain']:02x}{port_index % 256:02x}00"
+    port_wwn = wwn('20:00:c4:f5:7c', switch_dct['chassis']['number'] * 4096 + port_index)
+    online = port_dct['type'] is not None
+    if port_dct['type'] == 'E-Port':
+        port_flags, port_scn, connected_wwns = 'PRESENT ACTIVE E_PORT T_PORT T_MASTER G_PORT U_PORT LOGICAL_ONLINE LOGIN NOELP LED ACCEPT', \
+                                                '16   E_Port', [port_dct['remote_switch']['wwn']]
+    elif port_dct['type'] == 'F-Port':
+        port_flags, port_scn, connected_wwns = 'PRESENT ACTIVE F_PORT G_PORT U_PORT NPIV LOGICAL_ONLINE LOGIN NOELP LED ACCEPT FLOGI', \
+                                                '32   F_Port', [login_wwn or port_dct['device']['wwpn'] for _, login_wwn in port_dct['device']['logins']]
+    else:
+        port_flags, port_scn, connected_wwns = 'PRESENT U_PORT LED', '2    Offline', []
+    link_failures = (port_index * 7) % 5 if online else 0
+
+    lines = [f'portFcPortCmdShow --slot 0 {port_index} {port_index} :',
+                f'portshow {port_index}',
+                f'portIndex: {port_index}',
+                f'portName: port{port_index}',
+                'portHealth: HEALTHY' if online else 'portHealth: No Fabric Watch License',
+                '',
+                'Authentication: None',
+                'portDisableReason: None',
+                'portCFlags: 0x1',
+                f'portFlags: 0x24b03       {port_flags}',
+                'LocalSwcFlags: 0x0',
+                'portType:  26.0',
+                'POD Port: Port is licensed',
+                f"portState: {'1    Online' if online else '2    Offline'}",
+                'Protocol: FC',
+                f"portPhys:  {'6    In_Sync' if online else '4    No_Light'}         portScn:   {port_scn}",
+                'port generation number:    148',
+                'state transition count:    3',
+                '',
+                f'portId:    {port_id}',
+                f'portIfId:    4302{port_index:04x}',
+                f'portWwn:   {port_wwn}',
+                'portWwn of device(s) connected:',
+                *[f'\t{connected_wwn}' for connected_wwn in connected_wwns],
+                'Distance:  normal',
+                f"portSpeed: {'N32Gbps' if online else 'AN'}",
+                '',
+                'FEC: Active' if online else 'FEC: Inactive',
+                'Credit Recovery: Active' if port_dct['type'] == 'E-Port' else 'Credit Recovery: Inactive',
+                'LE domain: 0',
+                'Aoq: Inactive',
+                'FC Fastwrite: OFF',
+                f'Interrupts:        0          Link_failure: {link_failures}          Frjt:         0',
+                f'Unknown:           0          Loss_of_sync: {link_failures * 2}          Fbsy:         0',
+                'Lli:               21         Loss_of_sig:  4',
+                'Proc_rqrd:         1340       Protocol_err: 0',
+                'Timed_out:         0          Invalid_word: 0',
+                'Rx_flushed:        0          Invalid_crc:  0',
+                'Tx_unavail:        0          Delim_err:    0',
+                'Free_buffer:       0          Address_err:  0',
+                'Overrun:           0          Lr_in:        2',
+                'Suspended:         0          Lr_out:       0',
+                'Parity_err:        0          Ols_in:       0',
+                '2_parity_err:      0          Ols_out:      2',
+                'CMI_bus_err:       0',
+                '',
+                f'portloginshow {port_index}',
+                'Type  PID     World Wide Name        credit df_sz cos',
+                '=====================================================']
+    if port_dct['type'] == 'F-Port':
+        device_dct = port_dct['device']
+        lines.extend(f"  fe  {login_port_id} {login_wwn or device_dct['wwpn']}   8  2112   8  scr=0x3"
+                        for login_port_id, login_wwn in device_dct['logins'])
+    lines.extend([f'portregshow {port_index}',
+                    '0x8a4ac000: bbc_trc                  4     0     0     0     0     0     0     0',
+                    f'portstatsshow {port_index}'])
+    lines.extend(portstats_lines(port_index, online))
+    lines.extend([f'portstats64show {port_index}', 'stat64_wtx       0      top_int : 4-byte words transmitted', ''])
+    return lines
+
+
+def portstats_lines(port_index, online):
+    """Function returns portstatsshow lines of the port. Counters depend on the port index only"""
+
+    traffic = (port_index + 1) * 1234567 if online else 0
+    errors = (port_index * 13) % 7 if online else 0
+    lines = [f'stat_wtx            \t{traffic}               4-byte words transmitted',
+                f'stat_wrx            \t{traffic * 3}               4-byte words received',
+                f'stat_ftx            \t{traffic // 500}               Frames transmitted',
+                f'stat_frx            \t{traffic // 170}               Frames received',
+                'stat_c2_frx         \t0                   Class 2 frames received',
+                f'stat_c3_frx         \t{traffic // 170}               Class 3 frames received',
+                'stat_lc_rx          \t0                   Link control frames received',
+                'stat_mc_rx          \t0                   Multicast frames received',
+                'stat_mc_to          \t0                   Multicast timeouts',
+                'stat_mc_tx          \t0                   Multicast frames transmitted',
+                f'er_enc_in           \t{errors}                   Encoding errors inside of frames',
+                f'er_crc              \t{errors // 2}                   Frames with CRC errors',
+                'er_trunc            \t0                   Frames shorter than minimum',
+                'er_toolong          \t0                   Frames longer than maximum',
+                'er_bad_eof          \t0                   Frames with bad end-of-frame',
+                f'er_enc_out          \t{errors * 3}                   Encoding error outside of frames',
+                'er_bad_os           \t0                   Invalid ordered set',
+                'er_rx_c3_timeout    \t0                   Class 3 receive frames discarded due to timeout',
+                f'er_tx_c3_timeout    \t{errors // 3}                   Class 3 transmit frames discarded due to timeout',
+                'er_unroutable       \t0                   Frames that are unroutable',
+                'er_unreachable      \t0                   Frames with unreachable destination',
+                'er_other_discard    \t0                   Other discards',
+                'er_type1_miss       \t0                   frames with FTB type 1 miss',
+                'er_type2_miss       \t0                   frames with FTB type 2 miss',
+                'er_type6_miss       \t0                   frames with FTB type 6 miss',
+                'er_zone_miss        \t0                   frames with hard zoning miss',
+                'er_lun_zone_miss    \t0                   frames with LUN zoning miss',
+                'er_crc_good_eof     \t0                   Crc error with good eof',
+                'er_inv_arb          \t0                   Invalid ARB',
+                'er_single_credit_loss\t0                  Single credit loss',
+                'er_multi_credit_loss\t0                   Multi credit loss',
+                'fec_cor_detected    \t0                   Count of blocks that were corrected by FEC',
+                'fec_uncor_detected  \t0                   Count of blocks that were not corrected by FEC',
+                f'tim_rdy_pri         \t{errors}                   Time R_RDY high priority',
+                f'tim_txcrd_z         \t{errors * 1000}                Time TX Credit Zero (2.5Us ticks)',
+                'tim_txcrd_z_vc  0- 3:  0           0           0           0',
+                'tim_txcrd_z_vc  4- 7:  0           0           0           0',
+                'tim_txcrd_z_vc  8-11:  0           0           0           0',
+                'tim_txcrd_z_vc 12-15:  0           0           0           0']
+    # portstats regex separates counter name and value with spaces
+    return [line.replace('\t', ' ') for line in lines]
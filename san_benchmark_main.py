@@ -0,0 +1,37 @@
+"""Main module to run parser and analysis benchmark
+on the synthetic SAN with 10, 100 and 500 switches (default).
+Generated configuration files, projects, run logs and benchmark summary are saved to the benchmark folder.
+Summary of the previous benchmark could be used as baseline"""
+
+
+import argparse
+
+from san_benchmark import run_benchmark
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='SAN parser and analysis benchmark on the synthetic SAN')
+    parser.add_argument('benchmark_folder', help='folder to save generated SAN, projects and benchmark summary')
+    parser.add_argument('--switches', default='10,100,500', help='comma separated numbers of switches')
+    parser.add_argument('--ports', type=int, default=48, help='number of ports of each logical switch')
+    parser.add_argument('--logins', type=int, default=2, help='number of name server logins of each device port')
+    parser.add_argument('--zones', type=int, default=500, help='number of zones in each fabric')
+    parser.add_argument('--vf-contexts', type=int, default=1, help='number of logical switches in each chassis')
+    parser.add_argument('--fabric-switches', type=int, default=50, help='maximum number of switches in each fabric')
+    parser.add_argument('--errdump', type=int, default=100, help='number of errdump messages of each chassis')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--parser-workers', help='number of parser worker processes')
+    parser.add_argument('--analysis-workers', help='number of analysis worker threads')
+    parser.add_argument('--baseline', help='benchmark summary csv file to compare with')
+    args = parser.parse_args()
+
+    switch_counts = [int(switch_count) for switch_count in args.switches.split(',') if switch_count.strip()]
+    run_benchmark(args.benchmark_folder, switch_counts, ports_per_switch=args.ports, logins_per_port=args.logins,
+                    zones_per_fabric=args.zones, vf_contexts=args.vf_contexts, switches_per_fabric=args.fabric_switches,
+                    errdump_messages=args.errdump, seed=args.seed, parser_workers=args.parser_workers,
+                    analysis_workers=args.analysis_workers, baseline_file=args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,12 @@ import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .bladesystem_sections import *
 
 
+@prof.profile_step('extract')
 def blade_system_extract(project_constants_lst):
     """Function to extract blade systems information"""
 
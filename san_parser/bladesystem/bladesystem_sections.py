@@ -13,7 +13,7 @@ def blade_enclosure_section(pattern_dct, file, enclosure_params):
     # while not reach empty line
     while not re.search(r'UUID',line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # name_value_pair_match
         if match_dct['name_value_pair']:
             result = match_dct['name_value_pair']
@@ -55,7 +55,7 @@ def vc_fabric_connection_section(san_blade_vc_lst, enclosure_vc_lst,
     line = file.readline()
     while not re.search(r'FC-CONNECTION INFORMATION', line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # vc_port_match
         if match_dct['vc_port']:
             vc_port = dsop.line_to_list(pattern_dct['vc_port'], line)
@@ -78,7 +78,7 @@ def active_oa_section(file, pattern_dct):
     line = file.readline()
     while not re.search(r'^>SHOW', line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # oa_ip_match
         if match_dct['oa_ip']:
             oa_ip = match_dct['oa_ip'].group(1)
@@ -96,7 +96,7 @@ def interconnect_module_section(san_module_lst, pattern_dct,
     line = file.readline()
     while not re.search(r'^>SHOW', line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # module_type_num_match
         if match_dct['module_type_num']:
             module_dct = {}
@@ -132,7 +132,7 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
     line = file.readline()
     while not re.search(r'^>SHOW', line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # blade_server_num_match
         if match_dct['blade_server_num']:
             blade_dct = {}
@@ -144,7 +144,7 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
             # server_section_end_comp
             while not re.search(pattern_dct['server_section_end'], line):
                 # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # mezzanin hba section start
                 # mezzanine_model_match
                 if match_dct['mezzanine_description']:
@@ -155,7 +155,7 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
                     # mezzanine_wwn_comp
                     while re.search(pattern_dct['mezzanine_wwn'], line):
                         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                        match_dct = reop.match_line(pattern_dct, line)
                         # mezzanine_wwn_match
                         result = match_dct['mezzanine_wwn']
                         wwnp = result.group(1)
@@ -180,7 +180,7 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
                     # wwn_mac_line_comp
                     while re.search(pattern_dct['wwn_mac_line'], line):
                         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                        match_dct = reop.match_line(pattern_dct, line)
                         # flb_wwn_match
                         if match_dct['flb_wwn']:
                             result = match_dct['flb_wwn']
@@ -13,10 +13,12 @@ import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .synergy_sections import interconnect_module_extract, server_mezz_extract
 
 
+@prof.profile_step('extract')
 def synergy_system_extract(project_constants_lst):
     """Function to extract Synergy systems information"""
 
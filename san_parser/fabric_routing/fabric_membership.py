@@ -10,10 +10,14 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 from .fabric_sections import agshow_section_extract
 
 
+@prof.profile_step('extract')
 def fabric_membership_extract(switch_params_df, project_constants_lst):
     """Function to extract from principal switch configuration 
     list of switches in fabric including AG switches"""
@@ -46,18 +50,16 @@ def fabric_membership_extract(switch_params_df, project_constants_lst):
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('fabric', max_title)
         ag_params = dfop.list_from_dataframe(re_pattern_df, 'ag_params')          
         
+        # current operation information string for each switch
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric environment. Switch role: {switch_params_sr["switchRole"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # check Principal switches only
+        extract_flags = (switch_params_df["switchRole"] == 'Principal').tolist()
         # checking each switch for switch level parameters
-        for i, switch_params_sr in switch_params_df.iterrows():        
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric environment. Switch role: {switch_params_sr["switchRole"]}'
-            print(info, end =" ")
-
-            if switch_params_sr["switchRole"] == 'Principal':
-                sw_fabricshow_lst = current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct, 
-                                                                        switch_params_sr, ag_params)
-                meop.show_collection_status(sw_fabricshow_lst, max_title, len(info))
-            else:
-                meop.status_info('skip', max_title, len(info))
+        switch_configs_extract(current_config_extract, [san_fabricshow_lst, san_ag_principal_lst], pattern_dct, 
+                                switch_params_lst, info_lst, project_constants_lst, 
+                                ag_params, extract_flags=extract_flags)
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'fabric_columns', 'ag_columns')
         data_lst = dfop.list_to_dataframe(headers_lst, san_fabricshow_lst, san_ag_principal_lst)
@@ -92,18 +94,21 @@ def current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct
         # principal_switch_lst contains sshow_file, chassis_name, chassis_wwn, switch_index, switch_name, switch_fid
         principal_switch_lst = [*switch_info_lst[:6], *switch_info_lst[7:9]]
                                 
+        # section start patterns to move cursor to
+        section_patterns = [pattern_dct['switchcmd_fabricshow'], pattern_dct['switchcmd_agshow']]
+        sshow_index = sshow_file_index(sshow_file)
         # search control dictionary. continue to check sshow_file until all parameters groups are found
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()
+                line = goto_sshow_section(file, sshow_index, section_patterns)
                 if not line:
                     break
                 # fabricshow section start
                 if re.search(pattern_dct['switchcmd_fabricshow'], line):
                     # when section is found corresponding collected dict values changed to True
                     collected['fabricshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_fabricshow_lst = reop.extract_list_from_line(san_fabricshow_lst, pattern_dct, line, file, 
                                                                                         extract_pattern_name='fabricshow', 
                                                                                         save_local=True, line_add_values=principal_switch_lst)
@@ -111,7 +116,7 @@ def current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct
                 # ag_principal section start
                 elif re.search(pattern_dct['switchcmd_agshow'], line):
                     collected['ag_principal'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = agshow_section_extract(san_ag_principal_lst, pattern_dct, principal_switch_lst, ag_params, line, file)
                 # ag_principal section end
 
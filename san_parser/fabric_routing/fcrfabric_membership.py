@@ -12,13 +12,16 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..sshow_index import goto_sshow_section, sshow_file_index
 from .fcrfabric_membership_sections import (fcrfabricshow_section_extract,
                                             fcrresourceshow_section_extract,
                                             goto_baseswitch_context_fid,
                                             lsanzoneshow_section_extract)
 
 
+@prof.profile_step('extract')
 def fcr_membership_extract(switch_params_df, project_constants_lst):
     """Function to extract fabrics routing information"""
 
@@ -114,11 +117,17 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
     # check config of FC routers only 
     if fc_router == 'ON':
         # fcrouter_info_lst contains sshow_file, chassis_name, switch_index, switch_name, switch_fid
-        fcrouter_info_lst = [*switch_info_lst[:6], switch_info_lst[7]]                                        
+        fcrouter_info_lst = [*switch_info_lst[:6], switch_info_lst[7]]
+        # section start patterns to move cursor to
+        section_patterns = [pattern_dct[pattern_name] for pattern_name in 
+                            ['switchcmd_fcrfabricshow', 'switchcmd_fcrproxydevshow', 'switchcmd_fcrphydevshow', 
+                             'switchcmd_lsanzoneshow', 'switchcmd_fcredgeshow', 'switchcmd_fcrxlateconfig', 
+                             'switchcmd_fcrresourceshow']]
+        sshow_index = sshow_file_index(sshow_file)
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()
+                line = goto_sshow_section(file, sshow_index, section_patterns)
                 if not line:
                     break
                 # check configs of Principal switches only                        
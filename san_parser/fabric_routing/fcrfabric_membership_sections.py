@@ -28,14 +28,14 @@ def fcrfabricshow_section_extract(san_fcrfabric_lst, pattern_dct, fcrouter_info_
     while not re.search(pattern_dct['switchcmd_end'], line):
         line = file.readline()
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # fc_router_match'
         if match_dct['fc_router']:                                   
             fcrouter_params_lst = dsop.line_to_list(pattern_dct['fc_router'], line)
             # check if line is empty                                    
             while not re.match('\r?\n', line):
                 line = file.readline()
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # fcr_info_match
                 if match_dct['fcr_info']:
                     fcrouter_name = match_dct['fcr_info'].group(1)
@@ -57,7 +57,7 @@ def lsanzoneshow_section_extract(san_lsan_lst, pattern_dct, fcrouter_info_lst,
     for the base switch context fid from the sshow file"""
 
     while not re.search(pattern_dct['switchcmd_end'], line):
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # lsan_name_match
         if match_dct['lsan_name']:
             # switch_info and current connected device wwnp
@@ -9,10 +9,14 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 from .isl_sections import lsdbshow_section_extract
 
 
+@prof.profile_step('extract')
 def interswitch_connection_extract(switch_params_df, project_constants_lst):
     """Function to extract interswitch connection information"""  
 
@@ -46,19 +50,16 @@ def interswitch_connection_extract(switch_params_df, project_constants_lst):
         san_porttrunkarea_lst = []
         san_lsdb_lst = []
 
+        # current operation information string for each switch
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} isl, trunk and trunk area ports. Switch mode: {switch_params_sr["switchMode"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # if switch in Access Gateway mode then skip
+        extract_flags = (switch_params_df["switchMode"] == 'Native').tolist()
         # checking each switch for switch level parameters
-        for i, switch_params_sr in switch_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} isl, trunk and trunk area ports. Switch mode: {switch_params_sr["switchMode"]}'
-            print(info, end =" ")   
-
-            if switch_params_sr["switchMode"] == 'Native':
-                sw_isl_lst = current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst, pattern_dct, 
-                                        switch_params_sr, lsdb_params)
-                meop.show_collection_status(sw_isl_lst, max_title, len(info))
-            # if switch in Access Gateway mode then skip
-            else:
-                meop.status_info('skip', max_title, len(info))        
+        switch_configs_extract(current_config_extract, [san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst], 
+                                pattern_dct, switch_params_lst, info_lst, project_constants_lst, 
+                                lsdb_params, extract_flags=extract_flags)
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'isl_columns', 'trunk_columns', 'porttrunkarea_columns', 'lsdb_columns')
         data_lst = dfop.list_to_dataframe(headers_lst, san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst)
@@ -91,16 +92,20 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
     collected = {'isl': False, 'trunk': False, 'trunkarea': False, 'lsdb': False}
 
     if switch_mode == 'Native':
+        # section start patterns to move cursor to
+        section_patterns = [pattern_dct[pattern_name] for pattern_name in 
+                            ['switchcmd_islshow', 'switchcmd_trunkshow', 'switchcmd_trunkarea', 'switchcmd_lsdbshow']]
+        sshow_index = sshow_file_index(sshow_file)
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()                        
+                line = goto_sshow_section(file, sshow_index, section_patterns)                        
                 if not line:
                     break
                 # isl section start   
                 if re.search(pattern_dct['switchcmd_islshow'], line) and not collected['isl']:
                     collected['isl'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_isl_lst = reop.extract_list_from_line(san_isl_lst, pattern_dct, line, file, 
                                                                     extract_pattern_name='islshow', 
                                                                     save_local=True, line_add_values=switch_info_lst[:-1])                               
@@ -109,7 +114,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # switchcmd_trunkshow_comp
                 elif re.search(pattern_dct['switchcmd_trunkshow'], line) and not collected['trunk']:
                     collected['trunk'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = reop.extract_list_from_line(san_trunk_lst, pattern_dct, line, file, 
                                                         extract_pattern_name='trunkshow', 
                                                         first_line_skip=False, line_add_values=switch_info_lst[:-1])
@@ -117,7 +122,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # porttrunkarea section start
                 elif re.search(pattern_dct['switchcmd_trunkarea'], line) and not collected['trunkarea']:
                     collected['trunkarea'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = reop.extract_list_from_line(san_porttrunkarea_lst, pattern_dct, line, file, 
                                                         extract_pattern_name='porttrunkarea', 
                                                         line_add_values=switch_info_lst[:6])
@@ -125,7 +130,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # lsdb section start
                 elif re.search(pattern_dct['switchcmd_lsdbshow'], line) and not collected['lsdb']:
                     collected['lsdb'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = lsdbshow_section_extract(san_lsdb_lst, pattern_dct, switch_info_lst, lsdb_params, line, file)
                 # lsdb section end
     return sw_isl_lst
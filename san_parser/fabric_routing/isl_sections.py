@@ -12,7 +12,7 @@ def lsdbshow_section_extract(san_lsdb_lst, pattern_dct, switch_info_lst, lsdb_pa
     while not re.search(pattern_dct['switchcmd_end'],line):  
 
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # lsdb_domain section start
         if match_dct['lsdb_domain']:
             # dictionary to store all DISCOVERED parameters
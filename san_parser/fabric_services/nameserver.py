@@ -10,11 +10,15 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 from .nameserver_sections import (nsshow_file_extract,
                                   san_device_ports_section_extract)
 
 
+@prof.profile_step('extract')
 def connected_devices_extract(switch_params_df, project_constants_lst):
     """Function to extract connected devices information
     (fdmi, nsshow, nscamshow)"""
@@ -53,14 +57,13 @@ def connected_devices_extract(switch_params_df, project_constants_lst):
         # list with zoning enforcement information (HARD WWN,  HARD PORT, etc) in san
         san_nsportshow_lst = []
         
-        for i, switch_params_sr in switch_params_df.iterrows():       
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} connected devices'
-            print(info, end =" ")
-            sw_fdmi_lst = current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_nsportshow_lst, 
-                                                    pattern_dct, switch_params_sr,
-                                                    fdmi_params, fdmi_params_add, nsshow_params, nsshow_params_add)                   
-            meop.show_collection_status(sw_fdmi_lst, max_title, len(info))
+        # current operation information string for each switch
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} connected devices' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        switch_configs_extract(current_config_extract, [san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_nsportshow_lst], 
+                                pattern_dct, switch_params_lst, info_lst, project_constants_lst, 
+                                fdmi_params, fdmi_params_add, nsshow_params, nsshow_params_add)
         
         nsshow_folder = report_requisites_sr['switch_nsshow_folder']
         # check files in dedicated nsshow folder
@@ -107,17 +110,21 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
     # Name Server service started only in Native mode
     collected = {'fdmi': False, 'nsshow': False, 'nscamshow': False, 'nsportshow': False} \
         if switch_mode == 'Native' else {'fdmi': False, 'nsportshow': False}
+    # section start patterns to move cursor to
+    section_patterns = [pattern_dct[pattern_name] for pattern_name in 
+                        ['switchcmd_fdmishow', 'switchcmd_nsportshow', 'switchcmd_nsshow', 'switchcmd_nscamshow']]
+    sshow_index = sshow_file_index(sshow_file)
 
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            line = goto_sshow_section(file, sshow_index, section_patterns)                        
             if not line:
                 break
             # fdmi section start   
             if re.search(pattern_dct['switchcmd_fdmishow'], line) and not collected['fdmi']:
                 collected['fdmi'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_fdmi_lst = san_device_ports_section_extract(san_fdmi_lst, pattern_dct, line, file, 
                                                                         switch_info_lst, fdmi_params, fdmi_params_add,
                                                                         device_start_pattern_name='wwpn', 
@@ -127,7 +134,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
             # ns_portshow section start (zoning_enforcement information (HARD WWN,  HARD PORT, etc)) 
             elif re.search(pattern_dct['switchcmd_nsportshow'], line) and not collected['nsportshow']:
                 collected['nsportshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_nsportshow_lst = reop.extract_list_from_line(san_nsportshow_lst, pattern_dct, line, file, 
                                                                         extract_pattern_name='ns_portshow', 
                                                                         save_local=True, line_add_values=switch_info_lst[:6])                                               
@@ -137,7 +144,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
                 # nsshow section start
                 if re.search(pattern_dct['switchcmd_nsshow'], line) and not collected['nsshow']:
                     collected['nsshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_nsshow_lst = san_device_ports_section_extract(san_nsshow_lst, pattern_dct, line, file, 
                                                                             switch_info_lst, nsshow_params, nsshow_params_add,
                                                                             device_start_pattern_name='port_pid', 
@@ -145,7 +152,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
                 # nscamshow section start
                 elif re.search(pattern_dct['switchcmd_nscamshow'], line) and not collected['nscamshow']:
                     collected['nscamshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_nscamshow_lst = san_device_ports_section_extract(san_nscamshow_lst, pattern_dct, line, file, 
                                                                                 switch_info_lst, nsshow_params, nsshow_params_add,
                                                                                 device_start_pattern_name='port_pid', 
@@ -8,14 +8,17 @@ import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
-import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 from .zoning_sections import (peer_zoning_section_extract,
                               regular_zoning_section_extract)
 
 
+@prof.profile_step('extract')
 def zoning_extract(switch_params_df, project_constants_lst):
     """Function to extract zoning information"""
 
@@ -50,19 +53,18 @@ def zoning_extract(switch_params_df, project_constants_lst):
         san_peerzone_effective_lst = []
         san_peerzone_lst = []
 
+        # current operation information string for each switch
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} zoning. Switch role: {switch_params_sr["switchRole"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # check Principal switches only
+        extract_flags = (switch_params_df["switchRole"] == 'Principal').tolist()
         # checking each switch for switch level parameters
-        for i, switch_params_sr in switch_params_df.iterrows():       
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} zoning. Switch role: {switch_params_sr["switchRole"]}'
-            print(info, end =" ")
-
-            if switch_params_sr["switchRole"] == 'Principal':
-                sw_zone_lst = current_config_extract(san_cfg_lst, san_zone_lst, san_peerzone_lst, san_alias_lst, 
-                                                        san_cfg_effective_lst, san_zone_effective_lst, san_peerzone_effective_lst, 
-                                                        pattern_dct, switch_params_sr)
-                meop.show_collection_status(sw_zone_lst, max_title, len(info))
-            else:
-                meop.status_info('skip', max_title, len(info))
+        switch_configs_extract(current_config_extract, 
+                                [san_cfg_lst, san_zone_lst, san_peerzone_lst, san_alias_lst, 
+                                 san_cfg_effective_lst, san_zone_effective_lst, san_peerzone_effective_lst], 
+                                pattern_dct, switch_params_lst, info_lst, project_constants_lst, 
+                                extract_flags=extract_flags)
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'cfg_columns', 'zone_columns', 'alias_columns',
                                                                 'cfg_effective_columns', 'zone_effective_columns',
@@ -101,17 +103,20 @@ def current_config_extract(san_cfg_lst, san_zone_lst, san_peerzone_lst, san_alia
     if switch_role == 'Principal':
         # principal_switch_lst contains sshow_file, chassis_name, switch_index, switch_name, switch_fid
         principal_switch_lst = [*switch_info_lst[:6], switch_info_lst[7]]                                                        
+        # section start patterns to move cursor to
+        section_patterns = [pattern_dct['switchcmd_cfgshow'], pattern_dct['switchcmd_peerzone']]
+        sshow_index = sshow_file_index(sshow_file)
         # search control dictionary. continue to check sshow_file until all parameters groups are found
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()
+                line = goto_sshow_section(file, sshow_index, section_patterns)
                 if not line:
                     break
                 # cfgshow section start
                 if re.search(pattern_dct['switchcmd_cfgshow'], line) and not collected['cfgshow']:
                     collected['cfgshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_zone_lst = regular_zoning_section_extract(san_cfg_lst, san_zone_lst, san_alias_lst, 
                                                                         san_cfg_effective_lst, san_zone_effective_lst, pattern_dct,
                                                                         principal_switch_lst, line, file) 
@@ -120,7 +125,7 @@ def current_config_extract(san_cfg_lst, san_zone_lst, san_peerzone_lst, san_alia
                 elif re.search(pattern_dct['switchcmd_peerzone'], line) and not collected['peerzone']:
                     # when section is found corresponding collected dict values changed to True
                     collected['peerzone'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = peer_zoning_section_extract(san_peerzone_lst, san_peerzone_effective_lst, pattern_dct,
                                                         principal_switch_lst, line, file)
                 # peerzone section end
@@ -3,6 +3,7 @@
 import re
 
 import utilities.data_structure_operations as dsop
+import utilities.regular_expression_operations as reop
 
 
 def regular_zoning_section_extract(san_cfg_lst, san_zone_lst, san_alias_lst, san_cfg_effective_lst, san_zone_effective_lst, 
@@ -19,7 +20,7 @@ def regular_zoning_section_extract(san_cfg_lst, san_zone_lst, san_alias_lst, san
     # switchcmd_end_comp
     while not re.search(pattern_dct['switchcmd_end'], line):                               
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # if Effective configuration line passed
         if match_dct['effective']:
             effective = True                                     
@@ -117,7 +118,7 @@ def peer_zoning_section_extract(san_peerzone_lst, san_peerzone_effective_lst, pa
     # switchcmd_end_comp
     while not re.search(pattern_dct['switchcmd_end'], line):
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}                              
+        match_dct = reop.match_line(pattern_dct, line)                              
         # if Effective configuration line passed
         if match_dct['effective']:
             peerzone_effective = True                                     
@@ -129,7 +130,7 @@ def peer_zoning_section_extract(san_peerzone_lst, san_peerzone_effective_lst, pa
             # zoning_switchcmd_end_comp separates different zones
             while not re.search(pattern_dct['zoning_switchcmd_end'], line):
                 # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}  
+                match_dct = reop.match_line(pattern_dct, line)  
                 # peerzone_property_match
                 if match_dct['peerzone_property']:
                     # peerzone_property is tuple. contains property member ot created by info
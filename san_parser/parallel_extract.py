@@ -0,0 +1,145 @@
+"""Module to extract data from switch configuration files in parallel worker processes.
+Each worker runs current_config_extract function of the parser module for a single switch.
+Collected data are merged back and collection status is shown in the original switch order.
+Switches with unchanged inputs are not parsed and their data are taken from the switch cache.
+Extraction time of each parsed switch is added to the step profiling records"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+
+import utilities.module_execution as meop
+import utilities.step_profiling as prof
+
+from . import sshow_index as sidx
+from . import switch_cache as swc
+
+
+def switch_configs_extract(current_config_extract, san_collected_lst, pattern_dct, switch_config_lst, info_lst,
+                            project_constants_lst, *extract_params, extract_flags=None):
+    """Function to extract data from configuration files of all switches with current_config_extract function.
+    san_collected_lst contains lists (or dictionary of lists) to store collected data for all switches in SAN.
+    current_config_extract is called with san_collected_lst items, pattern_dct,
+    switch_config_lst item and extract_params as arguments.
+    Switches with False in extract_flags are skipped.
+    Data of the switches with unchanged configuration files are taken from the switch cache"""
+
+    _, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    workers_num = meop.workers_number(report_requisites_sr, 'parser_workers')
+    cache_folder = swc.switch_cache_folder(report_requisites_sr)
+
+    if extract_flags is None:
+        extract_flags = [True] * len(switch_config_lst)
+
+    # switch cache entries and data collected on previous program execution
+    cache_entry_lst = [swc.switch_cache_entry(cache_folder, current_config_extract, pattern_dct, switch_config, extract_params) 
+                        if extract_flag else None for switch_config, extract_flag in zip(switch_config_lst, extract_flags)]
+    cached_data_lst = [swc.load_switch_cache(cache_entry) for cache_entry in cache_entry_lst]
+    # switches with changed configuration files
+    extract_required_lst = [extract_flag and cached_data is None 
+                            for extract_flag, cached_data in zip(extract_flags, cached_data_lst)]
+
+    # serial mode
+    if workers_num == 1 or sum(extract_required_lst) < 2:
+        for info, switch_config, extract_flag, cache_entry, sw_data in \
+            zip(info_lst, switch_config_lst, extract_flags, cache_entry_lst, cached_data_lst):
+            print(info, end =" ")
+            if not extract_flag:
+                meop.status_info('skip', max_title, len(info))
+                continue
+            if sw_data is None:
+                sw_data, measurement = prof.measure_call(single_config_extract, current_config_extract, san_collected_lst, 
+                                                            pattern_dct, switch_config, extract_params)
+                swc.save_switch_cache(cache_entry, *sw_data)
+                prof.add_switch_record(switch_title(info), measurement, collected_rows(sw_data[0]))
+            add_switch_data(san_collected_lst, *sw_data, max_title, len(info))
+        return
+
+    # parallel mode. sshow file indexes created on previous steps are passed to each worker
+    with ProcessPoolExecutor(max_workers=workers_num, initializer=init_worker,
+                                initargs=(sidx.sshow_index_cache,)) as executor:
+        # each worker collects data of a single switch into empty containers
+        futures = [executor.submit(worker_config_extract, current_config_extract, san_collected_lst, 
+                                    pattern_dct, switch_config, extract_params) if extract_required else None
+                    for switch_config, extract_required in zip(switch_config_lst, extract_required_lst)]
+        # results are taken in the original switch order
+        for info, extract_flag, cache_entry, sw_data, future in \
+            zip(info_lst, extract_flags, cache_entry_lst, cached_data_lst, futures):
+            print(info, end =" ")
+            if not extract_flag:
+                meop.status_info('skip', max_title, len(info))
+                continue
+            if future is not None:
+                *sw_data, sw_sshow_index_cache, measurement = future.result()
+                sidx.sshow_index_cache.update(sw_sshow_index_cache)
+                swc.save_switch_cache(cache_entry, *sw_data)
+                prof.add_switch_record(switch_title(info), measurement, collected_rows(sw_data[0]))
+            add_switch_data(san_collected_lst, *sw_data, max_title, len(info))
+
+
+def init_worker(sshow_index_cache):
+    """Function to initialize worker process with sshow file indexes created in the main process"""
+
+    sidx.sshow_index_cache.update(sshow_index_cache)
+
+
+def worker_config_extract(current_config_extract, san_collected_lst, pattern_dct, switch_config, extract_params):
+    """Function to extract data from the configuration file of a single switch in worker process.
+    Returns collected data, data to show collection status, sshow file indexes created in the worker
+    and extraction time measurement"""
+
+    indexed_files = {sshow_file: sshow_index['file_stat'] for sshow_file, sshow_index in sidx.sshow_index_cache.items()}
+    (sw_san_collected_lst, sw_collected_lst), measurement = prof.measure_call(
+        single_config_extract, current_config_extract, san_collected_lst, pattern_dct, switch_config, extract_params)
+    sw_sshow_index_cache = {sshow_file: sshow_index for sshow_file, sshow_index in sidx.sshow_index_cache.items()
+                                if indexed_files.get(sshow_file) != sshow_index['file_stat']}
+    return sw_san_collected_lst, sw_collected_lst, sw_sshow_index_cache, measurement
+
+
+def single_config_extract(current_config_extract, san_collected_lst, pattern_dct, switch_config, extract_params):
+    """Function to extract data from the configuration file of a single switch into empty containers.
+    Returns collected data and data to show collection status"""
+
+    sw_san_collected_lst = [empty_collected_data(san_collected) for san_collected in san_collected_lst]
+    sw_collected_lst = current_config_extract(*sw_san_collected_lst, pattern_dct, switch_config, *extract_params)
+    return sw_san_collected_lst, sw_collected_lst
+
+
+def add_switch_data(san_collected_lst, sw_san_collected_lst, sw_collected_lst, max_title, len_info_string):
+    """Function to add data collected for a single switch to the data collected for all switches in SAN
+    and show collection status"""
+
+    for san_collected, sw_san_collected in zip(san_collected_lst, sw_san_collected_lst):
+        merge_collected_data(san_collected, sw_san_collected)
+    meop.show_collection_status(sw_collected_lst, max_title, len_info_string)
+
+
+def empty_collected_data(san_collected):
+    """Function returns empty container of the san_collected type (list or dictionary of lists)"""
+
+    if isinstance(san_collected, dict):
+        return dict((key, []) for key in san_collected)
+    return []
+
+
+def merge_collected_data(san_collected, sw_san_collected):
+    """Function to add data collected for a single switch to the data collected for all switches in SAN"""
+
+    if isinstance(san_collected, dict):
+        for key, values in sw_san_collected.items():
+            san_collected[key].extend(values)
+    else:
+        san_collected.extend(sw_san_collected)
+
+
+def collected_rows(sw_san_collected_lst):
+    """Function returns number of rows collected for a single switch"""
+
+    return sum(sum(len(values) for values in sw_san_collected.values()) if isinstance(sw_san_collected, dict) 
+                else len(sw_san_collected) for sw_san_collected in sw_san_collected_lst)
+
+
+def switch_title(info):
+    """Function returns switch title from the collection status information string
+    ('[1 of 10]: switch_name switch ...' -> 'switch_name switch ...')"""
+
+    return info.split(']: ', 1)[-1]
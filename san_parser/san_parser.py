@@ -1,5 +1,7 @@
 """Main module to extract data from switch, blade system, synergy system, 3PAR configuration files"""
 
+import utilities.step_profiling as prof
+
 from .bladesystem import blade_system_extract, synergy_system_extract
 from .fabric_routing import (fabric_membership_extract, fcr_membership_extract,
                              interswitch_connection_extract)
@@ -12,6 +14,7 @@ from .switch_params import (chassis_params_extract, maps_params_extract,
 from .switch_ports import portcfg_sfp_extract, portcmd_extract
 
 
+@prof.profile_step('stage')
 def system_configuration_extract(parsed_sshow_maps_lst, project_constants_lst, software_path_sr):
     """Main function to extract system configuration files"""
 
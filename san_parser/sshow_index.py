@@ -0,0 +1,88 @@
+"""Module to index supportshow file in a single pass.
+Index contains byte offsets of section headers ('| Section: SSHOW_PORT |'),
+logical switch context markers ('CURRENT CONTEXT -- 128 , 1'),
+command start ('SWITCHCMD /fabos/cliexec/islshow :') and command end ('real 0m0.090s', '** SS CMD END **') lines.
+Extractors move file cursor directly to the required section instead of reading sshow file from the first line"""
+
+
+import os
+import re
+from bisect import bisect_left
+
+# indexes of sshow files discovered during current program execution
+sshow_index_cache = {}
+
+context_pattern = re.compile(rb'^CURRENT CONTEXT -- (\d+) *, \d+$')
+
+
+def sshow_file_index(sshow_file):
+    """Function returns index of the sshow_file.
+    Index is created once for each sshow file and reused by all extractors.
+    Index is recreated if sshow file size or modification time changed"""
+
+    sshow_stat = os.stat(sshow_file)
+    file_stat = (sshow_stat.st_size, sshow_stat.st_mtime_ns)
+    sshow_index = sshow_index_cache.get(sshow_file)
+    if sshow_index is None or sshow_index['file_stat'] != file_stat:
+        sshow_index = index_sshow_file(sshow_file)
+        sshow_index['file_stat'] = file_stat
+        sshow_index_cache[sshow_file] = sshow_index
+    return sshow_index
+
+
+def index_sshow_file(sshow_file):
+    """Function reads sshow_file once and collects byte offsets and text
+    of the section header, command start and command end lines (lines, offsets).
+    Byte offsets of CURRENT CONTEXT lines are collected for each switch index (contexts)"""
+
+    offsets = []
+    lines = []
+    contexts = {}
+    offset = 0
+
+    with open(sshow_file, 'rb') as file:
+        for line in file:
+            line_stripped = line.rstrip()
+            # logical switch context line
+            if line_stripped.startswith(b'CURRENT CONTEXT'):
+                context_match = context_pattern.match(line.rstrip(b'\r\n'))
+                if context_match:
+                    contexts.setdefault(context_match.group(1).decode(), []).append(offset)
+            # section header, command start and command end lines
+            elif line_stripped.endswith((b':', b'|', b']')) or line_stripped.startswith((b'real ', b'** SS CMD END')):
+                offsets.append(offset)
+                lines.append(line.rstrip(b'\r\n').decode('utf-8', errors='ignore'))
+            offset += len(line)
+    return {'offsets': offsets, 'lines': lines, 'contexts': contexts, 'file_size': offset}
+
+
+def goto_sshow_section(file, sshow_index, section_patterns):
+    """Function to move cursor to the next indexed line after the current file position
+    which matches any of the section_patterns.
+    Returns matched line or empty string if no section found till the end of file"""
+
+    start_idx = bisect_left(sshow_index['offsets'], file.tell())
+    for offset, indexed_line in zip(sshow_index['offsets'][start_idx:], sshow_index['lines'][start_idx:]):
+        if any(re.search(section_pattern, indexed_line) for section_pattern in section_patterns):
+            file.seek(offset)
+            return file.readline()
+    # move cursor to the end of file if section is not found
+    file.seek(sshow_index['file_size'])
+    return ''
+
+
+def goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index):
+    """Function to move cursor to the switch_index context
+    within section of the corresponding command if Logical switch mode is ON.
+    Cursor is moved with the sshow file index instead of line by line reading"""
+
+    if ls_mode_on:
+        context_offsets = sshow_index['contexts'].get(str(switch_index), [])
+        context_idx = bisect_left(context_offsets, file.tell())
+        if context_idx < len(context_offsets):
+            file.seek(context_offsets[context_idx])
+            line = file.readline()
+        else:
+            file.seek(sshow_index['file_size'])
+            line = ''
+    return line
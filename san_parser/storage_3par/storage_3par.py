@@ -12,11 +12,13 @@ import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
 from .storage_3par_download import configs_download
 from .storage_3par_extract import storage_params_extract
 
 
+@prof.profile_step('extract')
 def storage_3par_extract(nsshow_df, nscamshow_df, project_constants_lst, software_path_sr):
     """Function to extract 3PAR storage information"""
     
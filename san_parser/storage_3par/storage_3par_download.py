@@ -11,6 +11,7 @@ import numpy as np
 import utilities.dataframe_operations as dfop
 import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
+import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 
 
@@ -249,7 +250,7 @@ def parse_serial(config_3par, pattern_dct):
                 while not re.search(pattern_dct['section_end'],line):
                     line = file.readline()
                     # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                    match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                    match_dct = reop.match_line(pattern_dct, line)
                     # name_value_pair_match
                     if match_dct['serial_number']:
                         result = match_dct['serial_number']
@@ -8,10 +8,12 @@ import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
 import utilities.filesystem_operations as fsop
+import utilities.step_profiling as prof
 
 from .storage_oceanstor_extract import *
 
 
+@prof.profile_step('extract')
 def storage_oceanstor_extract(project_constants_lst):
     """Function to extract Huawei OceanStor storage information"""
 
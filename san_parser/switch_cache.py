@@ -0,0 +1,208 @@
+"""Module to cache data extracted from configuration files of each switch.
+Cache entry is created for each parser function and switch configuration files.
+Entry is valid if content of configuration files (size, modification time and sha1 hash),
+regular expression patterns, parser code (extractor module and project modules it uses)
+and extract parameters are not changed.
+Only switches with changed inputs are parsed on the program rerun"""
+
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+
+import pandas as pd
+
+# cache entry format version. entries with other version are ignored
+CACHE_VERSION = 1
+# size of the block read to calculate file hash
+HASH_BLOCK_SIZE = 1024 * 1024
+# file hashes calculated during current program execution {filepath: (file_stat, file_hash)}
+file_hash_cache = {}
+# parser code hashes calculated during current program execution {module name: code hash}
+extractor_code_hashes = {}
+# project folder. only project modules are verified for parser code changes
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# top level packages and modules of the project
+PROJECT_PACKAGES = {os.path.splitext(name)[0] for name in os.listdir(PROJECT_FOLDER) 
+                    if name.endswith('.py') or os.path.isfile(os.path.join(PROJECT_FOLDER, name, '__init__.py'))}
+
+
+def switch_cache_folder(report_requisites_sr):
+    """Function returns folder to save switch cache entries (switch_cache folder in the database folder).
+    If folder doesn't exist then cache is not used"""
+
+    database_folder = report_requisites_sr.get('database_folder')
+    if not database_folder or pd.isna(database_folder):
+        return
+    cache_folder = os.path.join(database_folder, 'switch_cache')
+    if os.path.isdir(cache_folder):
+        return cache_folder
+
+
+def switch_cache_entry(cache_folder, current_config_extract, pattern_dct, switch_config, extract_params):
+    """Function returns cache entry description for the current_config_extract function and
+    switch_config (filepath, version and configuration files to verify).
+    Returns None if cache is not used or switch has no configuration files"""
+
+    if cache_folder is None:
+        return
+    config_files = switch_config_files(switch_config)
+    if not config_files:
+        return
+    extractor_name = f'{current_config_extract.__module__}.{current_config_extract.__qualname__}'
+    entry_name = data_hash(extractor_name, config_files)
+    entry_version = data_hash(CACHE_VERSION, extractor_code_hash(current_config_extract),
+                                pattern_dct_version(pattern_dct),
+                                normalize_data(switch_config), normalize_data(extract_params))
+    return {'filepath': os.path.join(cache_folder, entry_name + '.pickle'),
+            'version': entry_version, 'config_files': config_files}
+
+
+def load_switch_cache(cache_entry):
+    """Function returns data (collected data and data to show collection status)
+    saved in the cache_entry on previous program execution.
+    Returns None if entry doesn't exist or any of the switch inputs changed"""
+
+    if cache_entry is None or not os.path.isfile(cache_entry['filepath']):
+        return
+    try:
+        with open(cache_entry['filepath'], 'rb') as file:
+            cached_entry = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return
+    if cached_entry.get('version') != cache_entry['version'] \
+        or cached_entry.get('config_files') != cache_entry['config_files']:
+        return
+
+    # configuration files are not modified
+    file_stats = [file_stat(config_file) for config_file in cache_entry['config_files']]
+    if file_stats == cached_entry['file_stats']:
+        return cached_entry['data']
+    # configuration files are modified but content is the same (files exported again)
+    file_hashes = [file_hash(config_file) for config_file in cache_entry['config_files']]
+    if file_hashes == cached_entry['file_hashes']:
+        save_switch_cache(cache_entry, *cached_entry['data'])
+        return cached_entry['data']
+
+
+def save_switch_cache(cache_entry, sw_san_collected_lst, sw_collected_lst):
+    """Function to save data collected for a single switch to the cache_entry"""
+
+    if cache_entry is None:
+        return
+    cached_entry = {'version': cache_entry['version'],
+                    'config_files': cache_entry['config_files'],
+                    'file_stats': [file_stat(config_file) for config_file in cache_entry['config_files']],
+                    'file_hashes': [file_hash(config_file) for config_file in cache_entry['config_files']],
+                    'data': (sw_san_collected_lst, sw_collected_lst)}
+    # entry is written to temporary file first to avoid broken entry if program is interrupted
+    tmp_filepath = cache_entry['filepath'] + '.tmp'
+    try:
+        with open(tmp_filepath, 'wb') as file:
+            pickle.dump(cached_entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, cache_entry['filepath'])
+    except OSError:
+        print(f"\nWARNING. Can't save {os.path.basename(cache_entry['filepath'])} switch cache entry")
+
+
+def switch_config_files(switch_config):
+    """Function returns list of existing files in switch_config values
+    (sshow file, ams_maps files)"""
+
+    if isinstance(switch_config, str):
+        return [os.path.normpath(switch_config)] if os.path.isfile(switch_config) else []
+    if isinstance(switch_config, pd.Series):
+        switch_config = switch_config.tolist()
+    config_files = []
+    if isinstance(switch_config, (list, tuple)):
+        for value in switch_config:
+            for config_file in switch_config_files(value):
+                if not config_file in config_files:
+                    config_files.append(config_file)
+    return config_files
+
+
+def file_stat(filepath):
+    """Function returns file size and modification time"""
+
+    filepath_stat = os.stat(filepath)
+    return (filepath_stat.st_size, filepath_stat.st_mtime_ns)
+
+
+def file_hash(filepath):
+    """Function returns sha1 hash of the file content.
+    Hash is calculated once for each file during program execution"""
+
+    current_file_stat = file_stat(filepath)
+    hash_stat, hash_value = file_hash_cache.get(filepath, (None, None))
+    if hash_stat != current_file_stat:
+        sha1 = hashlib.sha1()
+        with open(filepath, 'rb') as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+                sha1.update(block)
+        hash_value = sha1.hexdigest()
+        file_hash_cache[filepath] = (current_file_stat, hash_value)
+    return hash_value
+
+
+def extractor_code_hash(current_config_extract):
+    """Function returns hash of the module with current_config_extract function and
+    all project modules used by it (section extractors, sshow index, regular expression operations)
+    to invalidate cache entries if parser code is changed"""
+
+    module_name = current_config_extract.__module__
+    if not module_name in extractor_code_hashes:
+        source_files = sorted(module_source_files(sys.modules.get(module_name)))
+        extractor_code_hashes[module_name] = \
+            data_hash([(os.path.relpath(source_file, PROJECT_FOLDER), file_hash(source_file)) for source_file in source_files])
+    return extractor_code_hashes[module_name]
+
+
+def module_source_files(module, source_files=None):
+    """Function returns set of the project source files of the module and modules it uses 
+    (imported modules and modules of the imported functions and classes)"""
+
+    if source_files is None:
+        source_files = set()
+    # modules outside of the project (standard library, pandas) are not verified
+    if module is None or not module.__name__.split('.')[0] in PROJECT_PACKAGES:
+        return source_files
+    try:
+        source_file = inspect.getsourcefile(module)
+    except TypeError:
+        return source_files
+    if not source_file or source_file in source_files:
+        return source_files
+    source_files.add(source_file)
+    for value in vars(module).values():
+        if inspect.ismodule(value):
+            module_source_files(value, source_files)
+        elif inspect.isfunction(value) or inspect.isclass(value):
+            module_source_files(sys.modules.get(value.__module__), source_files)
+    return source_files
+
+
+def pattern_dct_version(pattern_dct):
+    """Function returns version of the regular expression patterns"""
+
+    return data_hash([(pattern_name, pattern.pattern, pattern.flags)
+                        for pattern_name, pattern in sorted(pattern_dct.items())])
+
+
+def normalize_data(data):
+    """Function converts Series, lists and tuples to the lists of strings
+    to get the same hash for the same values regardless of the data types"""
+
+    if isinstance(data, pd.Series):
+        return [[str(index), normalize_data(value)] for index, value in data.items()]
+    if isinstance(data, (list, tuple)):
+        return [normalize_data(value) for value in data]
+    return str(data)
+
+
+def data_hash(*args):
+    """Function returns sha1 hash of args"""
+
+    return hashlib.sha1(repr(args).encode('utf-8')).hexdigest()
@@ -9,8 +9,13 @@ import utilities.module_execution as meop
 import utilities.servicefile_operations as sfop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, sshow_file_index
 
+
+@prof.profile_step('extract')
 def sensor_extract(chassis_params_df, project_constants_lst):
     """Function to extract sensor information"""  
 
@@ -39,14 +44,13 @@ def sensor_extract(chassis_params_df, project_constants_lst):
         # nested list(s) to store required values of the module in defined order for all switches in SAN
         san_sensor_lst = []
 
+        # current operation information string for each chassis
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} sensor readings' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
         # checking each chassis for switch level parameters
-        for i, chassis_params_sr in chassis_params_df.iterrows():   
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} sensor readings'
-            print(info, end =" ")  
-
-            sw_sensor_lst = current_config_extract(san_sensor_lst, pattern_dct, chassis_params_sr)
-            meop.show_collection_status(sw_sensor_lst, max_title, len(info))     
+        switch_configs_extract(current_config_extract, [san_sensor_lst], pattern_dct, 
+                                chassis_params_lst, info_lst, project_constants_lst)
     
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'sensor_columns')
@@ -74,11 +78,14 @@ def current_config_extract(san_sensor_lst, pattern_dct, chassis_params_sr):
                            
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'sensor': False}
+    # section start patterns to move cursor to
+    section_patterns = [pattern_dct['switchcmd_sensorhow']]
+    sshow_index = sshow_file_index(sshow_file)
 
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            line = goto_sshow_section(file, sshow_index, section_patterns)                        
             if not line:
                 break
             # sensor section start   
@@ -11,9 +11,13 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 from san_automation_constants import DIRECTOR_TYPE
 
+from ..parallel_extract import switch_configs_extract
 
+
+@prof.profile_step('extract')
 def chassis_params_extract(all_config_data, project_constants_lst):
     """Function to extract chassis parameters"""
     
@@ -47,16 +51,14 @@ def chassis_params_extract(all_config_data, project_constants_lst):
 
         
         # all_confg_data format ([swtch_name, supportshow file, (ams_maps_log files, ...)])
+        # current operation information string for each config set
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_name} chassis parameters' 
+                    for i, (switch_name, *_) in enumerate(all_config_data)]
         # checking each config set(supportshow file) for chassis level parameters
-        for i, switch_config_data in enumerate(all_config_data):
-            
-            switch_name, *_ = switch_config_data
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_name} chassis parameters'
-            print(info, end =" ")
-            ch_params_lst = current_config_extract(san_chassis_params_lst, san_slot_status_lst, san_licenseport_lst, san_chassisshow_lst, 
-                                                   pattern_dct, switch_config_data, chassis_params, chassis_params_add, chassisshow_params)
-            meop.show_collection_status(ch_params_lst, max_title, len(info))
+        switch_configs_extract(current_config_extract, 
+                                [san_chassis_params_lst, san_slot_status_lst, san_licenseport_lst, san_chassisshow_lst], 
+                                pattern_dct, all_config_data, info_lst, project_constants_lst, 
+                                chassis_params, chassis_params_add, chassisshow_params)
         
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'chassis_columns', 'chassis_slot_columns', 'licenseport_columns', 'chassisshow_columns')
@@ -248,7 +250,7 @@ def configshow_section_extract(chassis_params_dct, snmp_target_lst, syslog_lst,
     while not re.search(pattern_dct['switchcmd_configshow_end'],line):
         line = file.readline()
         # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()} 
+        match_dct = reop.match_line(pattern_dct, line) 
         # 'chassis_param_match' pattern #0
         if match_dct['chassis_param']:
             chassis_params_dct[match_dct['chassis_param'].group(1).rstrip()] = match_dct['chassis_param'].group(2).rstrip()                            
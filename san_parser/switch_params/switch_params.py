@@ -10,8 +10,13 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 
+
+@prof.profile_step('extract')
 def switch_params_extract(chassis_params_df, project_constants_lst):
     """Function to extract switch parameters"""
 
@@ -42,14 +47,14 @@ def switch_params_extract(chassis_params_df, project_constants_lst):
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('switch', max_title)
         switch_params, switch_params_add = dfop.list_from_dataframe(re_pattern_df, 'switch_params', 'switch_params_add')
         
+        # current operation information string for each chassis
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch parameters. Number of LS: {chassis_params_sr["Number_of_LS"]}' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
         # checking each chassis for switch level parameters
-        for i, chassis_params_sr in chassis_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch parameters. Number of LS: {chassis_params_sr["Number_of_LS"]}'
-            print(info, end =" ")
-            sw_params_lst = current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, pattern_dct, 
-                                                                    chassis_params_sr, switch_params, switch_params_add)       
-            meop.show_collection_status(sw_params_lst, max_title, len(info))
+        switch_configs_extract(current_config_extract, [san_switch_params_lst, san_switchshow_ports_lst], pattern_dct, 
+                                chassis_params_lst, info_lst, project_constants_lst, 
+                                switch_params, switch_params_add)
                                
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'switch_columns', 'switchshow_portinfo_columns')
@@ -81,6 +86,8 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
     ls_mode = ('ON' if not chassis_params_sr["Number_of_LS"] in ['0', None] else 'OFF')
     # logical switches indexes. if switch is in Non-VF mode then ls_id is 0
     ls_ids = chassis_params_sr['LS_IDs'].split(', ') if chassis_params_sr['LS_IDs'] else ['0']               
+    # sshow file is read once to index sections for all logical switches
+    sshow_index = sshow_file_index(sshow_file)
     
     # check each logical switch in chassis
     for i in ls_ids:
@@ -88,15 +95,18 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
         collected = {'configshow': False, 'switchshow': False}
         # dictionary to store all DISCOVERED switch parameters
         # collecting data only for the logical switch in current loop
-        switch_params_dct = {}      
+        switch_params_dct = {}
+        # section start patterns to move cursor to
+        switch_configshow_start = re.compile(fr'^\[Switch +Configuration +Begin *: *{i}\] *$')
+        section_patterns = [switch_configshow_start, pattern_dct['switchcmd_switchshow']]
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()                        
+                line = goto_sshow_section(file, sshow_index, section_patterns)
                 if not line:
                     break
                 # configshow section start
-                if re.search(fr'^\[Switch +Configuration +Begin *: *{i}\] *$', line) and not collected['configshow']:
+                if re.search(switch_configshow_start, line) and not collected['configshow']:
                     # when section is found corresponding collected dict values changed to True
                     collected['configshow'] = True
                     # add pattern depending on current switch_index
@@ -110,7 +120,7 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
                 # switchshow section start
                 elif re.search(pattern_dct['switchcmd_switchshow'], line) and not collected['switchshow']:
                     collected['switchshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, i)
+                    line = goto_switch_context(ls_mode_on, line, file, i, sshow_index)
                     line = switchshow_section_extract(switch_params_dct, san_switchshow_ports_lst, pattern_dct, 
                                                         chassis_info_lst, line, file, i)                    
                 # switchshow section end
@@ -136,7 +146,7 @@ def switchshow_section_extract(switch_params_dct, switchshow_ports_lst, pattern_
 
     while not re.search(pattern_dct['switchcmd_end'],line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # 'switch_switchshow_match' pattern #1
         if match_dct['switchshow_param']:
             switch_params_dct[match_dct['switchshow_param'].group(1).rstrip()] = match_dct['switchshow_param'].group(2).rstrip()
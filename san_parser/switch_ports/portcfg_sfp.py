@@ -6,14 +6,17 @@ import re
 import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
-import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, goto_switch_context, sshow_file_index
 from .portcfg_sfp_sections import (portcfgshow_section_extract,
                                    sfpshow_section_extract)
 
 
+@prof.profile_step('extract')
 def portcfg_sfp_extract(switch_params_df, project_constants_lst):
     """Function to extract switch port information"""
     
@@ -46,13 +49,13 @@ def portcfg_sfp_extract(switch_params_df, project_constants_lst):
         # list to save portcfg information for all ports in fabric
         san_portcfgshow_lst = []
         
-        for i, switch_params_sr in switch_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} ports sfp and cfg'
-            print(info, end =" ")                      
-            sw_sfpshow_lst = current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
-                                    switch_params_sr, sfp_params, sfp_params_add, portcfg_params)                     
-            meop.show_collection_status(sw_sfpshow_lst, max_title, len(info))
+        # current operation information string for each switch
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} ports sfp and cfg' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        switch_configs_extract(current_config_extract, [san_sfpshow_lst, san_portcfgshow_dct], pattern_dct, 
+                                switch_params_lst, info_lst, project_constants_lst, 
+                                sfp_params, sfp_params_add, portcfg_params)
         # after check all config files create list of lists from dictionary. 
         # each nested list contains portcfg information for one port
         for portcfg_param in portcfg_params:
@@ -88,16 +91,19 @@ def current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
 
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'sfpshow': False, 'portcfgshow': False}
+    # section start patterns to move cursor to
+    section_patterns = [pattern_dct['switchcmd_sfpshow'], pattern_dct['switchcmd_portcfgshow']]
+    sshow_index = sshow_file_index(sshow_file)
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            line = goto_sshow_section(file, sshow_index, section_patterns)                        
             if not line:
                 break
             # sfpshow section start
             if re.search(pattern_dct['switchcmd_sfpshow'], line) and not collected['sfpshow']:
                 collected['sfpshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_sfpshow_lst = sfpshow_section_extract(san_sfpshow_lst, pattern_dct, 
                                                 switch_info_lst, sfp_params, sfp_params_add, 
                                                 line, file)
@@ -105,7 +111,7 @@ def current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
             # portcfgshow section start
             if re.search(pattern_dct['switchcmd_portcfgshow'], line) and not collected['portcfgshow']:
                 collected['portcfgshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line = portcfgshow_section_extract(san_portcfgshow_dct, pattern_dct, 
                                                     switch_info_lst, portcfg_params, 
                                                     line, file)
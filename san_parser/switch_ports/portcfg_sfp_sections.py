@@ -4,6 +4,7 @@
 import re
 
 import utilities.data_structure_operations as dsop
+import utilities.regular_expression_operations as reop
 
 
 def sfpshow_section_extract(sfpshow_lst, pattern_dct, 
@@ -16,7 +17,7 @@ def sfpshow_section_extract(sfpshow_lst, pattern_dct,
 
     while not re.search(pattern_dct['switchcmd_end'],line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         if match_dct['slot_port']:
             # dictionary to store all DISCOVERED switch ports information
             # collecting data only for the logical switch in current loop
@@ -26,7 +27,7 @@ def sfpshow_section_extract(sfpshow_lst, pattern_dct,
             slot_num = '0' if not slot_num else slot_num
             while not re.match('\r?\n', line):
                 line = file.readline()
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # power_match
                 if match_dct['power']:
                     sfp_power_lst = dsop.line_to_list(pattern_dct['power'], line)
@@ -77,7 +78,7 @@ def portcfgshow_section_extract(san_portcfgshow_dct, pattern_dct,
 
     while not re.search(pattern_dct['switchcmd_portcfgshow_end'],line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # 'slot_port_line_match'
         if match_dct['slot_port_line']:
             # dictionary to store all DISCOVERED switch ports information
@@ -96,7 +97,7 @@ def portcfgshow_section_extract(san_portcfgshow_dct, pattern_dct,
             sw_portcfgshow_dct[portcfg_params[7]] = port_nums_lst                                
             while not re.match('\r?\n', line):
                 line = file.readline()
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # portcfg_match
                 if match_dct['portcfg']:
                     # extract param name and values for each port and adding to dictionary
@@ -6,12 +6,17 @@ import re
 import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
+import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.step_profiling as prof
 
+from ..parallel_extract import switch_configs_extract
+from ..sshow_index import goto_sshow_section, sshow_file_index
 from .portcmd_sections import port_fc_portcmd_section_extract
 
 
+@prof.profile_step('extract')
 def portcmd_extract(chassis_params_df, project_constants_lst):
     """Function to extract portshow, portloginshow, portstatsshow information"""
 
@@ -40,14 +45,13 @@ def portcmd_extract(chassis_params_df, project_constants_lst):
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('portcmd', max_title)
         portcmd_params, portcmd_params_add = dfop.list_from_dataframe(re_pattern_df, 'portcmd_params', 'portcmd_params_add')
         
-        # for i, chassis_params_data in enumerate(chassis_params_fabric_lst):
-        for i, chassis_params_sr in chassis_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch portshow, portloginshow and statsshow'
-            print(info, end =" ")
-            sw_portcmd_lst = current_config_extract(san_portshow_lst, pattern_dct, 
-                            chassis_params_sr, portcmd_params, portcmd_params_add)                  
-            meop.show_collection_status(sw_portcmd_lst, max_title, len(info))
+        # current operation information string for each chassis
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch portshow, portloginshow and statsshow' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
+        switch_configs_extract(current_config_extract, [san_portshow_lst], pattern_dct, 
+                                chassis_params_lst, info_lst, project_constants_lst, 
+                                portcmd_params, portcmd_params_add)
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'portcmd_columns')
         data_lst = dfop.list_to_dataframe(headers_lst, san_portshow_lst)
@@ -75,11 +79,14 @@ def current_config_extract(san_portshow_lst, pattern_dct,
     
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'portshow': False}
+    # section start patterns to move cursor to
+    section_patterns = [pattern_dct['section_sshow_port']]
+    sshow_index = sshow_file_index(sshow_file)
 
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()
+            line = goto_sshow_section(file, sshow_index, section_patterns)
             if not line:
                 break
             # sshow_port section start
@@ -91,7 +98,7 @@ def current_config_extract(san_portshow_lst, pattern_dct,
                     if not line:
                         break
                     # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                    match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                    match_dct = reop.match_line(pattern_dct, line)
                     # portFcPortCmdShow section start
                     if match_dct['slot_port_number']:
                         line, sw_portcmd_lst = port_fc_portcmd_section_extract(san_portshow_lst, pattern_dct, chassis_info_lst, 
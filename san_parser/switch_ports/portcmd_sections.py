@@ -4,6 +4,7 @@
 import re
 
 import utilities.data_structure_operations as dsop
+import utilities.regular_expression_operations as reop
 
 
 def port_fc_portcmd_section_extract(san_portshow_lst, pattern_dct, 
@@ -26,7 +27,7 @@ def port_fc_portcmd_section_extract(san_portshow_lst, pattern_dct,
         line = file.readline()
         if not line:
             break
-    match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+    match_dct = reop.match_line(pattern_dct, line)
     # portshow section start pattern #1
     if match_dct['portshow_port_index']:
         port_index = match_dct['portshow_port_index'].group(1)
@@ -67,7 +68,7 @@ def portshow_section_extract(sw_portcmd_dct, connected_wwn_lst, portphys_portscn
 
     while not re.search(fr'^portloginshow +{int(port_index)}$', line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # two param_names have 1 or 2 values
         if match_dct['portphys_and_portscn']:
             matched_values_lst = dsop.line_to_list(pattern_dct['portphys_and_portscn'], line)
@@ -113,7 +114,7 @@ def portlogin_section_extract(portid_wwn_lst, sw_portcmd_dct, connected_wwn_lst,
 
     while not re.search(fr'^portregshow +{int(port_index)}$', line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # connected_wwn_match pattern #3
         if match_dct['login_connected_wwn']:
             # first value in tuple unpacking is fe or fd and not required
@@ -144,7 +145,7 @@ def portstats_section_extract(sw_portcmd_dct, port_index, pattern_dct, line, fil
 
     while not re.search(fr'^(portstats64show|portcamshow) +{int(port_index)}$', line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # port information without virtual channel numbers pattern #4
         if match_dct['portstats']:
             sw_portcmd_dct[match_dct['portstats'].group(1).rstrip()] = match_dct['portstats'].group(2)
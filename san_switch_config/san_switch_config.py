@@ -54,7 +54,8 @@ def switch_configuration_discover(project_constants_lst, software_path_sr):
     exported_sw_cfg_files_lst, exported_sw_cfg_filenames_lst, ssave_sections_stats_df, export_status_lst = \
         export_ssave_files(discovered_sw_cfg_files_lst, 
                             sshow_export_folder, other_export_folder, 
-                            ssave_sections_stats_df, pattern_dct, max_title)
+                            ssave_sections_stats_df, pattern_dct, max_title, 
+                            meop.workers_number(report_requisites_sr, 'export_workers'))
 
     # export parsed config filenames to DataFrame and saves it to excel file
     exported_sw_cfg_files_df, *_ = dfop.list_to_dataframe(['chassis_name', 'sshow', 'ams_maps'], exported_sw_cfg_filenames_lst)
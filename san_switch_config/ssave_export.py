@@ -2,6 +2,7 @@
 
 import os
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
 
 import pandas as pd
 
@@ -18,10 +19,11 @@ from .sshow_validate import validate_sshow_section_files
 
 
 def export_ssave_files(san_ssave_files_lst, path_to_move_sshow, path_to_move_others, 
-                        ssave_sections_stats_df, pattern_dct, max_title):    
+                        ssave_sections_stats_df, pattern_dct, max_title, export_workers=1):    
     """Check through list for configuration sets for each switch.  
     Config set for each switch is ssave_sys file and list of ssave_ams_maps files.
-    Export ssave files to text configuration files"""
+    Export ssave files to text configuration files.
+    If export_workers is more than one then files are exported in parallel worker processes"""
     
     print('\n\nPREREQUISITES 5. EXPORTING SUPPORTSAVE FILES\n')
     print(f'Switch configuration files are exported to \n{os.path.dirname(path_to_move_sshow)}\n')
@@ -42,46 +44,63 @@ def export_ssave_files(san_ssave_files_lst, path_to_move_sshow, path_to_move_oth
     if ssave_sections_stats_df is None:
         ssave_sections_stats_df = pd.DataFrame(columns=ssave_sections_stats_columns)
 
-    for i, switch_ssave_files_lst in enumerate(san_ssave_files_lst):
-        # extracts switchname from sshow_sys filename
-        switchname = re.search(pattern_dct['switchname_sshow_sys'], os.path.basename(switch_ssave_files_lst[0])).group(1)
-        # number of ams_maps_log files in current configuration set (switch)
-        ssave_ams_maps_files_num = len(switch_ssave_files_lst[1])
-        print(f'[{i+1} of {config_set_num}]: {switchname}. Number of configs: {ssave_ams_maps_files_num+1} ...')
+    # files are exported in worker processes if more than one worker is defined
+    executor = ProcessPoolExecutor(max_workers=export_workers) if export_workers > 1 else None
+    # in parallel mode export info is collected and shown in the original switch order 
+    # after all files are submitted for export
+    export_info_lst = [] if executor else None
+    try:
+        for i, switch_ssave_files_lst in enumerate(san_ssave_files_lst):
+            # extracts switchname from sshow_sys filename
+            switchname = re.search(pattern_dct['switchname_sshow_sys'], os.path.basename(switch_ssave_files_lst[0])).group(1)
+            # number of ams_maps_log files in current configuration set (switch)
+            ssave_ams_maps_files_num = len(switch_ssave_files_lst[1])
+            show_export_info(f'[{i+1} of {config_set_num}]: {switchname}. Number of configs: {ssave_ams_maps_files_num+1} ...', 
+                                export_info_lst=export_info_lst)
         
-        # build sshow file from ssave sshow sections and export it
-        sshow_filepath, ssave_sections_stats_df = pull_switch_configuration_file(switch_ssave_files_lst[0], 
-                                                                                path_to_move_sshow, ssave_sections_stats_df, 
-                                                                                export_status_lst, pattern_dct, max_title)
-        sshow_filename = os.path.basename(sshow_filepath)
-        # current switch exported AMS_MAPS_LOG filenames and filepaths
-        ams_maps_files_lst_tmp = []
-        ams_maps_filenames_lst_tmp = []
-        # check discovered ams_maps ssave files
-        if ssave_ams_maps_files_num > 0:
-            for ssave_ams_maps_file in switch_ssave_files_lst[1]:
-                # export ssave ams_maps file
-                amsmaps_filepath, _ = pull_switch_configuration_file(ssave_ams_maps_file, 
-                                                                    path_to_move_others, ssave_sections_stats_df, 
-                                                                    export_status_lst, pattern_dct, max_title)
-                ams_maps_files_lst_tmp.append(amsmaps_filepath)
-                ams_maps_filenames_lst_tmp.append(os.path.basename(amsmaps_filepath))
-        else:
-            info = ' '*LEFT_INDENT + 'No AMS_MAPS configuration found.'
-            print(info, end =" ")
-            meop.status_info('skip', max_title, len(info))
-            ams_maps_files_lst_tmp = None
-            ams_maps_filenames_lst_tmp = None
-        # append exported configuration data filenames and filepaths to the summmary list
-        exported_files_lst.append([switchname, sshow_filepath, ams_maps_files_lst_tmp])
-        exported_filenames_lst.append([switchname, sshow_filename, ams_maps_filenames_lst_tmp])    
+            # build sshow file from ssave sshow sections and export it
+            sshow_filepath, ssave_sections_stats_df = pull_switch_configuration_file(switch_ssave_files_lst[0], 
+                                                                                    path_to_move_sshow, ssave_sections_stats_df, 
+                                                                                    export_status_lst, pattern_dct, max_title,
+                                                                                    executor, export_info_lst)
+            sshow_filename = os.path.basename(sshow_filepath)
+            # current switch exported AMS_MAPS_LOG filenames and filepaths
+            ams_maps_files_lst_tmp = []
+            ams_maps_filenames_lst_tmp = []
+            # check discovered ams_maps ssave files
+            if ssave_ams_maps_files_num > 0:
+                for ssave_ams_maps_file in switch_ssave_files_lst[1]:
+                    # export ssave ams_maps file
+                    amsmaps_filepath, _ = pull_switch_configuration_file(ssave_ams_maps_file, 
+                                                                        path_to_move_others, ssave_sections_stats_df, 
+                                                                        export_status_lst, pattern_dct, max_title,
+                                                                        executor, export_info_lst)
+                    ams_maps_files_lst_tmp.append(amsmaps_filepath)
+                    ams_maps_filenames_lst_tmp.append(os.path.basename(amsmaps_filepath))
+            else:
+                info = ' '*LEFT_INDENT + 'No AMS_MAPS configuration found.'
+                show_export_info(info, 'skip', max_title, export_info_lst=export_info_lst)
+                ams_maps_files_lst_tmp = None
+                ams_maps_filenames_lst_tmp = None
+            # append exported configuration data filenames and filepaths to the summmary list
+            exported_files_lst.append([switchname, sshow_filepath, ams_maps_files_lst_tmp])
+            exported_filenames_lst.append([switchname, sshow_filename, ams_maps_filenames_lst_tmp])
+        if executor:
+            show_export_info_lst(export_info_lst, export_status_lst, max_title)
+    finally:
+        # worker processes are stopped even if export is interrupted
+        if executor:
+            executor.shutdown()
     print('\n')
     return exported_files_lst, exported_filenames_lst, ssave_sections_stats_df, export_status_lst
 
 
 def pull_switch_configuration_file(ssave_section_file, output_dir, ssave_sections_stats_df, 
-                                    export_status_lst, pattern_dct, max_title):
-    """Function to pull sshow and ams_maps configs from ssave and export it to output_dir"""
+                                    export_status_lst, pattern_dct, max_title, 
+                                    executor=None, export_info_lst=None):
+    """Function to pull sshow and ams_maps configs from ssave and export it to output_dir.
+    If executor is defined then file is exported in worker process and 
+    export status is added to export_info_lst to be shown later"""
 
     ssave_section_filename = os.path.basename(ssave_section_file)
     info = ' '*LEFT_INDENT + f'{ssave_section_filename} processing'
@@ -91,15 +110,13 @@ def pull_switch_configuration_file(ssave_section_file, output_dir, ssave_section
         get_export_filepath(ssave_section_filename, output_dir, pattern_dct)
     
     if config_type == 'unknown':
-        print(info, end =" ")
-        meop.status_info('unknown', max_title, len(info))
+        show_export_info(info, 'unknown', max_title, export_info_lst=export_info_lst)
         return '', ssave_sections_stats_df
 
     # check if exported file exists on main or secondary filepaths
     config_exist_lst = fsop.validate_path_isfile(exported_switch_config_filepath, exported_switch_config_secondary_filepath)
     if config_exist_lst:
-        print(info, end =" ")
-        export_status_lst.append(meop.status_info('skip', max_title, len(info)))
+        show_export_info(info, 'skip', max_title, export_status_lst, export_info_lst)
         return config_exist_lst[0], ssave_sections_stats_df
 
     # export file to exported file
@@ -112,19 +129,58 @@ def pull_switch_configuration_file(ssave_section_file, output_dir, ssave_section
         # add current folder statistics to the general statistics dataframe
         ssave_sections_stats_df = update_ssave_sections_stats(ssave_sections_stats_df, ssave_sections_stats_current_df)
         # combine and export sshow sections files to exported_switch_config_filepath
-        build_sshow_file(ssave_sections_stats_current_df, exported_switch_config_filepath)
+        export_args = (build_sshow_file, ssave_sections_stats_current_df, exported_switch_config_filepath)
     elif config_type == 'maps':
-        export_single_section_file(input_filepath=ssave_section_file, output_filepath=exported_switch_config_filepath)
+        export_args = (export_single_section_file, ssave_section_file, exported_switch_config_filepath)
 
-    print(info, end =" ")
-    # check if exported file exists
-    if fsop.validate_path_isfile(exported_switch_config_filepath):
-        export_status_lst.append(meop.status_info('ok', max_title, len(info)))
+    if executor:
+        # export status is a future object which is resolved when export is finished
+        status = executor.submit(export_config_file, *export_args)
     else:
-        export_status_lst.append(meop.status_info('fail', max_title, len(info)))
+        status = export_config_file(*export_args)
+    show_export_info(info, status, max_title, export_status_lst, export_info_lst)
     return exported_switch_config_filepath, ssave_sections_stats_df
 
 
+def export_config_file(export_function, input_data, exported_switch_config_filepath):
+    """Function to export input_data (ssave sections statistics or ssave file) 
+    to exported_switch_config_filepath with export_function. Returns export status"""
+
+    export_function(input_data, exported_switch_config_filepath)
+    # check if exported file exists
+    if fsop.validate_path_isfile(exported_switch_config_filepath):
+        return 'ok'
+    return 'fail'
+
+
+def show_export_info(info, status=None, max_title=None, export_status_lst=None, export_info_lst=None):
+    """Function to show export info and status. 
+    If export_info_lst is defined (parallel mode) then info is added to the list to be shown later.
+    Status is added to export_status_lst if it's defined"""
+
+    if export_info_lst is not None:
+        export_info_lst.append((info, status, export_status_lst is not None))
+        return
+
+    if status is None:
+        print(info)
+        return
+    print(info, end =" ")
+    status = meop.status_info(status, max_title, len(info))
+    if export_status_lst is not None:
+        export_status_lst.append(status)
+
+
+def show_export_info_lst(export_info_lst, export_status_lst, max_title):
+    """Function to show export info and status collected in parallel mode.
+    Function waits for each submitted export to finish in the original order"""
+
+    for info, status, save_status in export_info_lst:
+        if isinstance(status, Future):
+            status = status.result()
+        show_export_info(info, status, max_title, export_status_lst if save_status else None)
+
+
 def get_export_filepath(ssave_section_filename, output_dir, pattern_dct):
     """Function returns type of config, main export file path and
     secondary export filepath (for check ams_maps files exported with santoolbox)"""
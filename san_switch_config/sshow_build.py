@@ -1,6 +1,7 @@
 """Module to build supportshow and ams_maps files"""
 
 import gzip
+import io
 import os
 import tarfile
 
@@ -8,45 +9,69 @@ import pandas as pd
 
 import utilities.database_operations as dbop
 import utilities.module_execution as meop
-import utilities.report_operations as report
 from san_automation_constants import RELEASE
 
 from .sshow_stats import SSHOW_SECTIONS
 
+# number of characters in the block copied from ssave file to exported file
+COPY_BLOCK_SIZE = 1024 * 1024
+
+
+def copy_file_content(source_file, dest_file):
+    """Function copies content of the opened text source_file to the opened text dest_file 
+    by blocks of COPY_BLOCK_SIZE characters and replaces tabs with spaces in each block.
+    Returns last copied character (empty string if source_file is empty)"""
+
+    last_char = ''
+    while True:
+        block = source_file.read(COPY_BLOCK_SIZE)
+        if not block:
+            break
+        dest_file.write(block.replace('\t', ' '))
+        last_char = block[-1]
+    return last_char
+
 
 def export_gzip_file(gzip_filepath, dest_filepath):
     """Function read gzip txt file and write its content to dest_filepath"""
     
+    with open(dest_filepath, "a", encoding='utf-8', errors='ignore') as dest_file:
+        copy_gzip_file(gzip_filepath, dest_file)
+
+
+def copy_gzip_file(gzip_filepath, dest_file):
+    """Function read gzip txt file and write its content to the opened text dest_file.
+    All gzip members are copied one after another. Content is decoded as utf-8 (invalid bytes are ignored)"""
+
     with gzip.open(gzip_filepath, "rt", encoding='utf-8', errors='ignore') as gzf:
-        with open(dest_filepath, "a+", encoding='utf-8', errors='ignore') as dest_file:
-            for line in gzf:
-                # replace tabs with spaces in each line
-                tab_free_line = line.replace('\t', ' ')
-                dest_file.write(tab_free_line)
-            
+        copy_file_content(gzf, dest_file)
+
 
 def export_tar_file(tar_filepath, dest_filepath):
-    """Function opens tar archive, read txt file and write its conntent to dest_filepath.
-    If tar archive has no files or has multiple files then warning message is displayes"""
+    """Function opens tar archive, read txt files and write its conntent to dest_filepath.
+    If tar archive has multiple txt files then files are copied one after another in the filename order
+    (line break is added between files if file doesn't end with it).
+    If tar archive has no files then warning message is displayed"""
     
     with tarfile.open(tar_filepath, "r:gz") as tf:
-        # get list of all files in archive ignoring directories
-        tarfile_lst = [tarinfo.name for tarinfo in tf if tarinfo.isreg()]
-        tarfile_lst = [filename for filename in tarfile_lst if not filename.endswith('.ss')]
-        if not tarfile_lst:
+        # get list of all files in archive ignoring directories and .ss files
+        tarinfo_lst = [tarinfo for tarinfo in tf.getmembers() if tarinfo.isreg() and not tarinfo.name.endswith('.ss')]
+        if not tarinfo_lst:
             print('WARNING. No configuration in tar archive.')
-        elif len(tarfile_lst) > 1:
-            print('WARNING. Multiple files in tar archive.')
             print(tar_filepath)
-            print(tarfile_lst)
-        # read content of the first file
-        tar_file_content = tf.extractfile(tarfile_lst[0]).read().decode("utf-8", errors='ignore')
-        # write content to the dest_filepath
-        with open(dest_filepath, "a+") as dest_file:
-            for line in tar_file_content:
-                # replace tabs with spaces in each line
-                tab_free_line = line.replace('\t', ' ')
-                dest_file.write(tab_free_line)
+            return
+        tarinfo_lst.sort(key=lambda tarinfo: tarinfo.name)
+        # write content of the files to the dest_filepath
+        with open(dest_filepath, "a", encoding='utf-8', errors='ignore') as dest_file:
+            last_char = ''
+            for tarinfo in tarinfo_lst:
+                # last line of the previous file is not joined with the first line of the next file
+                if last_char and not last_char in '\r\n':
+                    dest_file.write('\n')
+                    last_char = '\n'
+                # content is decoded as utf-8 (invalid bytes are ignored). line endings are not changed
+                with io.TextIOWrapper(tf.extractfile(tarinfo), encoding='utf-8', errors='ignore', newline='') as tar_file:
+                    last_char = copy_file_content(tar_file, dest_file) or last_char
 
 
 def export_single_section_file(input_filepath, output_filepath):
@@ -65,24 +90,35 @@ def build_sshow_file(ssave_sections_stat_current_df, sshow_filepath):
     """Function concatenates sshow sections related to ssave_sections_stat_current_df file
     and writes it to the sshow_filepath"""
     
-    # insert file header
-    insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath)
-    ssave_sections_stat_current_df.set_index(keys='section_name', drop=True, inplace=True)
-    for section_name in SSHOW_SECTIONS:
-        if pd.notna(ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']):
-            ssave_section_file = os.path.normpath(os.path.join(
-                ssave_sections_stat_current_df.loc[section_name, 'directory_path'],
-                ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']
-                ))
-            # insert section name
-            insert_section_header(sshow_filepath, section_name)
-            # write section content to sshow_filepath
-            export_gzip_file(gzip_filepath=ssave_section_file, dest_filepath=sshow_filepath)
-    # insert footer to the end of the file
-    insert_sshow_footer(sshow_filepath)
+    ssave_sections_stat_current_df = ssave_sections_stat_current_df.set_index(keys='section_name', drop=True)
+    # sshow file is opened once for all sections
+    with open(sshow_filepath, "w", encoding='utf-8', errors='ignore') as sshow_file:
+        # insert file header
+        insert_sshow_header(ssave_sections_stat_current_df, sshow_file)
+        for section_name in SSHOW_SECTIONS:
+            if pd.notna(ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']):
+                ssave_section_file = os.path.normpath(os.path.join(
+                    ssave_sections_stat_current_df.loc[section_name, 'directory_path'],
+                    ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']
+                    ))
+                # insert section name
+                insert_section_header(sshow_file, section_name)
+                # write section content to sshow_file
+                copy_gzip_file(gzip_filepath=ssave_section_file, dest_file=sshow_file)
+        # insert footer to the end of the file
+        insert_sshow_footer(sshow_file)
+
+
+def write_log_entry(dest_file, *args):
+    """Function add lines (args) to the opened text dest_file.
+    If file is not empty then '\\n' is added before first line"""
+
+    if dest_file.tell():
+        dest_file.write('\n')
+    dest_file.write('\n'.join(args))
             
 
-def insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath):
+def insert_sshow_header(ssave_sections_stat_current_df, sshow_file):
     """Function inserts header to the sshow_filepath"""
     
     title = "SupportShow rebuilt by SAN Audit Automation"
@@ -99,21 +135,21 @@ def insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath):
     str_lst = ["| " + str_ + " " * (max_str_len - len(str_) + 1) + "|" for str_ in str_lst]
     # horizontal borders
     border_str = "+" + "-" * (max_str_len + 2) + "+" 
-    # insert header to the sshow_filepath
-    report.add_log_entry(sshow_filepath, border_str, *str_lst[:3], border_str, *str_lst[3:], border_str, '')
+    # insert header to the sshow_file
+    write_log_entry(sshow_file, border_str, *str_lst[:3], border_str, *str_lst[3:], border_str, '')
 
 
-def insert_section_header(sshow_filepath, section_name):
+def insert_section_header(sshow_file, section_name):
     """Function inserts sshow section title to concatenated sshow file"""
     
     section_header_str = "| Section: " + section_name + " |"
     border_str = "+" + "-" * (len(section_header_str) - 2) + "+"
-    report.add_log_entry(sshow_filepath, border_str, section_header_str, border_str, '\n')
+    write_log_entry(sshow_file, border_str, section_header_str, border_str, '\n')
 
 
-def insert_sshow_footer(sshow_filepath):
+def insert_sshow_footer(sshow_file):
     """Function inserts sshow section title to concatenated sshow file"""
     
     footer_str = "| ... rebuilt finished |"
     border_str = "+" + "-" * (len(footer_str) - 2) + "+"
-    report.add_log_entry(sshow_filepath, border_str, footer_str, border_str, '\n')
\ No newline at end of file
+    write_log_entry(sshow_file, border_str, footer_str, border_str, '\n')
\ No newline at end of file
@@ -11,6 +11,7 @@ from .requisites_import import (import_requisites, import_service_dataframes,
                                validate_device_rack_file)
 
 import utilities.filesystem_operations as fsop
+import utilities.step_profiling as prof
 
 
 def service_initialization():
@@ -31,6 +32,8 @@ def service_initialization():
 
     # create folders in SAN Assessment project folder and add it to the report_entry_sr
     create_service_folders(report_requisites_sr, max_title)
+    # turn on program steps profiling if it's required
+    prof.init_profiling(report_requisites_sr)
     # check if device rack file is valid format
     report_requisites_sr['device_rack_path'] = validate_device_rack_file(report_requisites_sr['device_rack_path'], max_title)
     
@@ -105,4 +108,9 @@ def create_service_folders(report_requisites_sr, max_title):
     database_path = os.path.join(os.path.normpath(project_path), database_dir)
     fsop.create_folder(database_path, max_title)
     report_requisites_sr['database_folder'] = database_path
+
+    # define folder to save data extracted from configuration files of each switch
+    # folder path is not added to the report_requisites_sr (new index replaces None values with nan)
+    switch_cache_path = os.path.join(database_path, 'switch_cache')
+    fsop.create_folder(switch_cache_path, max_title)
     return report_requisites_sr
@@ -1,42 +1,115 @@
-"""Module to perform operations SQLite3 database and check if data in database is empty"""
+"""Module to perform operations with database (SQLite3 or columnar parquet, feather files) 
+and check if data in database is empty"""
 
 
+import atexit
 import os
 import sqlite3
+import threading
 import warnings
 
 import numpy as np
 import pandas as pd
 
+import utilities.step_profiling as prof
 from utilities.module_execution import status_info
 
-
+# pyarrow is required for columnar database formats only
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+DATABASE_FORMATS = ('sqlite', 'parquet', 'feather')
+# database format warnings already shown
+database_format_warnings = set()
+
+# number of rows inserted to sqlite table with a single executemany call
+SQL_CHUNK_SIZE = 10000
+# sqlite connections opened during program execution {db_path: connection}
+sql_connections = {}
+# tables of the opened sqlite databases {db_path: set of table names}
+sql_catalogues = {}
+# database is read and written by a single thread at a time (analysis tasks can run in threads)
+database_lock = threading.RLock()
+
+
+@prof.profile_step('database', details=lambda project_constants_lst, data_names, *args: ', '.join(data_names))
 def write_database(project_constants_lst, data_names, *args):
-    """Function to write table data to SQL database.
+    """Function to write table data to database.
     Args are comma separated DataFrames to save."""
 
+    with database_lock:
+        _write_database(project_constants_lst, data_names, *args)
+
+
+def _write_database(project_constants_lst, data_names, *args):
+    """Function to write table data to database under database_lock"""
+
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_format = database_format(report_requisites_sr)
+    # sqlite connections with transaction opened in the current function call {db_path: connection}
+    sql_transactions = {}
 
     for data_name, data_exported in zip(data_names, args):
         # db_type = report_steps_dct[data_name][2]
         db_type = project_steps_df.loc[data_name, 'report_type']
-        db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database.db'
-        db_path = os.path.join(report_requisites_sr['database_folder'], db_name)
+        db_path = database_path(report_requisites_sr, db_type, db_format)
 
         info = f'Writing {data_name} to {db_type} database'
         print(info, end=" ")
         # saving data for DataFrame
         if isinstance(data_exported, (pd.DataFrame, pd.Series)):
             data_exported_flat, empty_data = dataframe_flatten(data_exported)
-            substitute_names(data_exported_flat, 'write')
-            # save single level Index DataFrame to database
-            write_sql(db_path, data_name, data_exported_flat, max_title, info)
+            if db_format == 'sqlite':
+                substitute_names(data_exported_flat, 'write')
+                # save single level Index DataFrame to database
+                write_sql(db_path, data_name, data_exported_flat, max_title, info, sql_transactions)
+            else:
+                # columnar files keep dtypes and case sensitive column names
+                write_columnar(db_path, data_name, data_exported_flat, db_format, max_title, info)
             if not empty_data:
                 status_info('ok', max_title, len(info))
             else:
                 status_info('empty', max_title, len(info))
         else:
             status_info('skip', max_title, len(info))
+    # all tables are written to each database in a single transaction
+    for conn in sql_transactions.values():
+        conn.commit()
+
+
+def database_format(report_requisites_sr):
+    """Function returns database format defined with 'database_format' parameter 
+    in the report_requisites tab of report_info.xlsx (sqlite, parquet, feather).
+    If parameter is not defined or not valid then sqlite database is used"""
+
+    db_format = report_requisites_sr.get('database_format')
+    db_format = str(db_format).strip().lower() if db_format and not pd.isna(db_format) else 'sqlite'
+    if db_format not in DATABASE_FORMATS:
+        warning = f"WARNING. Unknown database format '{db_format}'. SQLite database is used."
+    elif db_format != 'sqlite' and pa is None:
+        warning = f"WARNING. pyarrow is not installed. {db_format} database format is not available. SQLite database is used."
+    else:
+        return db_format
+    if not warning in database_format_warnings:
+        print(f'\n{warning}\n')
+        database_format_warnings.add(warning)
+    return 'sqlite'
+
+
+def database_path(report_requisites_sr, db_type, db_format='sqlite'):
+    """Function returns path to the SQLite database file or 
+    to the folder with columnar database files for the db_type"""
+
+    db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database'
+    if db_format == 'sqlite':
+        db_name = db_name + '.db'
+    else:
+        db_name = db_name + '_' + db_format
+    return os.path.join(report_requisites_sr['database_folder'], db_name)
 
 
 def dataframe_flatten(df):
@@ -87,56 +160,188 @@ def substitute_names(df, operation):
             df.rename(columns=replace_dct, inplace=True)
 
 
-def write_sql(db_path, data_name, df, max_title, info):
-    """Function to write DataFrame to SQL DB"""
+def write_sql(db_path, data_name, df, max_title, info, sql_transactions=None):
+    """Function to write DataFrame to SQL DB.
+    If sql_transactions is defined then transaction is committed by the caller
+    after all DataFrames are written otherwise it's committed after df is written"""
 
     with warnings.catch_warnings():
         warnings.filterwarnings(action="ignore", 
                                 message="The spaces in these column names will not be changed. In pandas versions < 0.14, spaces were converted to underscores.")
         keep_index = True if isinstance(df, pd.Series) else False
         conn = None
-        status = None
         try:
-            conn = sqlite3.connect(db_path)
-            df.to_sql(name=data_name, con=conn, index=keep_index, if_exists='replace')
+            conn = sql_connection(db_path)
+            if not conn.in_transaction:
+                conn.execute('BEGIN')
+            replace_sql_table(conn, data_name, df, keep_index)
+            sql_catalogues[db_path].add(data_name)
         except (pd.io.sql.DatabaseError, sqlite3.OperationalError) as e:
-            status = status_info('fail', max_title, len(info))
+            status_info('fail', max_title, len(info))
             if 'database is locked' in e.args[0]:
                 print(f"\nCan't write {data_name} to {os.path.basename(db_path)}. DB is locked. Close it to proceed.\n")
             else:
                 print('\n', e)
-        finally:
-            if conn is not None:
-                conn.close()
-            if status=='FAIL':
-                exit()
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+            exit()
+    if sql_transactions is None:
+        conn.commit()
+    else:
+        sql_transactions[db_path] = conn
+
+
+def replace_sql_table(conn, data_name, df, keep_index):
+    """Function to replace data_name table with df values. 
+    Table schema is the same as for DataFrame.to_sql. Rows are inserted by chunks"""
+
+    if keep_index:
+        df = df.rename_axis(df.index.name or 'index').reset_index()
+    df.columns = [str(column) for column in df.columns]
+    table_name = '"' + data_name.replace('"', '""') + '"'
+    conn.execute(f'DROP TABLE IF EXISTS {table_name}')
+    conn.execute(pd.io.sql.get_schema(df, data_name, con=conn))
+    insert_statement = f'INSERT INTO {table_name} VALUES ({", ".join(["?"] * len(df.columns))})'
+    for chunk_start in range(0, len(df.index), SQL_CHUNK_SIZE):
+        conn.executemany(insert_statement, sql_rows(df.iloc[chunk_start:chunk_start + SQL_CHUNK_SIZE]))
+
+
+def sql_rows(df):
+    """Function returns df rows with values supported by sqlite3 (empty values are replaced with None,
+    datetime values with strings, timedelta values with number of nanoseconds)"""
+
+    columns = []
+    for _, column_sr in df.items():
+        if column_sr.dtype.kind == 'M':
+            column_sr = column_sr.map(lambda value: value.isoformat(' ') if pd.notna(value) else None)
+        elif column_sr.dtype.kind == 'm':
+            column_sr = column_sr.map(lambda value: value.value if pd.notna(value) else None)
+        column_sr = column_sr.astype(object)
+        columns.append(column_sr.where(column_sr.notna(), None).tolist())
+    return zip(*columns)
+
+
+def sql_connection(db_path):
+    """Function returns sqlite connection to the db_path shared across program execution.
+    Connection is opened in WAL journal mode and table names are cached once connection is opened"""
+
+    conn = sql_connections.get(db_path)
+    if conn is None:
+        # transactions are managed explicitly
+        # connection is shared by threads. access is serialized with database_lock
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        sql_catalogues[db_path] = {table_name for table_name, in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table';")}
+        sql_connections[db_path] = conn
+    return conn
+
+
+def close_sql_connections():
+    """Function to close all sqlite connections opened during program execution"""
+
+    for conn in sql_connections.values():
+        conn.close()
+    sql_connections.clear()
+    sql_catalogues.clear()
+
+
+atexit.register(close_sql_connections)
+
+
+def write_columnar(db_path, data_name, df, db_format, max_title, info):
+    """Function to write DataFrame to parquet or feather file in the db_path folder.
+    Series is saved as DataFrame with 'index' column"""
+
+    df = columnar_dataframe(df)
+    filepath = columnar_filepath(db_path, data_name, db_format)
+    # data is written to temporary file first to keep previous file if write fails
+    tmp_filepath = filepath + '.tmp'
+    try:
+        os.makedirs(db_path, exist_ok=True)
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # object columns with mixed type values are saved as strings
+            table = pa.Table.from_pandas(stringify_mixed_columns(df), preserve_index=False)
+        if db_format == 'parquet':
+            pq.write_table(table, tmp_filepath)
+        else:
+            feather.write_feather(table, tmp_filepath)
+        os.replace(tmp_filepath, filepath)
+    except OSError as e:
+        status_info('fail', max_title, len(info))
+        print(f"\nCan't write {data_name} to {os.path.basename(db_path)}. Close it to proceed.\n")
+        print(e)
+        exit()
+
+
+def columnar_dataframe(df):
+    """Function converts DataFrame or Series to the DataFrame with default index
+    and string column names to be saved in columnar file"""
+
+    if isinstance(df, pd.Series):
+        df = df.to_frame(name='0' if df.name is None else df.name)
+        df.index.name = 'index'
+        df = df.reset_index()
+    else:
+        df = df.reset_index(drop=True)
+    df.columns = [str(column) for column in df.columns]
+    return df
+
+
+def stringify_mixed_columns(df):
+    """Function converts values of object columns with mixed type values to strings.
+    Empty values are kept"""
+
+    df = df.copy()
+    for column in df.columns[df.dtypes == 'object']:
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    return df
+
+
+def columnar_filepath(db_path, data_name, db_format):
+    """Function returns path to the columnar file of the data_name"""
+
+    return os.path.join(db_path, f'{data_name}.{db_format}')
             
 
+@prof.profile_step('database', details=lambda project_constants_lst, *args: ', '.join(args))
 def read_database(project_constants_lst, *args):
-    """Function to read data from SQL.
+    """Function to read data from database.
     Args are comma separated DataFrames names.
     Returns list of loaded DataFrames or None if no data found.
+    If data is not found in columnar database then it's read from SQLite database 
+    saved on previous program executions.
     """
 
+    with database_lock:
+        return _read_database(project_constants_lst, *args)
+
+
+def _read_database(project_constants_lst, *args):
+    """Function to read data from database under database_lock"""
+
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_format = database_format(report_requisites_sr)
     # list to store loaded data
     data_imported = []
 
     for data_name in args:
         db_type = project_steps_df.loc[data_name, 'report_type']
-        db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database.db'
-        
-        db_path = os.path.join(report_requisites_sr['database_folder'], db_name)
-        conn = sqlite3.connect(db_path)
 
         info = f'Reading {data_name} from {db_type} database'
         print(info, end=" ")
-        data_name_in_db = conn.execute(
-            f"""SELECT name FROM sqlite_master WHERE type='table' 
-            AND name='{data_name}'; """).fetchall()
-        if data_name_in_db:
-            df = pd.read_sql(f"select * from {data_name}", con=conn)
-            substitute_names(df, 'read')
+        df = None
+        if db_format != 'sqlite':
+            df = read_columnar(database_path(report_requisites_sr, db_type, db_format), data_name, db_format)
+        if df is None:
+            df = read_sql(database_path(report_requisites_sr, db_type), data_name)
+        if df is not None:
             # revert single column DataFrame to Series
             if 'index' in df.columns:
                 df.set_index('index', inplace=True)
@@ -148,10 +353,54 @@ def read_database(project_constants_lst, *args):
         else:
             data_imported.append(None)
             status_info('no data', max_title, len(info))
-        conn.close()
     return data_imported
 
 
+def database_contains(project_constants_lst, data_name):
+    """Function to check if data_name is saved in database without reading it"""
+
+    project_steps_df, _, _, report_requisites_sr, *_ = project_constants_lst
+    db_format = database_format(report_requisites_sr)
+    db_type = project_steps_df.loc[data_name, 'report_type']
+    if db_format != 'sqlite' and \
+        os.path.isfile(columnar_filepath(database_path(report_requisites_sr, db_type, db_format), data_name, db_format)):
+        return True
+    db_path = database_path(report_requisites_sr, db_type)
+    if not os.path.isfile(db_path):
+        return False
+    with database_lock:
+        sql_connection(db_path)
+        return data_name in sql_catalogues[db_path]
+
+
+def read_sql(db_path, data_name):
+    """Function to read data_name table from SQL DB.
+    Returns None if table doesn't exist"""
+
+    if not os.path.isfile(db_path):
+        return None
+    conn = sql_connection(db_path)
+    if not data_name in sql_catalogues[db_path]:
+        return None
+    df = pd.read_sql(f"select * from {data_name}", con=conn)
+    substitute_names(df, 'read')
+    return df
+
+
+def read_columnar(db_path, data_name, db_format):
+    """Function to read data_name from memory mapped parquet or feather file.
+    Returns None if file doesn't exist"""
+
+    filepath = columnar_filepath(db_path, data_name, db_format)
+    if not os.path.isfile(filepath):
+        return None
+    if db_format == 'parquet':
+        table = pq.read_table(filepath, memory_map=True)
+    else:
+        table = feather.read_table(filepath, memory_map=True)
+    return table.to_pandas()
+
+
 def verify_read_data(max_title, data_names, *args,  show_status=True):
     """
     Function to verify if loaded DataFrame or Series contains 'NO DATA FOUND' information string.
@@ -171,6 +171,19 @@ def verify_force_run(data_names, data_lst, project_steps_df, max_title, analyzed
     return force_run
 
 
+def workers_number(report_requisites_sr, workers_parameter):
+    """Function returns number of worker processes defined with workers_parameter
+    in the report_requisites tab of report_info.xlsx.
+    If parameter is not defined or not valid then single process is used"""
+
+    workers_num = report_requisites_sr.get(workers_parameter)
+    try:
+        workers_num = int(float(workers_num))
+    except (TypeError, ValueError):
+        return 1
+    return max(workers_num, 1)
+
+
 def current_datetime(drop_seconds=False, join=False):
     """Function returns current datetime in 03/11/2022 11:37:45 format"""
 
@@ -0,0 +1,113 @@
+"""Module to find IEEE organization (vendor) of the WWN.
+OUI index is built from the IEEE registry files (MA-L oui.txt, MA-M mam.txt, MA-S oui36.txt) in the oui folder
+(only oui.txt is shipped, see oui/README.md).
+Each registry file is parsed once and saved to the service cache (only changed registry files are parsed again).
+Vendor is found for all WWNs at once with the longest prefix match (MA-S, MA-M, MA-L assignments)"""
+
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+import utilities.servicefile_operations as sfop
+from utilities.module_execution import status_info
+
+# folder with IEEE registry files
+OUI_FOLDER = 'oui'
+# IEEE registry files (MA-L, MA-M, MA-S assignments)
+OUI_REGISTRY_FILES = ['oui.txt', 'mam.txt', 'oui36.txt']
+# oui index cache format version. cache with other version is ignored
+OUI_INDEX_VERSION = 1
+# assignment line of the registry file (assigned prefix and organization name)
+OUI_ASSIGNMENT_PATTERN = re.compile(r'^([0-9A-F]{2}(?:-[0-9A-F]{1,2}){2,4}) +\(hex\)\s+(.*?)\s*$')
+# assigned range line of the MA-M and MA-S registry files (first and last address of the range)
+OUI_RANGE_PATTERN = re.compile(r'^([0-9A-F]+)-([0-9A-F]+) +\(base 16\)')
+# NAA (first WWN digit) and position of the IEEE company id in the WWN hex digits
+NAA_COMPANY_ID_START = {'1': 4, '2': 4, '5': 1, '6': 1}
+
+
+def oui_index_import(max_title, oui_folder=OUI_FOLDER, display_status=True):
+    """Function returns OUI index {prefix length: {prefix: organization}} built from
+    IEEE registry files in the oui_folder. Returns empty index if there are no registry files"""
+
+    if display_status:
+        info = f'Importing IEEE OUI registry from {oui_folder} folder'
+        print(info, end = ' ')
+    oui_index = {}
+    for registry_file in OUI_REGISTRY_FILES:
+        registry_path = os.path.join(oui_folder, registry_file)
+        if not os.path.isfile(registry_path):
+            continue
+        registry_index = sfop.cached_service_import(registry_path, 'oui_index.pickle', OUI_INDEX_VERSION,
+                                                    lambda: read_oui_registry(registry_path))
+        for prefix_length, prefix_dct in registry_index.items():
+            oui_index.setdefault(prefix_length, {}).update(prefix_dct)
+    if display_status:
+        status_info('ok' if oui_index else 'skip', max_title, len(info))
+    return oui_index
+
+
+def read_oui_registry(registry_path):
+    """Function returns OUI index {prefix length: {prefix: organization}} of the IEEE registry file.
+    Prefix is assigned prefix hex digits in upper case (6 for MA-L, 7 for MA-M and 9 for MA-S assignments)"""
+
+    registry_index = {}
+    prefix = None
+    with open(registry_path, encoding='utf-8', errors='ignore') as file:
+        for line in file:
+            assignment_match = OUI_ASSIGNMENT_PATTERN.match(line)
+            if assignment_match:
+                prefix, organization = assignment_match.group(1).replace('-', ''), assignment_match.group(2)
+                registry_index.setdefault(len(prefix), {})[prefix] = organization
+                continue
+            # assigned range defines prefix of the MA-M and MA-S assignments more precisely
+            range_match = OUI_RANGE_PATTERN.match(line)
+            if range_match and prefix:
+                range_prefix = range_assignment_prefix(prefix, *range_match.groups())
+                if len(range_prefix) > len(prefix) and range_prefix.startswith(prefix):
+                    del registry_index[len(prefix)][prefix]
+                    registry_index.setdefault(len(range_prefix), {})[range_prefix] = organization
+                prefix = None
+    return registry_index
+
+
+def range_assignment_prefix(prefix, range_start, range_end):
+    """Function returns assigned prefix of the range (common digits of the first and last range addresses).
+    Range addresses shorter than 12 digits are relative to the assignment prefix"""
+
+    range_prefix = os.path.commonprefix([range_start, range_end])
+    if len(range_start) < 12:
+        range_prefix = prefix[:12-len(range_start)] + range_prefix
+    return range_prefix
+
+
+def wwn_company_id(wwn_sr):
+    """Function returns IEEE company id hex digits (with vendor specific digits required for
+    MA-M and MA-S assignments) of the NAA 1, 2, 5 and 6 WWNs in upper case"""
+
+    wwn_hex_sr = wwn_sr.astype('object').where(wwn_sr.notna(), '').astype(str).str.replace(':', '', regex=False).str.upper()
+    naa_sr = wwn_hex_sr.str[0]
+    company_id_sr = pd.Series(np.nan, index=wwn_sr.index, dtype='object')
+    for naa, company_id_start in NAA_COMPANY_ID_START.items():
+        mask_naa = (naa_sr == naa) & (wwn_hex_sr.str.len() == 16)
+        company_id_sr[mask_naa] = wwn_hex_sr[mask_naa].str[company_id_start:company_id_start+9]
+    return company_id_sr
+
+
+def oui_vendor(wwn_sr, oui_index):
+    """Function returns IEEE organization names of the WWNs in wwn_sr.
+    Longest assigned prefix of the WWN company id is used. Each unique WWN is verified once"""
+
+    if not oui_index or wwn_sr.isna().all():
+        return pd.Series(np.nan, index=wwn_sr.index, dtype='object')
+    wwn_unique_sr = pd.Series(wwn_sr.dropna().unique())
+    company_id_sr = wwn_company_id(wwn_unique_sr)
+    vendor_sr = pd.Series(np.nan, index=wwn_unique_sr.index, dtype='object')
+    for prefix_length in sorted(oui_index, reverse=True):
+        mask_vendor_na = vendor_sr.isna() & company_id_sr.notna()
+        if not mask_vendor_na.any():
+            break
+        vendor_sr[mask_vendor_na] = company_id_sr[mask_vendor_na].str[:prefix_length].map(oui_index[prefix_length])
+    return wwn_sr.map(dict(zip(wwn_unique_sr, vendor_sr))).astype('object')
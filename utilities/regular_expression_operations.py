@@ -2,6 +2,64 @@ import re
 
 import utilities.data_structure_operations as dsop
 
+# literal line starts of the anchored regex patterns (pattern: prefix)
+pattern_prefix_cache = {}
+
+
+def pattern_literal_prefix(pattern):
+    """Function returns literal string which line must start with 
+    to be matched by the pattern ('^portshow +(\d{1,4})$' -> 'portshow').
+    Empty string is returned if pattern is not anchored to the line start 
+    or literal part can't be defined"""
+
+    if pattern in pattern_prefix_cache:
+        return pattern_prefix_cache[pattern]
+
+    prefix = ''
+    pattern_str = pattern.pattern
+    # alternation can't be verified with the single prefix
+    if isinstance(pattern_str, str) and pattern_str.startswith('^') \
+        and not re.search(r'(?<!\\)\|', pattern_str) and not pattern.flags & re.VERBOSE:
+        prefix_match = re.match(r'\^([\w ,:=/-]*)(.?)', pattern_str)
+        prefix, next_char = prefix_match.groups()
+        # last literal char is optional or repeated
+        if next_char in ['*', '+', '?', '{']:
+            prefix = prefix[:-1]
+        if not prefix.isascii():
+            prefix = ''
+    pattern_prefix_cache[pattern] = prefix
+    return prefix
+
+
+class LazyMatchDict(dict):
+    """Dictionary with pattern names as keys and match results of the line as values.
+    Line is matched with the pattern only when pattern name is requested for the first time.
+    Lines which don't start with the literal prefix of the pattern are dropped without regex evaluation"""
+
+    def __init__(self, pattern_dct, line):
+        super().__init__()
+        self.pattern_dct = pattern_dct
+        self.line = line
+
+    def __missing__(self, pattern_name):
+        pattern = self.pattern_dct[pattern_name]
+        prefix = pattern_literal_prefix(pattern)
+        line_start = self.line[:len(prefix)]
+        if prefix and line_start.isascii() and \
+            (line_start.lower() != prefix.lower() if pattern.flags & re.IGNORECASE else line_start != prefix):
+            match = None
+        else:
+            match = pattern.match(self.line)
+        self[pattern_name] = match
+        return match
+
+
+def match_line(pattern_dct, line):
+    """Function returns dictionary with match results of the line 
+    for the pattern names requested from the dictionary only"""
+
+    return LazyMatchDict(pattern_dct, line)
+
 
 def goto_switch_context(ls_mode_on, line, file, switch_index):
     """Function to move cursor to the switch_index context 
@@ -35,9 +93,8 @@ def extract_list_from_line(global_filled_lst, pattern_dct,
     while not re.search(pattern_dct[stop_pattern_name], line):
         if first_line_skip:
             line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
         # if matched line found
-        if match_dct[extract_pattern_name]:
+        if pattern_dct[extract_pattern_name].match(line):
             if isinstance(line_add_values, (tuple, list)):
                 extracted_line_lst = dsop.line_to_list(pattern_dct[extract_pattern_name], line, *line_add_values)
             else:
@@ -70,12 +127,9 @@ def extract_key_value_from_line(global_filled_dct, pattern_dct,
     while not re.search(pattern_dct[stop_pattern_name],line):
         if first_line_skip:
             line = file.readline()
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        extracted_key_value = pattern_dct[extract_pattern_name].match(line)
         # name_value_pair_match
-        if match_dct[extract_pattern_name]:
-            
-            extracted_key_value = match_dct[extract_pattern_name]
+        if extracted_key_value:
             key = extracted_key_value.group(1).strip()
             value = extracted_key_value.group(2).strip()
             if not value:
@@ -108,9 +162,9 @@ def extract_value_from_line(global_filled_lst, pattern_dct,
     while not re.search(pattern_dct[stop_pattern_name], line):
         if first_line_skip:
             line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
-        if match_dct[extract_pattern_name]:
-            value = match_dct[extract_pattern_name].group(1).strip()
+        extracted_value = pattern_dct[extract_pattern_name].match(line)
+        if extracted_value:
+            value = extracted_value.group(1).strip()
             global_filled_lst.append(value)
             if save_local:
                 local_filled_lst.append(value)                                            
@@ -1,18 +1,30 @@
-"""Module to export dataframes and table of contents to report excel file"""
+"""Module to export dataframes and table of contents to report excel file.
+DataFrames are collected in report session and each excel file is written once 
+when report is completed (or immediately if DataFrame export is forced)"""
 
+import atexit
 import os
 import sys
+import threading
 from datetime import date
 
 import openpyxl
 import pandas as pd
 
 import utilities.filesystem_operations as fsop
+import utilities.step_profiling as prof
 from utilities.module_execution import status_info
 
-from .worksheet_operations import format_workbook, hyperlink_content
+from .worksheet_operations import format_data_worksheet, hyperlink_content
 
+# DataFrames and table of contents items waiting to be written to excel files
+# {file_path: {'sheets': {sheet_title: (df, description, freeze_column)}, 'max_title': max_title}}
+report_sessions = {}
+# report sessions are changed and saved by a single thread at a time (analysis tasks can run in threads)
+report_sessions_lock = threading.RLock()
 
+
+@prof.profile_step('excel', details=lambda df, sheet_title, *args, **kwargs: sheet_title)
 def dataframe_to_excel(df, sheet_title, project_constants_lst, 
                         current_date=str(date.today()), force_flag = False, freeze_column='A'):
     """Check if excel file exists, write DataFrame, create or update table of contents,
@@ -39,33 +51,15 @@ def dataframe_to_excel(df, sheet_title, project_constants_lst,
     # and DataFrame is not empty
     if (force_flag or export_flag) and not df.empty:
         fsop.create_folder(report_requisites_sr['today_report_folder'], max_title, display_status=False)
-        file_mode = 'a' if os.path.isfile(file_path) else 'w'
-        # df = df.apply(pd.to_numeric, errors='ignore')
-        for column in df.columns:
-            if column in ['FCID','Connected_portId']:
-                continue
-            # df[column] = (df[column].apply(pd.to_numeric, errors="coerce").fillna(df[column]))
-            with pd.option_context("future.no_silent_downcasting", True):
-                df[column] = (df[column].apply(pd.to_numeric, errors="coerce").fillna(df[column])).infer_objects(copy=False)
-        try:
-            if_sheet_exists_param = 'replace' if file_mode == 'a' else None
-            content_df, item_exist = generate_table_of_contents(file_path, file_mode, sheet_title, df_decription)
-            df_flat = drop_multindex(df)
-            # write table of contents and data dataframe to the excel file
-            with pd.ExcelWriter(file_path, mode=file_mode, if_sheet_exists=if_sheet_exists_param, engine='openpyxl') as writer:
-                if file_mode == 'w' or not item_exist:
-                    content_df.to_excel(writer, sheet_name='Содержание', index=False)
-                df_flat.to_excel(writer, sheet_name=sheet_title, startrow=2, index=False)
-            # format table of contents and data worksheets
-            workbook = openpyxl.load_workbook(file_path)
-            format_workbook(workbook, sheet_title, df_decription, freeze_column)
-            workbook.save(file_path)
-        except PermissionError:
-            status_info('fail', max_title, len(info))
-            print('\nPermission denied. Close the file.\n')
-            sys.exit()
-        else:
-            status_info('ok', max_title, len(info))
+        # convert numeric values to numbers
+        convert_numeric_columns(df, skip_columns=['FCID','Connected_portId'])
+        df_flat = drop_multindex(df)
+        # add DataFrame to the report session. excel file is written once for all DataFrames
+        add_report_sheet(file_path, sheet_title, df_flat, df_decription, freeze_column, max_title)
+        status_info('ok', max_title, len(info))
+        # forced DataFrames (forms to fill) are written immediately
+        if force_flag:
+            save_report_file(file_path)
         return file_path        
     else:
         # if save key is on but DataFrame empty
@@ -76,27 +70,94 @@ def dataframe_to_excel(df, sheet_title, project_constants_lst,
         return None
     
 
-def generate_table_of_contents(file_path, file_mode, sheet_title, df_decription):
-    """"Function to create or recreate table of contents if file is newly created or new sheet added"""
-
-    item_exist = None
-    # if file exists and there is no sheet_title in contents add new item to the existing content
-    if  file_mode == 'a':
-        existing_content_df = pd.read_excel(file_path, sheet_name='Содержание')
-        item_exist = sheet_title in existing_content_df['Закладка'].values
-        if not item_exist:
-            # content item to add
-            content_df = pd.DataFrame([[sheet_title, df_decription]], columns=['Закладка', 'Название таблицы'])
-            # concatenate existing items to the current
-            content_df = pd.concat([existing_content_df, content_df])
-        else:
-            content_df = existing_content_df
-    # if file is newly created then create contents with single sheet_title
-    elif file_mode == 'w':
-        content_df = pd.DataFrame([[sheet_title, df_decription]], columns=['Закладка', 'Название таблицы'])
+def convert_numeric_columns(df, skip_columns):
+    """Function converts numeric values in df columns (except skip_columns) to numbers.
+    Each column is converted at once. Values which are not numbers are kept unchanged"""
+
+    for column in df.columns:
+        if column in skip_columns:
+            continue
+        # numeric, boolean and datetime columns are not converted
+        if df[column].dtype.kind in 'biufcmM':
+            continue
+        numeric_sr = pd.to_numeric(df[column], errors="coerce")
+        # column has no numeric values
+        if numeric_sr.isna().all():
+            df[column] = df[column].infer_objects()
+            continue
+        with pd.option_context("future.no_silent_downcasting", True):
+            df[column] = numeric_sr.fillna(df[column]).infer_objects()
+
+
+def add_report_sheet(file_path, sheet_title, df, df_decription, freeze_column, max_title):
+    """Function to add DataFrame to the report session of the file_path excel file"""
+
+    with report_sessions_lock:
+        report_session = report_sessions.setdefault(file_path, {'sheets': {}, 'max_title': max_title})
+        # DataFrame exported again replaces previous one
+        report_session['sheets'].pop(sheet_title, None)
+        report_session['sheets'][sheet_title] = (df, df_decription, freeze_column)
+
+
+def save_report_file(file_path):
+    """Function to write all DataFrames of the file_path report session to excel file.
+    Excel file is opened and saved once. Existing sheets with the same titles are replaced"""
+
+    with report_sessions_lock:
+        report_session = report_sessions.pop(file_path, None)
+    if not report_session:
+        return
+    max_title = report_session['max_title']
+
+    info = f'Saving {os.path.basename(file_path)} file'
+    print(info, end =" ")
+    file_mode = 'a' if os.path.isfile(file_path) else 'w'
+    if_sheet_exists_param = 'replace' if file_mode == 'a' else None
+    try:
+        # write table of contents and data dataframes to the excel file
+        with pd.ExcelWriter(file_path, mode=file_mode, if_sheet_exists=if_sheet_exists_param, engine='openpyxl') as writer:
+            content_df = generate_report_content(writer.book if file_mode == 'a' else None, report_session['sheets'])
+            content_df.to_excel(writer, sheet_name='Содержание', index=False)
+            for sheet_title, (df_flat, *_) in report_session['sheets'].items():
+                df_flat.to_excel(writer, sheet_name=sheet_title, startrow=2, index=False)
+            # format table of contents and data worksheets
+            hyperlink_content(writer.book)
+            for sheet_title, (_, df_decription, freeze_column) in report_session['sheets'].items():
+                format_data_worksheet(writer.book, sheet_title, df_decription, freeze_column)
+    except PermissionError:
+        status_info('fail', max_title, len(info))
+        print('\nPermission denied. Close the file.\n')
+        sys.exit()
     else:
-        content_df = pd.DataFrame()
-    return content_df, item_exist
+        status_info('ok', max_title, len(info))
+
+
+def save_report_files():
+    """Function to write all report sessions to excel files"""
+
+    for file_path in list(report_sessions):
+        save_report_file(file_path)
+
+
+# DataFrames collected before program stop are saved to excel files
+atexit.register(save_report_files)
+
+
+def generate_report_content(workbook, report_sheets):
+    """Function to create table of contents. Items of the report_sheets which are not in 
+    the table of contents of the existing workbook are added to the end of the table"""
+
+    content_columns = ['Закладка', 'Название таблицы']
+    content_df = pd.DataFrame(columns=content_columns)
+    if workbook is not None and 'Содержание' in workbook.sheetnames:
+        content_values = list(workbook['Содержание'].values)
+        if content_values:
+            content_df = pd.DataFrame(content_values[1:], columns=content_values[0])
+    added_content_df = pd.DataFrame([[sheet_title, df_decription] for sheet_title, (_, df_decription, _) in report_sheets.items()
+                                        if not sheet_title in content_df['Закладка'].values], columns=content_columns)
+    if content_df.empty:
+        return added_content_df
+    return pd.concat([content_df, added_content_df])
 
 
 def drop_multindex(df):
@@ -119,6 +180,9 @@ def report_format_completion(project_constants_lst, current_date=str(date.today(
     mask_report = project_steps_df['report_type'] == 'report'
     mask_save = project_steps_df['export_to_excel'] == 1
 
+    # write DataFrames collected during program execution to excel files
+    save_report_files()
+
     if not project_steps_df.loc[mask_report & mask_save].empty:
 
         print('\n')
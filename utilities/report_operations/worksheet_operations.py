@@ -10,6 +10,13 @@ def format_workbook(workbook, sheet_title, df_decription, freeze_column):
 
     # create hyperlinks for all items of table of contents
     hyperlink_content(workbook)
+    # format data worksheet
+    format_data_worksheet(workbook, sheet_title, df_decription, freeze_column)
+
+
+def format_data_worksheet(workbook, sheet_title, df_decription, freeze_column):
+    """Function to format data worksheet"""
+
     # add DataFrame description and link to the table of contents
     add_dataframe_title(workbook, sheet_title, df_decription)
     # change worksheet text format
@@ -1,8 +1,12 @@
 """Module to import data from service files (san_automation_info.xlsx and report_info.xlsx)"""
 
+import hashlib
 import os
+import pickle
 import re
 import sys
+import tempfile
+import threading
 import warnings
 
 import pandas as pd
@@ -10,6 +14,20 @@ import xlrd
 
 from utilities.module_execution import status_info
 
+# folder in the service file folder to save data imported from service files
+SERVICE_CACHE_FOLDER = '.service_cache'
+# service files which sheets are cached (files edited by user in the project folder are not cached)
+SERVICE_FILES = ['san_automation_info.xlsx', 'report_info.xlsx']
+# regex templates and sheets cache format versions. cache with other version is ignored
+REGEX_CACHE_VERSION = 1
+SHEET_CACHE_VERSION = 1
+# service file hashes calculated during current program execution {service file path: (file_stat, file_hash)}
+service_file_hashes = {}
+# compiled regex templates of the service files {service file path: {sheet_title: (pattern_dct, re_pattern_df)}}
+regex_registry = {}
+# analysis tasks import regex templates from worker threads
+regex_registry_lock = threading.Lock()
+
 
 def columns_import(sheet_title, max_title, *args, 
                     init_file = 'san_automation_info.xlsx', display_status=True):
@@ -66,7 +84,7 @@ def dataframe_import(sheet_title, max_title, init_file='san_automation_info.xlsx
         print(info, end = ' ')
     # try read data in excel
     try:
-        dataframe = pd.read_excel(init_file, sheet_name=sheet_title, usecols=columns, index_col=index_name, header=header)
+        dataframe = sheet_import(init_file, sheet_title, columns, index_name, header)
     # if file is not found
     except FileNotFoundError:
         if display_status:
@@ -85,19 +103,183 @@ def dataframe_import(sheet_title, max_title, init_file='san_automation_info.xlsx
     return dataframe
 
 
-def regex_pattern_import(sheet_title, max_title):
-    """Function to import regex tepmplates"""
-    
-    re_pattern_df = dataframe_import(sheet_title, max_title)
+def sheet_import(init_file, sheet_title, columns, index_name, header):
+    """Function returns sheet_title DataFrame of the init_file.
+    Sheets of the service files are read from the service cache if service file is not changed"""
+
+    def read_sheet():
+        return pd.read_excel(init_file, sheet_name=sheet_title, usecols=columns, index_col=index_name, header=header)
+
+    if not os.path.basename(init_file) in SERVICE_FILES or not os.path.isfile(init_file):
+        return read_sheet()
+    # cache name is based on sheet title and import parameters
+    sheet_params = repr((sheet_title, columns, index_name, header)).encode('utf-8')
+    cache_name = f"sheet_{hashlib.sha1(sheet_params).hexdigest()[:16]}.pickle"
+    return cached_service_import(init_file, cache_name, SHEET_CACHE_VERSION, read_sheet)
+
+
+def regex_pattern_import(sheet_title, max_title, init_file='san_automation_info.xlsx'):
+    """Function to import regex tepmplates.
+    Regex templates of all init file sheets are read and compiled once (see regex_pattern_registry)"""
+
+    sheet_patterns = regex_pattern_registry(init_file).get(sheet_title)
+    # sheet without regex templates columns or init file is not found
+    if sheet_patterns is None:
+        re_pattern_df = dataframe_import(sheet_title, max_title, init_file=init_file)
+        pattern_dct = compile_regex_patterns(re_pattern_df)
+    else:
+        info = f'Importing {sheet_title} dataframe from {os.path.basename(init_file)} file'
+        print(info, end = ' ')
+        status_info('ok', max_title, len(info))
+        pattern_dct, re_pattern_df = sheet_patterns
+        pattern_dct = None if pattern_dct is None else dict(pattern_dct)
+        re_pattern_df = re_pattern_df.copy()
+
+    if pattern_dct is None:
+        print(f"ERROR. 'pattern_name' and 'pattern' columns have different length. Check data in {sheet_title} tab")
+        exit()
+    return pattern_dct, re_pattern_df
+
+
+def compile_regex_patterns(re_pattern_df):
+    """Function returns dictionary with pattern names as keys and compiled patterns as values.
+    Returns None if number of names and patterns is different"""
+
     pattern_names = re_pattern_df['pattern_name'].dropna().to_list()
     patterns = re_pattern_df['pattern_value'].dropna().to_list()
     if len(pattern_names) == len(patterns):
         patterns = [re.compile(fr"{element}", re.IGNORECASE) for element in patterns]
-        pattern_dct = dict(zip(pattern_names, patterns))
-        return pattern_dct, re_pattern_df
-    else:
-        print("ERROR. 'pattern_name' and 'pattern' columns have different length. Check data in {sheet_title} tab")
-        exit()
+        return dict(zip(pattern_names, patterns))
+
+
+def regex_pattern_registry(init_file):
+    """Function returns compiled regex templates of all init file sheets with 'pattern_name' and 'pattern_value' columns
+    {sheet_title: (pattern_dct, re_pattern_df)}. Init file is read once during program execution.
+    Compiled templates are saved to the service cache folder and read from the cache
+    on the next program execution if init file is not changed"""
+
+    init_file_key = os.path.abspath(init_file)
+    with regex_registry_lock:
+        if not init_file_key in regex_registry:
+            regex_registry[init_file_key] = load_regex_patterns(init_file)
+        return regex_registry[init_file_key]
+
+
+def load_regex_patterns(init_file):
+    """Function returns compiled regex templates of the init file sheets from the service cache.
+    If init file is changed then all sheets are read from init file and cache is updated.
+    Returns empty dictionary if init file is not found"""
+
+    if not os.path.isfile(init_file):
+        return {}
+    return cached_service_import(init_file, 'regex_patterns.pickle', REGEX_CACHE_VERSION, 
+                                    lambda: read_regex_patterns(init_file))
+
+
+def read_regex_patterns(init_file):
+    """Function reads all init file sheets at once and 
+    returns compiled regex templates of the sheets with 'pattern_name' and 'pattern_value' columns"""
+
+    warnings.filterwarnings('ignore', category=UserWarning, module="openpyxl")
+    sheets_dct = pd.read_excel(init_file, sheet_name=None, header=2)
+    return {sheet_title: (compile_regex_patterns(re_pattern_df), re_pattern_df)
+            for sheet_title, re_pattern_df in sheets_dct.items()
+            if {'pattern_name', 'pattern_value'}.issubset(re_pattern_df.columns)}
+
+
+def cached_service_import(init_file, cache_name, cache_version, import_function):
+    """Function returns data imported from init_file with import_function.
+    Imported data is saved to the service cache and read from the cache 
+    on the next program execution if init file is not changed"""
+
+    cache_file = service_cache_file(init_file, cache_name)
+    cached_dct = load_service_cache(cache_file, cache_version)
+    if cached_dct is not None:
+        # init file is not modified
+        if cached_dct['file_stat'] == service_file_stat(init_file):
+            return cached_dct['data']
+        # init file is modified but content is the same (file copied or saved again)
+        if cached_dct['file_hash'] == service_file_hash(init_file):
+            save_service_cache(cache_file, cache_version, init_file, cached_dct['data'])
+            return cached_dct['data']
+    data = import_function()
+    save_service_cache(cache_file, cache_version, init_file, data)
+    return data
+
+
+def service_cache_file(init_file, cache_name):
+    """Function returns path to the cache_name file of the init_file in the service cache folder
+    (service cache folder is located in the init file folder).
+    Returns None if service cache folder can't be created"""
+
+    cache_folder = os.path.join(os.path.dirname(os.path.abspath(init_file)), SERVICE_CACHE_FOLDER)
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+    except OSError:
+        return
+    init_file_base, _ = os.path.splitext(os.path.basename(init_file))
+    return os.path.join(cache_folder, f'{init_file_base}_{cache_name}')
+
+
+def load_service_cache(cache_file, cache_version):
+    """Function returns service cache saved on previous program execution
+    {'file_stat', 'file_hash', 'data'}. Returns None if cache doesn't exist or has other version"""
+
+    if cache_file is None or not os.path.isfile(cache_file):
+        return
+    try:
+        with open(cache_file, 'rb') as file:
+            cached_dct = pickle.load(file)
+    # cache saved with other pandas or python version might be not readable (data is imported from init file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        return
+    if isinstance(cached_dct, dict) and cached_dct.get('version') == cache_version:
+        return cached_dct
+
+
+def save_service_cache(cache_file, cache_version, init_file, data):
+    """Function to save data imported from init_file to the service cache"""
+
+    if cache_file is None:
+        return
+    cached_dct = {'version': cache_version, 'file_stat': service_file_stat(init_file),
+                    'file_hash': service_file_hash(init_file), 'data': data}
+    # cache is written to temporary file first to avoid broken file if program is interrupted
+    # (each thread writes to its own temporary file)
+    try:
+        tmp_fd, tmp_cache_file = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(cache_file) + '.', 
+                                                    dir=os.path.dirname(cache_file))
+    except OSError:
+        return
+    try:
+        with os.fdopen(tmp_fd, 'wb') as file:
+            pickle.dump(cached_dct, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_cache_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_cache_file)
+        except OSError:
+            pass
+
+
+def service_file_stat(init_file):
+    """Function returns service file size and modification time"""
+
+    init_file_stat = os.stat(init_file)
+    return (init_file_stat.st_size, init_file_stat.st_mtime_ns)
+
+
+def service_file_hash(init_file):
+    """Function returns sha1 hash of the service file content.
+    Hash is calculated once for each service file modification during program execution"""
+
+    init_file_stat = service_file_stat(init_file)
+    hash_stat, hash_value = service_file_hashes.get(os.path.abspath(init_file), (None, None))
+    if hash_stat != init_file_stat:
+        with open(init_file, 'rb') as file:
+            hash_value = hashlib.sha1(file.read()).hexdigest()
+        service_file_hashes[os.path.abspath(init_file)] = (init_file_stat, hash_value)
+    return hash_value
 
 
 def dct_from_columns(sheet_title, max_title, *args, init_file = 'report_info.xlsx', display_status=True):
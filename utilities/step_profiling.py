@@ -0,0 +1,296 @@
+"""Module to profile program steps (data extraction and analysis modules, database and excel operations).
+Wall time, cpu time, process memory high-water mark and input/output row counts are recorded for each step call
+and for each switch configuration extraction. Steps can add counter records (e.g. pattern hits).
+Records are saved to the run log (json and csv files)
+and optionally to the Timing sheet. Steps can be additionally profiled with cProfile or pyinstrument.
+Profiling is turned on with 'profiling' parameter in the report_requisites tab of report_info.xlsx"""
+
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+
+import pandas as pd
+
+from utilities.module_execution import status_info
+
+# process memory high-water mark is taken from resource module (unix) or psutil (if installed)
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+# pyinstrument is used for step profiling if installed and requested
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+
+PROFILERS = ('cprofile', 'pyinstrument')
+ON_VALUES = ('yes', 'y', 'on', 'true', '1')
+RUN_LOG_COLUMNS = ['step', 'step_type', 'details', 'switch', 'parent_step', 'thread', 'status',
+                    'start_s', 'wall_s', 'cpu_s', 'process_max_rss_mb', 'input_rows', 'output_rows']
+
+# profiling settings of the current program execution
+profiling_settings = {'enabled': False}
+# records of the profiled steps and switches
+profiling_records = []
+profiling_lock = threading.Lock()
+# steps currently executed by each thread (nested steps are recorded with parent step)
+step_stack = threading.local()
+
+
+def init_profiling(report_requisites_sr):
+    """Function to read profiling parameters from report_requisites_sr.
+    'profiling' turns on step records, 'timing_sheet' adds Timing sheet to the run log excel file,
+    'profiler' (cprofile, pyinstrument) and 'profiled_steps' (comma separated step names or all)
+    define steps profiled with profiler. Run log is saved to the today report folder"""
+
+    profiling_records.clear()
+    profiling_settings.clear()
+    profiling_settings['enabled'] = parameter_on(report_requisites_sr, 'profiling')
+    if not profiling_settings['enabled']:
+        return
+    profiler = report_requisites_sr.get('profiler')
+    profiler = str(profiler).strip().lower() if profiler and not pd.isna(profiler) else None
+    if profiler == 'pyinstrument' and pyinstrument is None:
+        print('\nWARNING. pyinstrument is not installed. cProfile is used for step profiling.\n')
+        profiler = 'cprofile'
+    elif profiler is not None and not profiler in PROFILERS:
+        print(f"\nWARNING. Unknown profiler '{profiler}'. Steps are not profiled.\n")
+        profiler = None
+    profiled_steps = report_requisites_sr.get('profiled_steps')
+    profiled_steps = {step.strip() for step in str(profiled_steps).split(',') if step.strip()} \
+                        if profiled_steps and not pd.isna(profiled_steps) else {'all'}
+
+    profiling_settings.update(
+        {'profiler': profiler, 'profiled_steps': profiled_steps,
+         'timing_sheet': parameter_on(report_requisites_sr, 'timing_sheet'),
+         'run_start': time.perf_counter(), 'run_datetime': datetime.now().strftime("%d%m%Y_%H%M%S"),
+         'log_folder': report_requisites_sr.get('today_report_folder'),
+         'customer_name': report_requisites_sr.get('customer_name')})
+
+
+def parameter_on(report_requisites_sr, parameter):
+    """Function returns True if parameter is defined in report_requisites_sr with yes value"""
+
+    value = report_requisites_sr.get(parameter)
+    return value is not None and not pd.isna(value) and str(value).strip().lower() in ON_VALUES
+
+
+def profile_step(step_type, details=None):
+    """Decorator to record wall time, cpu time, process memory high-water mark and row counts of the function call.
+    details is a function which returns step details (data names) from the function args.
+    Function is called directly if profiling is off"""
+
+    def dec(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            if not profiling_settings['enabled']:
+                return fn(*args, **kwargs)
+            step_details = details(*args, **kwargs) if details else None
+            parent_step = current_step()
+            step_stack.steps = current_steps() + [fn.__name__]
+            profiler = start_profiler(fn.__name__)
+            measurement = start_measurement()
+            status = 'fail'
+            result = None
+            try:
+                result = fn(*args, **kwargs)
+                status = 'ok'
+                return result
+            finally:
+                measurement = finish_measurement(measurement)
+                stop_profiler(profiler, fn.__name__, step_details)
+                step_stack.steps = step_stack.steps[:-1]
+                add_record(fn.__name__, step_type, measurement, status=status,
+                            details=step_details, parent_step=parent_step,
+                            input_rows=data_rows([*args, *kwargs.values()], nested=False),
+                            output_rows=data_rows([result]))
+        return inner
+    return dec
+
+
+def measure_call(fn, *args):
+    """Function to call fn with args and measure call (used in worker processes regardless of profiling).
+    Returns fn result and measurement"""
+
+    measurement = start_measurement()
+    result = fn(*args)
+    return result, finish_measurement(measurement)
+
+
+def add_switch_record(switch, measurement, output_rows):
+    """Function to add extraction record of the switch configuration to the records of the current step"""
+
+    if profiling_settings['enabled']:
+        add_record(current_step(), 'switch', measurement, switch=switch, output_rows=output_rows)
+
+
+def add_counter_record(step, details, input_rows, output_rows):
+    """Function to add counter record (number of processed and resulting rows of the step details) 
+    to the records of the current step"""
+
+    if profiling_settings['enabled']:
+        measurement = {'start': time.perf_counter(), 'wall_s': 0, 'cpu_s': 0, 'process_max_rss_mb': None}
+        add_record(step, 'counter', measurement, details=details, parent_step=current_step(),
+                    input_rows=input_rows, output_rows=output_rows)
+
+
+def start_measurement():
+    """Function returns wall and cpu time counters of the current thread"""
+
+    return {'start': time.perf_counter(), 'cpu_start': time.thread_time()}
+
+
+def finish_measurement(measurement):
+    """Function returns step start, wall time, cpu time and process memory high-water mark at the end of the measurement"""
+
+    return {'start': measurement['start'],
+            'wall_s': time.perf_counter() - measurement['start'],
+            'cpu_s': time.thread_time() - measurement['cpu_start'],
+            'process_max_rss_mb': process_max_rss_mb()}
+
+
+def add_record(step, step_type, measurement, status='ok', details=None, switch=None,
+                parent_step=None, input_rows=0, output_rows=0):
+    """Function to add step record"""
+
+    record = {'step': step, 'step_type': step_type, 'details': details, 'switch': switch,
+                'parent_step': parent_step, 'thread': threading.current_thread().name, 'status': status,
+                'start_s': round(measurement['start'] - profiling_settings['run_start'], 3),
+                'wall_s': round(measurement['wall_s'], 4), 'cpu_s': round(measurement['cpu_s'], 4),
+                'process_max_rss_mb': measurement['process_max_rss_mb'],
+                'input_rows': input_rows, 'output_rows': output_rows}
+    with profiling_lock:
+        profiling_records.append(record)
+
+
+def current_steps():
+    """Function returns steps currently executed by the thread"""
+
+    return getattr(step_stack, 'steps', [])
+
+
+def current_step():
+    """Function returns innermost step currently executed by the thread"""
+
+    steps = current_steps()
+    return steps[-1] if steps else None
+
+
+def process_max_rss_mb():
+    """Function returns maximum resident memory of the process since its start in MB (None if it can't be measured).
+    Value is the process high-water mark (it never decreases) not the peak memory of the step"""
+
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on other systems
+        return round(peak_rss / 1024**2 if sys.platform == 'darwin' else peak_rss / 1024, 1)
+    if psutil is not None:
+        memory_info = psutil.Process().memory_info()
+        # peak working set is available on Windows
+        return round(getattr(memory_info, 'peak_wset', memory_info.rss) / 1024**2, 1)
+
+
+def data_rows(values, nested=True):
+    """Function returns total number of rows of DataFrames and Series in values
+    (and in lists and tuples of values if nested)"""
+
+    rows = 0
+    for value in values:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            rows += len(value.index)
+        elif nested and isinstance(value, (list, tuple)):
+            rows += sum(len(item.index) for item in value if isinstance(item, (pd.DataFrame, pd.Series)))
+    return rows
+
+
+def start_profiler(step):
+    """Function starts profiler for the step if step profiling is requested.
+    Nested steps are profiled as part of the outer step (single profiler per thread)"""
+
+    profiler_name = profiling_settings['profiler']
+    profiled_steps = profiling_settings['profiled_steps']
+    if profiler_name is None or getattr(step_stack, 'profiler', None) is not None \
+        or not ('all' in profiled_steps or step in profiled_steps):
+        return None
+    if profiler_name == 'pyinstrument':
+        profiler = pyinstrument.Profiler()
+        profiler.start()
+    else:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # other profiler is active (step executed in parallel thread)
+            return None
+    step_stack.profiler = profiler
+    return profiler
+
+
+def stop_profiler(profiler, step, step_details):
+    """Function stops step profiler and saves profile to the profiles folder of the run log"""
+
+    if profiler is None:
+        return
+    step_stack.profiler = None
+    profile_name = step + ('_' + step_details.replace(', ', '_') if step_details else '')
+    profile_folder = run_log_filepath('profiles')
+    if profile_folder is None:
+        return
+    try:
+        os.makedirs(profile_folder, exist_ok=True)
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            profiler.dump_stats(os.path.join(profile_folder, profile_name[:100] + '.prof'))
+        else:
+            profiler.stop()
+            with open(os.path.join(profile_folder, profile_name[:100] + '.html'), 'w', encoding='utf-8') as file:
+                file.write(profiler.output_html())
+    except OSError:
+        print(f"\nWARNING. Can't save {profile_name} profile\n")
+
+
+def run_log_filepath(extension):
+    """Function returns path to the run log file with extension (or folder if extension is 'profiles')"""
+
+    if not profiling_settings.get('log_folder'):
+        return None
+    run_log_name = f"{profiling_settings['customer_name']}_run_log_{profiling_settings['run_datetime']}"
+    if extension == 'profiles':
+        return os.path.join(profiling_settings['log_folder'], run_log_name + '_profiles')
+    return os.path.join(profiling_settings['log_folder'], run_log_name + '.' + extension)
+
+
+def save_run_log(max_title):
+    """Function to save step records to the run log json and csv files (and Timing sheet if requested)"""
+
+    if not profiling_settings['enabled'] or run_log_filepath('json') is None:
+        return
+
+    run_log_df = pd.DataFrame(profiling_records, columns=RUN_LOG_COLUMNS)
+    info = f"Saving {os.path.basename(run_log_filepath('json'))} run log"
+    print(info, end =" ")
+    try:
+        os.makedirs(profiling_settings['log_folder'], exist_ok=True)
+        with open(run_log_filepath('json'), 'w', encoding='utf-8') as file:
+            json.dump({'run_datetime': profiling_settings['run_datetime'],
+                        'wall_s': round(time.perf_counter() - profiling_settings['run_start'], 3),
+                        'steps': profiling_records}, file, indent=1, ensure_ascii=False, default=str)
+        run_log_df.to_csv(run_log_filepath('csv'), index=False)
+        if profiling_settings['timing_sheet']:
+            run_log_df.to_excel(run_log_filepath('xlsx'), sheet_name='Timing', index=False)
+    except OSError:
+        status_info('fail', max_title, len(info))
+    else:
+        status_info('ok', max_title, len(info))